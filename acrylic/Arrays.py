@@ -0,0 +1,749 @@
+import numpy as np
+
+from acrylic.Defaults import RANDOM, SCHEMAS, COLOR_NAMES
+from acrylic.Validators import (
+    validate_string, in_range, check_datatype, check_iter
+)
+from acrylic.color_names import color_names, color_names_reverse
+from acrylic.Converters import (
+    SRGB_TO_XYZ, XYZ_TO_SRGB, WHITE_D65, LINEAR_TO_LMS, LMS_TO_OKLAB,
+    OKLAB_TO_LMS, LMS_TO_LINEAR, DELTA, XYZ_SCALE, path
+)
+
+
+# same constants as `colorsys`, so results match the scalar converters
+ONE_THIRD = 1.0 / 3.0
+ONE_SIXTH = 1.0 / 6.0
+TWO_THIRD = 2.0 / 3.0
+
+HEX_DIGITS = np.array([ord(x) for x in '0123456789ABCDEF'], dtype=np.uint32)
+
+HEX_VALUES = np.zeros(128, dtype=np.uint8)
+HEX_VALUES[[ord(x) for x in '0123456789']] = range(10)
+HEX_VALUES[[ord(x) for x in 'ABCDEF']] = range(10, 16)
+HEX_VALUES[[ord(x) for x in 'abcdef']] = range(10, 16)
+
+IS_HEX = np.zeros(128, dtype=bool)
+IS_HEX[[ord(x) for x in '0123456789ABCDEFabcdef']] = True
+
+IS_SPACE = np.zeros(256, dtype=bool)
+IS_SPACE[[ord(x) for x in ' \t\n\r\v\f']] = True
+
+# longest hex string accepted, '#0x' and 8 digits
+HEX_WIDTH = 11
+
+NAME_KEYS = np.array(
+    [(r << 16) | (g << 8) | b for r, g, b in color_names_reverse],
+    dtype=np.int64
+)
+NAME_ORDER = np.argsort(NAME_KEYS)
+NAME_KEYS = NAME_KEYS[NAME_ORDER]
+NAME_VALUES = np.array(list(color_names_reverse.values()) + ['-'])
+NAME_VALUES = NAME_VALUES[np.append(NAME_ORDER, len(NAME_ORDER))]
+
+
+def columns(values, colorspace):
+    # split an (N, 3) array into components normalized to 0.0 - 1.0
+    schema_format = SCHEMAS[colorspace].format
+    return [values[:, i] / m[1] for i, m in enumerate(schema_format)]
+
+
+def stack(values, colorspace):
+    # scale 0.0 - 1.0 components back to the schema's range and round them
+    # the same way the scalar converters do
+    schema = SCHEMAS[colorspace]
+    values = [x * m[1] for x, m in zip(values, schema.format)]
+    if schema.input_type == int:
+        return np.rint(np.stack(values, axis=1)).astype(np.uint8)
+    return round_array(np.stack(values, axis=1), schema.precision)
+
+
+def round_array(values, precision):
+    '''
+    Vectorized equivalent of `round(x, precision)`
+
+    `np.rint` works on the scaled product, which can land on the other side
+    of a tie than python's correctly rounded `round()`. Those few values are
+    rounded again in python so results are identical to the scalar path.
+    '''
+    scale = 10 ** precision
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+
+    ties = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if ties.any():
+        rounded[ties] = [round(x, precision) for x in values[ties].tolist()]
+    return rounded
+
+
+def output(values, colorspace):
+    # round values the same way for every perceptual colorspace
+    return round_array(np.stack(values, axis=1), SCHEMAS[colorspace].precision)
+
+
+def hue(r, g, b, maxc, rangec):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rc, gc, bc = [(maxc - x) / rangec for x in (r, g, b)]
+
+    h = np.where(
+        r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc)
+    )
+    return np.where(rangec == 0, 0.0, (h / 6.0) % 1.0)
+
+
+def hue_to_rgb(m1, m2, h):
+    h = h % 1.0
+    return np.select(
+        [h < ONE_SIXTH, h < 0.5, h < TWO_THIRD],
+        [m1 + (m2 - m1) * h * 6.0, m2, m1 + (m2 - m1) * (TWO_THIRD - h) * 6.0],
+        m1
+    )
+
+
+# same steps as the helpers in `acrylic.Converters`, but on columns of values
+
+
+def transform(matrix, values):
+    return [row[0] * values[0] + row[1] * values[1] + row[2] * values[2]
+            for row in matrix]
+
+
+def rgb_to_linear(rgb):
+    return [
+        np.where(x <= 0.04045, x / 12.92, ((x + 0.055) / 1.055) ** 2.4)
+        for x in columns(rgb, 'rgb')
+    ]
+
+
+def linear_to_rgb(linear):
+    linear = [np.minimum(np.maximum(x, 0.0), 1.0) for x in linear]
+    rgb = [
+        np.where(x <= 0.0031308, x * 12.92, 1.055 * x ** (1 / 2.4) - 0.055)
+        for x in linear
+    ]
+    return stack(rgb, 'rgb')
+
+
+def xyz_to_lab_values(xyz):
+    f = [x / w for x, w in zip(xyz, WHITE_D65)]
+    with np.errstate(invalid='ignore'):
+        f = [
+            np.where(
+                x > DELTA ** 3, x ** (1 / 3), x / (3 * DELTA ** 2) + 4 / 29
+            )
+            for x in f
+        ]
+    return [116 * f[1] - 16, 500 * (f[0] - f[1]), 200 * (f[1] - f[2])]
+
+
+def lab_values_to_xyz(lab):
+    fy = (lab[0] + 16) / 116
+    f = [fy + lab[1] / 500, fy, fy - lab[2] / 200]
+    f = [np.where(x > DELTA, x ** 3, 3 * DELTA ** 2 * (x - 4 / 29)) for x in f]
+    return [x * w for x, w in zip(f, WHITE_D65)]
+
+
+def lab_values_to_lch(lab):
+    c = np.sqrt(lab[1] * lab[1] + lab[2] * lab[2])
+    h = np.degrees(np.arctan2(lab[2], lab[1])) % SCHEMAS['lch'].format.h[1]
+    return [lab[0], c, h]
+
+
+def lch_values_to_lab(lch):
+    h = np.radians(lch[2])
+    return [lch[0], lch[1] * np.cos(h), lch[1] * np.sin(h)]
+
+
+def linear_to_oklab_values(linear):
+    lms = [x ** (1 / 3) for x in transform(LINEAR_TO_LMS, linear)]
+    return transform(LMS_TO_OKLAB, lms)
+
+
+def oklab_values_to_linear(oklab):
+    lms = [x ** 3 for x in transform(OKLAB_TO_LMS, oklab)]
+    return transform(LMS_TO_LINEAR, lms)
+
+
+def lab_values(rgb):
+    # unrounded lab values of rgb colors as an (N, 3) array
+    xyz = transform(SRGB_TO_XYZ, rgb_to_linear(np.asarray(rgb)))
+    return np.stack(xyz_to_lab_values(xyz), axis=-1)
+
+
+# - - - - - - - - - - - - - -
+
+
+def rgb_to_hsl(rgb):
+    r, g, b = columns(rgb, 'rgb')
+
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    sumc, rangec = maxc + minc, maxc - minc
+    l = sumc / 2.0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+    s = np.where(rangec == 0, 0.0, s)
+    h = hue(r, g, b, maxc, rangec)
+
+    return stack([h, s, l], 'hsl')
+
+
+def rgb_to_hsv(rgb):
+    r, g, b = columns(rgb, 'rgb')
+
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    rangec = maxc - minc
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(rangec == 0, 0.0, rangec / maxc)
+    h = hue(r, g, b, maxc, rangec)
+
+    return stack([h, s, maxc], 'hsv')
+
+
+def rgb_to_hex(rgb):
+    rgb = np.asarray(rgb, dtype=np.uint8)
+    codes = np.empty((len(rgb), 7), dtype=np.uint32)
+    codes[:, 0] = ord('#')
+    codes[:, 1::2] = HEX_DIGITS[rgb >> 4]
+    codes[:, 2::2] = HEX_DIGITS[rgb & 15]
+    return codes.view('U7').ravel()
+
+
+def rgb_to_name(rgb):
+    keys = pack(rgb)
+    index = np.searchsorted(NAME_KEYS, keys)
+    found = NAME_KEYS[np.minimum(index, len(NAME_KEYS) - 1)] == keys
+    return NAME_VALUES[np.where(found, index, len(NAME_KEYS))]
+
+
+def rgb_to_ryb(rgb):
+    # Source:
+    # https://www.jstage.jst.go.jp/article/tievciieej/5/2/5_110/_pdf/-char/en
+
+    rgb_r, rgb_g, rgb_b = columns(rgb, 'rgb')
+
+    white = np.minimum(np.minimum(rgb_r, rgb_g), rgb_b)
+    black = np.minimum(np.minimum(1 - rgb_r, 1 - rgb_g), 1 - rgb_b)
+    rgb_r, rgb_g, rgb_b = [x - white for x in (rgb_r, rgb_g, rgb_b)]
+
+    yellow = np.minimum(rgb_r, rgb_g)
+    ryb_r = rgb_r - yellow
+    ryb_y = (yellow + rgb_g) / 2
+    ryb_b = (rgb_b + rgb_g - yellow) / 2
+
+    rgb_max = np.maximum(np.maximum(rgb_r, rgb_g), rgb_b)
+    ryb_max = np.maximum(np.maximum(ryb_r, ryb_y), ryb_b)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        norm = np.where(rgb_max != 0, ryb_max / rgb_max, 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ryb = [np.where(norm > 0, x / norm, x) for x in (ryb_r, ryb_y, ryb_b)]
+    ryb = [x + black for x in ryb]
+
+    return stack(ryb, 'ryb')
+
+
+def rgb_to_xyz(rgb):
+    xyz = transform(SRGB_TO_XYZ, rgb_to_linear(rgb))
+    return output([x * XYZ_SCALE for x in xyz], 'xyz')
+
+
+def rgb_to_lab(rgb):
+    xyz = transform(SRGB_TO_XYZ, rgb_to_linear(rgb))
+    return output(xyz_to_lab_values(xyz), 'lab')
+
+
+def rgb_to_lch(rgb):
+    xyz = transform(SRGB_TO_XYZ, rgb_to_linear(rgb))
+    return output(lab_values_to_lch(xyz_to_lab_values(xyz)), 'lch')
+
+
+def rgb_to_oklab(rgb):
+    return output(linear_to_oklab_values(rgb_to_linear(rgb)), 'oklab')
+
+
+# - - - - - - - - - - - - - -
+
+
+def hsl_to_rgb(hsl):
+    h, s, l = columns(hsl, 'hsl')
+
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+    rgb = [
+        np.where(s == 0.0, l, hue_to_rgb(m1, m2, x))
+        for x in (h + ONE_THIRD, h, h - ONE_THIRD)
+    ]
+
+    return stack(rgb, 'rgb')
+
+
+def hsv_to_rgb(hsv):
+    h, s, v = columns(hsv, 'hsv')
+
+    i = (h * 6.0).astype(np.int64)
+    f = (h * 6.0) - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+
+    i = i % 6
+    rgb = [
+        np.where(s == 0.0, v, np.choose(i, x, mode='clip'))
+        for x in [(v, q, p, p, t, v), (t, v, v, q, p, p), (p, p, t, v, v, q)]
+    ]
+
+    return stack(rgb, 'rgb')
+
+
+def hex_to_rgb(hex_str):
+    codes = np.ascontiguousarray(hex_str, dtype='U7').view(np.uint32)
+    nibbles = HEX_VALUES[codes.reshape(-1, 7)[:, 1:] & 127]
+    return (nibbles[:, 0::2] << 4) | nibbles[:, 1::2]
+
+
+def name_to_rgb(name):
+    uniques, inverse = np.unique(name, return_inverse=True)
+    rgb = [color_names.get(x, (0, 0, 0)) for x in uniques.tolist()]
+    return np.array(rgb, dtype=np.uint8).reshape(-1, 3)[inverse.ravel()]
+
+
+def ryb_to_rgb(ryb):
+    # Source:
+    # https://www.jstage.jst.go.jp/article/tievciieej/5/2/5_110/_pdf/-char/en
+
+    ryb_r, ryb_y, ryb_b = columns(ryb, 'ryb')
+
+    black = np.minimum(np.minimum(ryb_r, ryb_y), ryb_b)
+    white = np.minimum(np.minimum(1 - ryb_r, 1 - ryb_y), 1 - ryb_b)
+    ryb_r, ryb_y, ryb_b = [x - black for x in (ryb_r, ryb_y, ryb_b)]
+
+    green = np.minimum(ryb_y, ryb_b)
+    rgb_r = ryb_r + ryb_y - green
+    rgb_g = ryb_y + green
+    rgb_b = 2 * (ryb_b - green)
+
+    ryb_max = np.maximum(np.maximum(ryb_r, ryb_y), ryb_b)
+    rgb_max = np.maximum(np.maximum(rgb_r, rgb_g), rgb_b)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        norm = np.where(ryb_max != 0, rgb_max / ryb_max, 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rgb = [np.where(norm > 0, x / norm, x) for x in (rgb_r, rgb_g, rgb_b)]
+    rgb = [x + white for x in rgb]
+
+    return stack(rgb, 'rgb')
+
+
+def xyz_to_rgb(xyz):
+    xyz = [x / XYZ_SCALE for x in xyz.T]
+    return linear_to_rgb(transform(XYZ_TO_SRGB, xyz))
+
+
+def lab_to_rgb(lab):
+    return linear_to_rgb(transform(XYZ_TO_SRGB, lab_values_to_xyz(lab.T)))
+
+
+def lch_to_rgb(lch):
+    xyz = lab_values_to_xyz(lch_values_to_lab(lch.T))
+    return linear_to_rgb(transform(XYZ_TO_SRGB, xyz))
+
+
+def oklab_to_rgb(oklab):
+    return linear_to_rgb(oklab_values_to_linear(oklab.T))
+
+
+# - - - - - - - - - - - - - -
+
+
+def hsl_to_hsv(hsl):
+    h, s, l = columns(hsl, 'hsl')
+
+    v = l + s * np.minimum(l, 1 - l)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(v == 0, 0.0, 2 * (1 - l / v))
+
+    return stack([h, s, v], 'hsv')
+
+
+def hsv_to_hsl(hsv):
+    h, s, v = columns(hsv, 'hsv')
+
+    l = v * (1 - s / 2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = (v - l) / np.minimum(l, 1 - l)
+    s = np.where((l == 0) | (l == 1), 0.0, s)
+
+    return stack([h, s, l], 'hsl')
+
+
+def hex_to_name(hex_str):
+    return rgb_to_name(hex_to_rgb(hex_str))
+
+
+def name_to_hex(name):
+    return rgb_to_hex(name_to_rgb(name))
+
+
+# - - - - - - - - - - - - - -
+
+
+rgb_to = {
+    'hsl': rgb_to_hsl,
+    'hsv': rgb_to_hsv,
+    'hex': rgb_to_hex,
+    'name': rgb_to_name,
+    'ryb': rgb_to_ryb,
+    'xyz': rgb_to_xyz,
+    'lab': rgb_to_lab,
+    'lch': rgb_to_lch,
+    'oklab': rgb_to_oklab,
+}
+
+
+rgb_from = {
+    'hsl': hsl_to_rgb,
+    'hsv': hsv_to_rgb,
+    'hex': hex_to_rgb,
+    'name': name_to_rgb,
+    'ryb': ryb_to_rgb,
+    'xyz': xyz_to_rgb,
+    'lab': lab_to_rgb,
+    'lch': lch_to_rgb,
+    'oklab': oklab_to_rgb,
+}
+
+
+# same direct conversions as `acrylic.Converters.direct`
+direct = {
+    ('hsl', 'hsv'): hsl_to_hsv,
+    ('hsv', 'hsl'): hsv_to_hsl,
+    ('hex', 'name'): hex_to_name,
+    ('name', 'hex'): name_to_hex,
+}
+
+
+def converter(src, dst):
+    if src == 'rgb':
+        return rgb_to[dst]
+    if dst == 'rgb':
+        return rgb_from[src]
+    return direct[(src, dst)]
+
+
+# - - - - - - - - - - - - - -
+
+
+def pack(rgb):
+    '''
+    Packs an (N, 3) array-like of rgb values into an (N,) int64 array of
+    0xRRGGBB integers, the same values as `Color().to_int()`
+    '''
+    rgb = np.asarray(rgb, dtype=np.int64)
+    return (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+
+
+def unpack(keys):
+    '''
+    Unpacks an (N,) array-like of 0xRRGGBB integers into an (N, 3) uint8
+    array of rgb values
+
+    Raises:
+        ValueError: integers not within 0 - 0xFFFFFF
+    '''
+    keys = np.asarray(keys, dtype=np.int64).reshape(-1)
+    if keys.size and (keys.min() < 0 or keys.max() > 0xFFFFFF):
+        raise ValueError(f'{"value"!r} should be in range 0 - {0xFFFFFF}')
+    rgb = np.stack([keys >> 16, (keys >> 8) & 255, keys & 255], axis=1)
+    return rgb.astype(np.uint8)
+
+
+def hex_codes(values):
+    # (N, HEX_WIDTH + 1) uint8 array of character codes padded with 0, and
+    # (N,) lengths of the strings. Longer strings are cut short, but keep one
+    # character too many so that they are still rejected, and characters
+    # that are not ascii become 127, which is not a hex digit either.
+    width = HEX_WIDTH + 1
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        # split the buffer on whitespace without creating a str for each
+        data = np.frombuffer(values, dtype=np.uint8)
+        word = np.zeros(len(data) + 2, dtype=np.int8)
+        word[1:-1] = ~IS_SPACE[data]
+        edges = np.diff(word)
+        starts = np.flatnonzero(edges == 1)
+        lengths = np.flatnonzero(edges == -1) - starts
+        index = starts[:, None] + np.arange(width)
+        codes = data[np.minimum(index, max(len(data) - 1, 0))]
+        codes[np.arange(width) >= lengths[:, None]] = 0
+        return np.minimum(codes, 127), lengths
+
+    values = np.asarray(values).reshape(-1)
+    if values.dtype.kind == 'S':
+        values = np.ascontiguousarray(values, dtype=f'S{width}')
+        codes = values.view(np.uint8).reshape(-1, width)
+    else:
+        values = np.ascontiguousarray(values, dtype=f'U{width}')
+        codes = values.view(np.uint32).reshape(-1, width)
+    codes = np.minimum(codes, 127).astype(np.uint8)
+    return codes, np.char.str_len(values)
+
+
+def parse_hex(values):
+    '''
+    Parses many hex strings at once without raising for invalid ones. The
+    same forms as `Color(hex=...)` are accepted: 3, 6 or 8 hex digits
+    (alpha is ignored), optionally starting with '#', '0x' or both.
+
+    Args:
+        values:
+            (N,) list or numpy array of str or bytes, or a bytes-like
+            buffer with values separated by whitespace, like the lines of a
+            file
+
+    Returns:
+        tuple of (N,) int64 array of packed 0xRRGGBB integers, 0 for
+        invalid values, and (N,) bool array that is True for valid values
+
+    Examples:
+        >>> keys, valid = parse_hex(b'#80ffd4\\nf00\\nnope\\n0x7fffd4ff\\n')
+        >>> keys
+        array([ 8454100, 16711680,        0,  8388564])
+        >>> valid
+        array([ True,  True, False,  True])
+        >>> colors = ColorArray.from_ints(keys[valid])
+    '''
+    codes, lengths = hex_codes(values)
+
+    start = (codes[:, 0] == ord('#')).astype(np.int64)
+    prefix = np.where(start, codes[:, 1], codes[:, 0]) == ord('0')
+    prefix &= np.where(start, codes[:, 2], codes[:, 1]) == ord('x')
+    start += 2 * prefix
+    digits = lengths - start
+
+    # every character between the prefix and the end is a hex digit when
+    # the only other one is the '0' of '0x', the rest are '#', 'x' and 0
+    count = np.count_nonzero(IS_HEX[codes], axis=1)
+    valid = count == digits + prefix
+    valid &= (digits == 3) | (digits == 6) | (digits == 8)
+
+    # the first 6 digits of every value, there are at most 4 prefix lengths
+    nibbles = HEX_VALUES[codes]
+    offsets = np.unique(start).tolist()
+    if len(offsets) == 1:
+        aligned = nibbles[:, offsets[0]:offsets[0] + 6]
+    else:
+        aligned = np.empty((len(codes), 6), dtype=np.uint8)
+        for offset in offsets:
+            rows = start == offset
+            aligned[rows] = nibbles[rows, offset:offset + 6]
+
+    rgb = np.where(
+        (digits == 3)[:, None],
+        aligned[:, :3] * 17,
+        (aligned[:, 0::2] << 4) | aligned[:, 1::2],
+    )
+    return np.where(valid, pack(rgb), 0), valid
+
+
+def validate(values, colorspace):
+    schema = SCHEMAS[colorspace]
+
+    if colorspace == 'hex':
+        values = np.asarray(values, dtype=str).ravel()
+        keys, valid = parse_hex(values)
+        # the scalar validator raises for values that are invalid
+        for i in np.flatnonzero(~valid):
+            keys[i] = int(validate_string(values[i], colorspace)[1:], 16)
+        return rgb_to_hex(unpack(keys))
+
+    if schema.validation_type == 'string':
+        # validate each distinct string once with the scalar validator
+        values = np.asarray(values, dtype=str).ravel()
+        uniques, inverse = np.unique(values, return_inverse=True)
+        validated = [validate_string(x, colorspace) for x in uniques.tolist()]
+        return np.array(validated, dtype=str)[inverse.ravel()]
+
+    values = np.asarray(values)
+    if values.ndim != 2 or values.shape[1] != schema.length:
+        msg = f'{colorspace!r} should be an array of shape '
+        msg += f'(N, {schema.length})'
+        raise ValueError(msg)
+
+    if schema.input_type == int:
+        values = values.astype(np.int64)
+    else:
+        values = values.astype(np.float64)
+
+    for i, ((a, b), p) in enumerate(zip(schema.format, schema.names)):
+        if ((values[:, i] < a) | (values[:, i] > b)).any():
+            raise ValueError(f'{p!r} should be in range {a} - {b}')
+
+    if schema.input_type == int:
+        return values.astype(np.uint8)
+    return round_array(values, schema.precision)
+
+
+def sample_component(x, limits, name, colorspace, count, rng):
+    # vectorized version of validating one component in `validate_values`
+    schema = SCHEMAS[colorspace]
+    datatype = schema.input_type
+    a, b = limits
+    randomizable = not a <= RANDOM <= b
+
+    def pick(low, high):
+        if datatype == int:
+            return rng.integers(low, high, size=count, endpoint=True)
+        return round_array(rng.uniform(low, high, count), schema.precision)
+
+    if randomizable and x == RANDOM:
+        return pick(a, b)
+
+    try:
+        value = check_datatype(datatype, x, name)
+    except TypeError as err:
+        try:
+            limits = check_iter(x, 2, name)
+        except TypeError:
+            raise err
+        except ValueError:
+            msg = f'{name!r} when given as a range needs 2 values'
+            raise ValueError(msg) from None
+    else:
+        value = in_range(value, a, b, name)
+        if datatype == float:
+            value = round(value, schema.precision)
+        return np.full(count, value)
+
+    limits = [check_datatype(datatype, x, 'r') for x in limits]
+
+    if randomizable and limits == [-1, -1]:
+        return pick(a, b)
+
+    low, high = [
+        x if randomizable and x == RANDOM else in_range(x, a, b, name)
+        for x in limits
+    ]
+    if randomizable and low == RANDOM:
+        low = pick(a, high)
+    if randomizable and high == RANDOM:
+        high = pick(low, b)
+    return pick(np.minimum(low, high), np.maximum(low, high))
+
+
+def sample(values, colorspace, count, rng=None):
+    '''
+    Picks `count` colors at once from a description that can contain
+    `RANDOM` and ranges, like the values given to `Color()`
+
+    Every color is picked independently, with the same rules and rounding
+    as `Color()`, but random values come from a numpy random generator.
+
+    Examples:
+        >>> from acrylic import RANDOM
+        >>> from acrylic.Arrays import sample
+        >>> sample([RANDOM, (20, 70), 62], 'hsl', 3, rng=42)
+        array([[278.62,  54.87,  62.  ],
+               [158.  ,  24.71,  62.  ],
+               [309.1 ,  68.78,  62.  ]])
+
+    Args:
+        values:
+            value of a color in `colorspace`, as for `Color()`
+        colorspace(str):
+            colorspace of the values
+        count(int):
+            number of colors
+        rng(optional):
+            `numpy.random.Generator` or a seed for one
+            Default: None, a new unseeded generator
+
+    Returns:
+        numpy.ndarray, same format as `acrylic.Arrays.convert()`
+
+    Raises:
+        TypeError: if datatypes dont match
+        ValueError: invalid colorspace or values not within valid ranges
+    '''
+    if colorspace not in SCHEMAS:
+        raise ValueError(f'{colorspace!r} is not a valid colorspace')
+    schema = SCHEMAS[colorspace]
+    rng = np.random.default_rng(rng)
+
+    if schema.validation_type == 'string':
+        if not (isinstance(values, int) and values == RANDOM):
+            return np.full(count, validate_string(values, colorspace))
+        if colorspace == 'name':
+            names = np.array(COLOR_NAMES)
+            return names[rng.integers(0, len(names), count)]
+        keys = rng.integers(0, 1 << 24, count)
+        rgb = np.stack([keys >> 16, (keys >> 8) & 255, keys & 255], axis=1)
+        return rgb_to_hex(rgb)
+
+    # like `Color()`, every component of a RANDOM value is picked from its
+    # whole range, also components that can be -1 (like a and b of lab)
+    if values == RANDOM:
+        values = list(schema.format)
+    values = check_iter(values, schema.length, colorspace)
+
+    columns = [
+        sample_component(x, limits, name, colorspace, count, rng)
+        for x, limits, name in zip(values, schema.format, schema.names)
+    ]
+    values = np.stack(columns, axis=1)
+    if schema.input_type == int:
+        return values.astype(np.uint8)
+    return values.astype(np.float64)
+
+
+def convert(values, src='rgb', dst='hsl'):
+    '''
+    Converts a batch of colors from one colorspace to another
+
+    Values are validated and rounded with the same rules as `Color()`, and
+    results are identical to converting each color one at a time.
+
+    Examples:
+        >>> from acrylic.Arrays import convert
+        >>> convert([[83, 237, 229], [255, 0, 0]], src='rgb', dst='hsl')
+        array([[176.88,  81.05,  62.75],
+               [  0.  , 100.  ,  50.  ]])
+        >>> convert(['#80ffd4', '#ff0000'], src='hex', dst='rgb')
+        array([[128, 255, 212],
+               [255,   0,   0]], dtype=uint8)
+
+    Args:
+        values:
+            (N, 3) array-like for rgb, hsl, hsv, ryb, xyz, lab, lch, oklab
+            (N,) array-like of strings for hex, name
+        src(str, optional):
+            colorspace of the given values
+            Default: 'rgb'
+        dst(str, optional):
+            colorspace to convert to
+            Default: 'hsl'
+
+    Returns:
+        numpy.ndarray of shape (N, 3) for rgb, hsl, hsv, ryb, xyz, lab, lch,
+        oklab (uint8 for rgb and ryb, float64 for the others), or of shape
+        (N,) containing strings for hex and name
+
+    Raises:
+        ValueError: invalid colorspace, shape or values not within valid
+                    ranges
+    '''
+    for colorspace in (src, dst):
+        if colorspace not in SCHEMAS:
+            raise ValueError(f'{colorspace!r} is not a valid colorspace')
+
+    return convert_valid(validate(values, src), src, dst)
+
+
+def convert_valid(values, src, dst):
+    # converts already validated values along the same path as `Color`
+    steps = path(src, dst)
+    for a, b in zip(steps, steps[1:]):
+        values = converter(a, b)(values)
+    return values
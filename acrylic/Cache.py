@@ -0,0 +1,177 @@
+'''
+Opt-in memoization of conversions and validation
+
+When enabled, every function in the `rgb_to`, `rgb_from` and `direct`
+tables of `acrylic.Converters` and the string validator used for hex and
+name values get their own bounded, thread-safe cache.
+
+Examples:
+    >>> from acrylic import Cache, Color
+    >>> Cache.enable(maxsize=4096, policy='lru')
+    >>> Color(hex='#80ffd4').hsl
+    Hsl(h=159.69, s=100.0, l=75.1)
+    >>> Cache.info()['rgb_to.hsl']
+    CacheInfo(hits=0, misses=1, evictions=0, size=1, maxsize=4096)
+    >>> Cache.disable()
+'''
+import threading
+from collections import OrderedDict, namedtuple
+
+from acrylic.Defaults import RANDOM
+from acrylic.Validators import validators
+from acrylic.Converters import rgb_to, rgb_from, direct, unwrap
+
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions size maxsize')
+
+POLICIES = ('lru', 'fifo')
+
+
+class BoundedCache():
+    '''
+    Thread-safe cache that holds at most `maxsize` values
+
+    Eviction policies:
+        'lru': evict the value that was least recently used
+        'fifo': evict the value that was added first
+    '''
+
+    def __init__(self, maxsize=1024, policy='lru'):
+        if policy not in POLICIES:
+            raise ValueError(f'{policy!r} is not a valid eviction policy')
+        if maxsize < 1:
+            raise ValueError(f'{"maxsize"!r} should be at least 1')
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = self.misses = self.evictions = 0
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        # raises KeyError if `key` is not in the cache
+        with self._lock:
+            try:
+                value = self._values[key]
+            except KeyError:
+                self.misses += 1
+                raise
+            if self.policy == 'lru':
+                self._values.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._values[key] = value
+            if len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions,
+                len(self._values), self.maxsize,
+            )
+
+
+def cached(function, cache, skip=None):
+    # wraps `function` to look up its arguments in `cache` first
+    # arguments that are unhashable or for which `skip` returns True are
+    # always passed through to `function`
+    def wrapper(*args):
+        # looked up on every call, see `acrylic.Converters.unwrap()`
+        function = wrapper.__wrapped__
+        try:
+            if skip is None or not skip(*args):
+                return cache.get(args)
+        except (KeyError, TypeError):
+            pass
+        else:
+            return function(*args)
+
+        value = function(*args)
+        try:
+            cache.put(args, value)
+        except TypeError:
+            pass
+        return value
+
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = function.__name__
+    wrapper.cache = cache
+    return wrapper
+
+
+def targets():
+    # (name, dispatch table, key) of every cacheable function
+    for key in rgb_to:
+        yield f'rgb_to.{key}', rgb_to, key
+    for key in rgb_from:
+        yield f'rgb_from.{key}', rgb_from, key
+    for src, dst in direct:
+        yield f'direct.{src}_to_{dst}', direct, (src, dst)
+    yield 'validate_string', validators, 'string'
+
+
+def is_random(value, colorspace, rng=None, precise=False):
+    # random values should be picked again on every call
+    return value == RANDOM
+
+
+caches = dict()
+# the function that wraps each cached function
+wrappers = dict()
+
+
+def enable(maxsize=1024, policy='lru'):
+    '''
+    Enable caching, each function gets its own cache of `maxsize` values
+
+    Args:
+        maxsize(int, optional):
+            maximum number of values to store for each function
+            Default: 1024
+        policy(str, optional):
+            'lru' or 'fifo', which value to evict when a cache is full
+            Default: 'lru'
+    '''
+    disable()
+    for name, table, key in targets():
+        caches[name] = BoundedCache(maxsize, policy)
+        skip = is_random if table is validators else None
+        wrappers[name] = cached(table[key], caches[name], skip)
+        table[key] = wrappers[name]
+
+
+def disable():
+    '''
+    Disable caching and drop all cached values
+    '''
+    for name, table, key in targets():
+        if name in caches:
+            unwrap(table, key, wrappers[name])
+    caches.clear()
+    wrappers.clear()
+
+
+def clear():
+    '''
+    Drop all cached values and reset counters, caching stays enabled
+    '''
+    for cache in caches.values():
+        cache.clear()
+
+
+def info():
+    '''
+    Returns a dict of `CacheInfo(hits, misses, evictions, size, maxsize)`
+    for each cached function, empty when caching is disabled
+    '''
+    return {name: cache.info() for name, cache in caches.items()}
@@ -1,34 +1,62 @@
+import random
+import weakref
+
 from acrylic.Schemes import scheme
-from acrylic.Defaults import SCHEMAS
-from acrylic.Validators import validate
-from acrylic.Converters import rgb_to, rgb_from
+from acrylic.Manipulations import (
+    lighten, darken, saturate, desaturate, rotate_hue, mix, blend
+)
+from acrylic.Defaults import SCHEMAS, ALPHA, ALPHA_SCHEMAS
+from acrylic.Validators import (
+    validate, validate_values, in_range, check_datatype, hex_alpha
+)
+from acrylic.Converters import (
+    path, converter, rounded_rgb, rgb_to_int, int_to_rgb
+)
 
 
 class ColorMeta(type):
     def __new__(cls, clsname, bases, attrs):
 
+        # add private slots for each colorspace property (Color._rgb), for
+        # the packed rgb value (Color.to_int()), the alpha and the default
+        # colorspace, instances don't need a __dict__
+        # subclasses reuse the slots that were created for Color
+        if not any(hasattr(base, '_slots') for base in bases):
+            slots = tuple(f'_{colorspace}' for colorspace in SCHEMAS)
+            slots += ('_int',)
+            attrs['__slots__'] = slots + ('_alpha', '_default', '__weakref__')
+            attrs['_slots'] = slots
+
+        # registry of interned colors for this class, see Color.intern()
+        attrs['_interned'] = weakref.WeakValueDictionary()
+
+        new_cls = super(ColorMeta, cls).__new__(cls, clsname, bases, attrs)
+        precise = new_cls.precise
+
         # generates readonly, lazy evaluation properties
         def property_factory(attr):
 
+            # use the slot's descriptor directly instead of looking up
+            # the private attribute by name on every access
+            slot = getattr(new_cls, f'_{attr}')
+            get_slot, set_slot = slot.__get__, slot.__set__
+
             def getter(instance):
-                value = getattr(instance, f'_{attr}')
+                value = get_slot(instance)
 
-                if value:
+                if value is not None:
                     # value for `attr` is already present, send cached value
                     return value
 
-                if value is None and attr == 'rgb':
-                    # rgb for this color has not been calculated yet
-                    # convert color's default to rgb and cache
-                    default = getattr(instance, instance._default)
-                    converted = rgb_from[instance._default](default)
-                    instance._rgb = converted
-                    return converted
-
                 # `attr` for this color has not been calculated yet
-                # convert to `attr` from rgb and cache
-                converted = rgb_to[attr](instance.rgb)
-                setattr(instance, f'_{attr}', converted)
+                # convert from the previous format on the shortest path from
+                # color's default, which is also calculated and cached this
+                # way if needed, and cache
+                previous = path(instance._default, attr)[-2]
+                converted = converter(previous, attr, precise)(
+                    getattr(instance, previous)
+                )
+                set_slot(instance, converted)
                 return converted
 
             def setter(instance, *args, **kwargs):
@@ -37,31 +65,81 @@ class ColorMeta(type):
             doc = f'(readonly) return {attr} component of the color'
             return property(getter, setter, doc=doc)
 
+        # generates properties for colorspaces with alpha, from the
+        # colorspace they extend (Color.rgba from Color.rgb)
+        def alpha_property_factory(attr):
+            output_type = ALPHA_SCHEMAS[attr].output_type
+            colorspace = attr[:-1]
+
+            def getter(instance):
+                value = getattr(instance, colorspace)
+                return output_type(*value, instance._alpha)
+
+            def setter(instance, *args, **kwargs):
+                raise AttributeError(f'{attr!r} is a readonly attribute')
+
+            doc = f'(readonly) return {attr} component of the color'
+            return property(getter, setter, doc=doc)
+
+        # generates constructors that skip validation
+        # (Color.from_rgb_unchecked)
+        def constructor_factory(colorspace):
+            schema = SCHEMAS[colorspace]
+
+            if schema.validation_type == 'values':
+                def constructor(cls, *values):
+                    return cls._from_trusted(
+                        colorspace, schema.output_type(*values)
+                    )
+                args = ', '.join(schema.output_type._fields)
+            else:
+                def constructor(cls, value):
+                    return cls._from_trusted(colorspace, value)
+                args = 'value'
+
+            constructor.__name__ = f'from_{colorspace}_unchecked'
+            constructor.__doc__ = f'''
+            Create an instance of `Color` from {colorspace}({args}) without
+            validating the values. Only use this for values that are known to
+            be valid, like values from other colors. Values for hex should be
+            in the same format as `Color().hex`
+            '''
+            return classmethod(constructor)
+
         for colorspace in SCHEMAS:
             # add properties for each colorspace using factory (Color.rgb)
-            attrs[colorspace] = property_factory(colorspace)
+            setattr(new_cls, colorspace, property_factory(colorspace))
+
+            # add unchecked constructors for each colorspace
+            name = f'from_{colorspace}_unchecked'
+            setattr(new_cls, name, constructor_factory(colorspace))
 
-            # add private attributes for each colorspace property (Color._rgb)
-            attrs[f'_{colorspace}'] = None
+        for colorspace in ALPHA_SCHEMAS:
+            # add properties with alpha (Color.rgba)
+            setattr(new_cls, colorspace, alpha_property_factory(colorspace))
 
-        return super(ColorMeta, cls).__new__(cls, clsname, bases, attrs)
+        return new_cls
 
 
 class Color(metaclass=ColorMeta):
     '''
     class to represent colors
 
-    Supported color formats: rgb, hsl, hsv, hex, name, ryb
+    Supported color formats: rgb, hsl, hsv, hex, name, ryb, xyz, lab, lch,
+    oklab, and rgba, hsla with alpha
     check `help(acrylic.Color)` for creating a new Color instance
 
     '''
 
-    def __init__(self, **kwargs):
+    # round values when validating and converting them, see PreciseColor
+    precise = False
+
+    def __init__(self, *, rng=random, **kwargs):
         '''
         Create an instance of `Color`
 
         Supported formats:
-        rgb, hsl, hsv, ryb, hex, name
+        rgb, hsl, hsv, ryb, hex, name, xyz, lab, lch, oklab, rgba, hsla
 
         Examples:
             >>> from acrylic import Color, RANDOM
@@ -91,6 +169,10 @@ class Color(metaclass=ColorMeta):
             >>> Color(name='aquamarine')
             Color(name='aquamarine')
 
+            Create a half transparent color using rgba
+            >>> Color(rgba=[83, 237, 229, 0.5])
+            Color(rgba=(83, 237, 229, 0.5))
+
         Args:
             rgb (optional):
                 Iterable with 3 values
@@ -106,10 +188,43 @@ class Color(metaclass=ColorMeta):
                 Iterable with 3 values
                 0.0 <= {h} <= 360.0
                 0.0 <= {s, l} <= 100.0
+            xyz (optional):
+                Iterable with 3 values, CIE 1931 XYZ relative to D65 white
+                0.0 <= {x} <= 95.05
+                0.0 <= {y} <= 100.0
+                0.0 <= {z} <= 108.89
+            lab (optional):
+                Iterable with 3 values, CIELAB relative to D65 white
+                0.0 <= {l} <= 100.0
+                -128.0 <= {a, b} <= 128.0
+            lch (optional):
+                Iterable with 3 values, cylindrical form of CIELAB
+                0.0 <= {l} <= 100.0
+                0.0 <= {c} <= 150.0
+                0.0 <= {h} <= 360.0
+            oklab (optional):
+                Iterable with 3 values
+                0.0 <= {l} <= 1.0
+                -0.4 <= {a, b} <= 0.4
+            rgba (optional):
+                Iterable with 4 values, rgb and alpha
+                0 <= {r, g, b} <= 255
+                0.0 <= {a} <= 1.0
+            hsla (optional):
+                Iterable with 4 values, hsl and alpha
+                0.0 <= {h} <= 360.0
+                0.0 <= {s, l} <= 100.0
+                0.0 <= {a} <= 1.0
             hex (optional):
-                String representing 6-digit hex number
+                String representing 6-digit hex number, or 8-digit with
+                alpha
             name (optional):
                 String representing a valid CSS3 color name
+            rng (optional):
+                source of random values for `RANDOM` and ranges, any object
+                with the interface of the `random` module, like
+                `random.Random(seed)`
+                Default: the `random` module
 
         Note:
             Each value of the Iterable can be:
@@ -117,7 +232,9 @@ class Color(metaclass=ColorMeta):
                 - a list of 2 values, a random value will be picked from
                   between these 2 values
                 - `Color.RANDOM` or -1, a random value from that component's
-                  range will be picked
+                  range will be picked. For components that can be negative
+                  (a and b of lab and oklab) -1 is a normal value, use a
+                  range instead
 
         Raises:
             TypeError: if datatypes dont match
@@ -132,39 +249,312 @@ class Color(metaclass=ColorMeta):
         else:
             colorspace, value = 'rgb', (0, 0, 0)
 
-        if colorspace not in SCHEMAS.keys():
+        if colorspace not in SCHEMAS and colorspace not in ALPHA_SCHEMAS:
             msg = f'Color() got an unexpected keyword argument {colorspace!r}'
             raise TypeError(msg)
 
+        # slots have no default value, mark every value as unconverted
+        for slot in self._slots:
+            setattr(self, slot, None)
+
+        if colorspace in ALPHA_SCHEMAS:
+            # store the value of the colorspace it extends, ex: _rgb for rgba
+            value, self._alpha = validate(
+                value, colorspace, rng, self.precise
+            )
+            colorspace = colorspace[:-1]
+        else:
+            if colorspace == 'hex':
+                self._alpha = hex_alpha(value, self.precise)
+            else:
+                self._alpha = 1.0
+            value = validate(value, colorspace, rng, self.precise)
+
         # set the private attribute for this colorspace's property
         # ex: set _rgb for Color().rgb
-        setattr(self, f'_{colorspace}', validate(value, colorspace))
+        setattr(self, f'_{colorspace}', value)
 
         # set default format to use for repr() and str() and lazy evaluation
         self._default = colorspace
 
-    def __repr__(self):
-        template = f'{type(self).__name__}({self._default}={{}})'
+    @classmethod
+    def intern(cls, **kwargs):
+        '''
+        Create a color, or return an existing interned color that has the
+        same rgb values. Interned colors share one instance and its cached
+        conversions, and are freed when they are no longer used.
+
+        Interned colors are always stored as rgb, so values in other formats
+        are converted from rgb even when the color was created with them.
+
+        Examples:
+            >>> from acrylic import Color
+            >>> color = Color.intern(hex='#80ffd4')
+            >>> color
+            Color(rgb=(128, 255, 212))
+            >>> Color.intern(hsl=[160, 100, 75]) is color
+            True
+
+        Args and Raises:
+            same as `Color()`, check `help(acrylic.Color.__init__)`
+        '''
+        color = cls(**kwargs)
+        # precise colors are only the same when their unrounded rgb values
+        # are the same
+        key = color.rgb if cls.precise else color.to_int()
+        if color._alpha != 1:
+            key = (key, color._alpha)
+        try:
+            return cls._interned[key]
+        except KeyError:
+            color = cls._from_trusted('rgb', color.rgb, color._alpha)
+            return cls._interned.setdefault(key, color)
+
+    @classmethod
+    def from_int(cls, value):
+        '''
+        Create an instance of `Color` from a packed 0xRRGGBB integer
+
+        Examples:
+            >>> from acrylic import Color
+            >>> Color.from_int(0x7FFFD4)
+            Color(rgb=(127, 255, 212))
+            >>> Color.from_int(0x7FFFD4).name
+            'aquamarine'
+
+        Raises:
+            TypeError, ValueError: `value` is not an integer between 0 and
+                                   0xFFFFFF
+        '''
+        value = in_range(check_datatype(int, value, 'value'), 0, 0xFFFFFF,
+                         'value')
+        color = cls._from_trusted('rgb', int_to_rgb(value))
+        color._int = value
+        return color
+
+    def to_int(self):
+        '''
+        Returns the rgb values of this color packed into one integer as
+        0xRRGGBB, equal colors always have the same integer
+
+        Examples:
+            >>> from acrylic import Color
+            >>> hex(Color(name='aquamarine').to_int())
+            '0x7fffd4'
+        '''
+        value = self._int
+        if value is not None:
+            return value
+
+        rgb = self._rgb
+        if rgb is None:
+            if self._default == 'hex':
+                # skip converting to rgb
+                value = self._int = int(self._hex[1:], 16)
+                return value
+            rgb = self.rgb
 
-        if SCHEMAS[self._default].validation_type == 'values':
-            values = tuple(getattr(self, self._default))
-            return template.format(repr(values))
+        value = self._int = (rgb[0] << 16) | (rgb[1] << 8) | rgb[2]
+        return value
 
-        if SCHEMAS[self._default].validation_type == 'string':
-            return template.format(repr(getattr(self, self._default)))
+    __index__ = __hash__ = to_int
+
+    @property
+    def alpha(self):
+        '''
+        (readonly) return alpha of the color, from 0 for transparent to 1
+        for opaque
+        '''
+        return self._alpha
+
+    @property
+    def hexa(self):
+        '''
+        (readonly) return hex of the color with alpha as 2 more digits,
+        like '#80FFD480'
+        '''
+        return f'{self.hex}{round(self._alpha * 255):02X}'
+
+    def with_alpha(self, alpha, rng=random):
+        '''
+        Returns a copy of this color with a different alpha
+
+        Examples:
+            >>> from acrylic import Color
+            >>> Color(name='aquamarine').with_alpha(0.5)
+            Color(rgba=(127, 255, 212, 0.5))
+
+        Args:
+            alpha:
+                0.0 <= alpha <= 1.0, from transparent to opaque. Like other
+                components it can also be a range or `RANDOM`
+            rng (optional):
+                source of random values, same as for `Color()`
+
+        Raises:
+            TypeError: if datatypes dont match
+            ValueError: alpha is not within 0 - 1
+        '''
+        alpha = validate_values([alpha], 'alpha', rng, self.precise, ALPHA)
+        value = getattr(self, self._default)
+        return self._from_trusted(self._default, value, alpha)
+
+    @classmethod
+    def _from_trusted(cls, colorspace, value, alpha=1.0):
+        # create a color from an already validated value of `colorspace`
+        color = cls.__new__(cls)
+        for slot in cls._slots:
+            setattr(color, slot, None)
+        setattr(color, f'_{colorspace}', value)
+        color._alpha = alpha
+        color._default = colorspace
+        return color
+
+    def __repr__(self):
+        colorspace = self._default
+        value = getattr(self, colorspace)
+
+        # use a format that has alpha, rgba if the default has none
+        if self._alpha != 1 and colorspace == 'hex':
+            value = self.hexa
+        elif self._alpha != 1:
+            if f'{colorspace}a' in ALPHA_SCHEMAS:
+                colorspace = f'{colorspace}a'
+            else:
+                colorspace = 'rgba'
+            value = getattr(self, colorspace)
+
+        if not isinstance(value, str):
+            value = tuple(value)
+        return f'{type(self).__name__}({colorspace}={value!r})'
 
     def __eq__(self, other):
         if isinstance(other, type(self)):
-            return self.rgb == other.rgb
+            return self.to_int() == other.to_int() and (
+                self._alpha == other._alpha
+                # alphas that are the same as 8 bits, like in hexa
+                or round(self._alpha * 255) == round(other._alpha * 255)
+            )
         return NotImplemented
 
-    def __hash__(self):
-        return hash(self.rgb)
+    def nearest_name(self, metric='rgb'):
+        '''
+        Returns the CSS3 color name that is nearest to this color. Unlike
+        `Color().name`, this returns a name even when there is no exact match
+
+        Needs numpy, check `help(acrylic.Nearest.nearest_names)` for the
+        supported metrics
+        '''
+        from acrylic.Nearest import nearest_name
+        return nearest_name(self.rgb, metric)
+
+    def distance(self, other, metric='ciede2000'):
+        '''
+        Returns the color difference between this color and `other`
+
+        Needs numpy, check `help(acrylic.Distance.distances)` for the
+        supported metrics
+        '''
+        from acrylic.Distance import distance
+        return distance(self.rgb, other.rgb, metric)
+
+    def composite(self, backdrop, operator='over'):
+        '''
+        Returns this color composited on top of `backdrop`, with rgb and
+        alpha rounded like when creating a color from them
+
+        Needs numpy, check `help(acrylic.Compositing.composite)` for the
+        supported operators
+
+        Examples:
+            >>> from acrylic import Color
+            >>> Color(rgba=[255, 0, 0, 0.5]).composite(Color(name='blue'))
+            Color(rgb=(128, 0, 128))
+        '''
+        from acrylic.Compositing import composite
+        rgba = composite([self.rgba], [backdrop.rgba], operator)[0].tolist()
+        if not self.precise:
+            *rgb, alpha = rgba
+            rgba = [round(x) for x in rgb] + [round(alpha, ALPHA.precision)]
+        return type(self)(rgba=rgba)
 
     # - - - - - - - - - -
 
     def _in_ryb(self):
-        new_hue = Color(ryb=self.rgb).hsl.h
-        return Color(hsl=(new_hue, self.hsl.s, self.hsl.l))
+        cls = type(self)
+        ryb = SCHEMAS['ryb'].output_type(*self.rgb)
+        new_hue = cls._from_trusted('ryb', ryb).hsl.h
+        hsl = SCHEMAS['hsl'].output_type(new_hue, self.hsl.s, self.hsl.l)
+        return cls._from_trusted('hsl', hsl)
 
     scheme = scheme
+
+    lighten = lighten
+    darken = darken
+    saturate = saturate
+    desaturate = desaturate
+    rotate_hue = rotate_hue
+    mix = mix
+    blend = blend
+
+
+class PreciseColor(Color):
+    '''
+    class to represent colors with unrounded float values
+
+    Works like `Color`, but values are validated without rounding them, rgb
+    and ryb can be floats, and every conversion keeps full float precision.
+    Chained conversions and color schemes don't accumulate rounding errors,
+    values are only rounded by `rounded()` and to find the hex and name of
+    a color.
+
+    Precise colors are equal and interned together when their unrounded rgb
+    values and alphas are equal. Compared with a `Color`, they are equal
+    when their rounded rgb values are equal, like colors are.
+
+    Examples:
+        >>> from acrylic import Color, PreciseColor
+        >>> color = PreciseColor(hsl=[176.5, 51.6, 62.1])
+        >>> color.hsv
+        Hsv(h=176.5, s=47.89924610930682, v=81.6564)
+        >>> color.rounded()
+        Color(hsl=(176.5, 51.6, 62.1))
+        >>> color == Color(rgb=[108, 208, 202])
+        True
+    '''
+
+    precise = True
+
+    def rounded(self):
+        '''
+        Returns this color as a `Color`, with rgb and ryb values rounded to
+        the nearest integer like `hex`, `name` and `to_int()`, so that the
+        rounded color is equal to this one. Other values are rounded the
+        same way as when creating a `Color` with them.
+        '''
+        schema = SCHEMAS[self._default]
+        value = getattr(self, self._default)
+        if schema.input_type == int:
+            # converted values are floats like 127.99999999999999, which
+            # would be off by one if they were truncated like `Color(rgb=)`
+            value = schema.output_type(*[round(x) for x in value])
+        elif schema.validation_type == 'values':
+            value = validate_values(value, self._default)
+        alpha = round(self._alpha, ALPHA.precision)
+        return Color._from_trusted(self._default, value, alpha)
+
+    def to_int(self):
+        value = self._int
+        if value is None:
+            value = self._int = rgb_to_int(rounded_rgb(self.rgb))
+        return value
+
+    to_int.__doc__ = Color.to_int.__doc__
+    __index__ = __hash__ = to_int
+
+    def __eq__(self, other):
+        # precise colors that are equal always have the same rounded rgb
+        # values, so they can still be hashed with `to_int()`
+        if isinstance(other, type(self)):
+            return self.rgb == other.rgb and self._alpha == other._alpha
+        return NotImplemented
@@ -0,0 +1,184 @@
+import numpy as np
+
+from acrylic.Color import Color
+from acrylic.Defaults import SCHEMAS
+from acrylic.Arrays import validate, rgb_to, rgb_from, pack, unpack
+
+
+class ColorArrayMeta(type):
+    def __new__(cls, clsname, bases, attrs):
+
+        # generates readonly, lazy evaluation properties
+        def property_factory(attr):
+
+            def getter(instance):
+                value = getattr(instance, f'_{attr}')
+
+                if value is not None:
+                    # `attr` for these colors is already present, send cache
+                    return value
+
+                # `attr` for these colors has not been calculated yet
+                # convert to `attr` from rgb and cache
+                converted = rgb_to[attr](instance._rgb)
+                converted.flags.writeable = False
+                setattr(instance, f'_{attr}', converted)
+                return converted
+
+            def setter(instance, *args, **kwargs):
+                raise AttributeError(f'{attr!r} is a readonly attribute')
+
+            doc = f'(readonly) return {attr} components of the colors'
+            return property(getter, setter, doc=doc)
+
+        for colorspace in SCHEMAS:
+            # add properties for each colorspace using factory (.hsl)
+            attrs[colorspace] = property_factory(colorspace)
+
+            # add private attributes for each colorspace property (._hsl)
+            attrs[f'_{colorspace}'] = None
+
+        return super(ColorArrayMeta, cls).__new__(cls, clsname, bases, attrs)
+
+
+class ColorArray(metaclass=ColorArrayMeta):
+    '''
+    class to represent a large number of colors
+
+    Colors are stored as rgb in a packed buffer using 3 bytes per color.
+    Values in other formats are converted for all colors at once when they
+    are first accessed, and then cached.
+    check `help(acrylic.ColorArray)` for creating a new ColorArray instance
+
+    '''
+
+    def __init__(self, **kwargs):
+        '''
+        Create an instance of `ColorArray`
+
+        Supported formats:
+        rgb, hsl, hsv, ryb, hex, name, xyz, lab, lch, oklab
+
+        Examples:
+            >>> from acrylic import ColorArray
+
+            Create colors using rgb
+            >>> colors = ColorArray(rgb=[[83, 237, 229], [255, 0, 0]])
+            >>> colors.hsl
+            array([[176.88,  81.05,  62.75],
+                   [  0.  , 100.  ,  50.  ]])
+
+            Create colors using hex, accessing a single color gives a `Color`
+            >>> colors = ColorArray(hex=['#80ffd4', '#ff0000'])
+            >>> colors[1]
+            Color(rgb=(255, 0, 0))
+
+        Args:
+            rgb, ryb, hsl, hsv, xyz, lab, lch, oklab (optional):
+                array-like of shape (N, 3), with values in the same ranges as
+                for `Color()`
+            hex, name (optional):
+                array-like of N strings
+
+        Raises:
+            TypeError: invalid or multiple keyword arguments
+            ValueError: values are not within valid ranges
+        '''
+
+        if len(kwargs) > 1:
+            raise TypeError('ColorArray() got multiple keyword arguments')
+
+        if kwargs:
+            colorspace, value = list(kwargs.items())[0]
+        else:
+            colorspace, value = 'rgb', np.empty((0, 3), dtype=np.uint8)
+
+        if colorspace not in SCHEMAS.keys():
+            msg = 'ColorArray() got an unexpected keyword argument '
+            msg += f'{colorspace!r}'
+            raise TypeError(msg)
+
+        value = validate(value, colorspace)
+        if colorspace != 'rgb':
+            value = rgb_from[colorspace](value)
+
+        self._rgb = np.ascontiguousarray(value, dtype=np.uint8)
+        self._rgb.flags.writeable = False
+
+    @classmethod
+    def from_colors(cls, colors):
+        '''
+        Create a `ColorArray` from an iterable of `Color`
+        '''
+        rgb = [color.rgb for color in colors]
+        return cls(rgb=np.array(rgb, dtype=np.uint8).reshape(-1, 3))
+
+    @classmethod
+    def from_ints(cls, values):
+        '''
+        Create a `ColorArray` from an array-like of packed 0xRRGGBB integers,
+        like the values of `Color().to_int()`
+        '''
+        colors = cls.__new__(cls)
+        colors._rgb = unpack(values)
+        colors._rgb.flags.writeable = False
+        return colors
+
+    def to_ints(self):
+        '''
+        Return rgb values of the colors packed into 0xRRGGBB integers, as an
+        int64 numpy array
+        '''
+        return pack(self._rgb)
+
+    @classmethod
+    def frombuffer(cls, buffer):
+        '''
+        Create a `ColorArray` from a bytes-like object of packed rgb values,
+        3 bytes per color. The buffer is used directly without copying.
+        '''
+        rgb = np.frombuffer(buffer, dtype=np.uint8)
+        if len(rgb) % 3:
+            raise ValueError('buffer size should be a multiple of 3')
+
+        colors = cls.__new__(cls)
+        colors._rgb = rgb.reshape(-1, 3)
+        colors._rgb.flags.writeable = False
+        return colors
+
+    def tobytes(self):
+        '''
+        Return rgb values of the colors packed as bytes, 3 bytes per color
+        '''
+        return self._rgb.tobytes()
+
+    @property
+    def nbytes(self):
+        '''
+        (readonly) return number of bytes used to store the colors
+        '''
+        return self._rgb.nbytes
+
+    def __len__(self):
+        return len(self._rgb)
+
+    def __getitem__(self, index):
+        # a single row is a Color, anything that selects rows (slices,
+        # lists of indices, boolean masks) is a ColorArray
+        rgb = self._rgb[index]
+        if rgb.ndim == 1 and rgb.shape == (3,):
+            return Color.from_rgb_unchecked(*rgb.tolist())
+        if rgb.ndim != 2 or rgb.shape[1] != 3:
+            raise IndexError('index should select colors, not components')
+        colors = type(self).__new__(type(self))
+        colors._rgb = rgb
+        return colors
+
+    def __iter__(self):
+        for rgb in self._rgb.tolist():
+            yield Color.from_rgb_unchecked(*rgb)
+
+    def __repr__(self):
+        # large arrays are summarized by numpy
+        values = np.array2string(self._rgb, separator=', ', prefix=' ' * 15)
+        return f'{type(self).__name__}(rgb={values})'
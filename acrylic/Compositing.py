@@ -0,0 +1,115 @@
+'''
+Porter-Duff compositing of arrays of rgba colors
+
+Colors are arrays with 4 values per color, rgb and an alpha that is not
+premultiplied. The alpha of integer arrays, like the pixels of an image, is
+from 0 to 255 like rgb, while the alpha of float arrays is from 0 to 1,
+like `Color().rgba`.
+
+Examples:
+    >>> from acrylic.Compositing import composite
+    >>> pixels = np.zeros((1080, 1920, 4), dtype=np.uint8)
+    >>> overlay = np.array([83, 237, 229, 128], dtype=np.uint8)
+    >>> composite(overlay, pixels).shape
+    (1080, 1920, 4)
+    >>> composite([[83, 237, 229, 0.5]], [[255, 0, 0, 1.0]])
+    array([[169. , 118.5, 114.5,   1. ]])
+'''
+import numpy as np
+
+
+# (Fa, Fb) of every operator, the fractions of the source and of the
+# backdrop that are kept, from the alphas of the source and the backdrop
+operators = {
+    'clear': lambda a, b: (0, 0),
+    'src': lambda a, b: (1, 0),
+    'dst': lambda a, b: (0, 1),
+    'over': lambda a, b: (1, 1 - a),
+    'dst_over': lambda a, b: (1 - b, 1),
+    'in': lambda a, b: (b, 0),
+    'dst_in': lambda a, b: (0, a),
+    'out': lambda a, b: (1 - b, 0),
+    'dst_out': lambda a, b: (0, 1 - a),
+    'atop': lambda a, b: (b, 1 - a),
+    'dst_atop': lambda a, b: (1 - b, a),
+    'xor': lambda a, b: (1 - b, 1 - a),
+}
+
+
+def check_operator(operator):
+    if operator not in operators:
+        raise ValueError(f'{operator!r} is not a valid compositing operator')
+    return operator
+
+
+def split(rgba, param):
+    # float rgb and alpha from 0 to 1 of `rgba`, and if it is an integer
+    # array with alpha from 0 to 255
+    rgba = np.asarray(rgba)
+    if rgba.shape[-1:] != (4,):
+        raise ValueError(f'{param!r} should be an array of shape (..., 4)')
+
+    integer = rgba.dtype.kind in 'iu'
+    alpha = rgba[..., 3:].astype(np.float64)
+    if integer:
+        alpha /= 255
+    return rgba[..., :3].astype(np.float64), alpha, integer
+
+
+def composite(src, dst, operator='over'):
+    '''
+    Composites every color of `src` with the color of `dst` under it
+
+    Examples:
+        >>> from acrylic.Compositing import composite
+        >>> composite([[255, 0, 0, 128]], [[0, 0, 255, 255]])
+        array([[128,   0, 127, 255]], dtype=uint8)
+        >>> composite([[255, 0, 0, 128]], [[0, 0, 255, 255]], 'dst_out')
+        array([[  0,   0, 255, 127]], dtype=uint8)
+
+    Args:
+        src:
+            (..., 4) array-like of rgba values, the colors on top
+        dst:
+            (..., 4) array-like of rgba values, the backdrop. `src` and
+            `dst` are broadcast together, so either can be a single color
+        operator(str, optional):
+            Porter-Duff operator, 'over', 'in', 'out', 'atop', their
+            'dst_over', 'dst_in', 'dst_out', 'dst_atop' counterparts that
+            swap the source and the backdrop, 'src', 'dst', 'xor' or 'clear'
+            Default: 'over'
+
+    Returns:
+        numpy.ndarray of shape (..., 4), uint8 with alpha from 0 to 255 if
+        both `src` and `dst` are integer arrays, or float with alpha from 0
+        to 1 and rgb that is not rounded
+
+    Raises:
+        ValueError: invalid operator or shape
+    '''
+    blend = operators[check_operator(operator)]
+    src_rgb, src_alpha, src_integer = split(src, 'src')
+    dst_rgb, dst_alpha, dst_integer = split(dst, 'dst')
+
+    src_fraction, dst_fraction = blend(src_alpha, dst_alpha)
+    src_weight = src_alpha * src_fraction
+    dst_weight = dst_alpha * dst_fraction
+    alpha = src_weight + dst_weight
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rgb = (src_weight * src_rgb + dst_weight * dst_rgb) / alpha
+    # colors that are fully transparent are black
+    rgb = np.where(alpha > 0, rgb, 0)
+
+    if src_integer and dst_integer:
+        rgba = np.concatenate([rgb, alpha * 255], axis=-1)
+        return np.rint(rgba).astype(np.uint8)
+    return np.concatenate([rgb, alpha], axis=-1)
+
+
+def over(src, dst):
+    '''
+    Returns `src` composited over `dst`, the usual way of stacking layers,
+    check `help(acrylic.Compositing.composite)` for details
+    '''
+    return composite(src, dst, 'over')
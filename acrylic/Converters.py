@@ -1,9 +1,125 @@
+import math
 import colorsys
+import functools
 
 from acrylic.Defaults import SCHEMAS, PRECISION
 from acrylic.color_names import color_names, color_names_reverse
 
 
+# sRGB <-> CIE XYZ with D65 white point, XYZ is scaled to 0.0 - 1.0
+# Source: http://www.brucelindbloom.com/index.html?Eqn_RGB_XYZ_Matrix.html
+SRGB_TO_XYZ = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041),
+)
+XYZ_TO_SRGB = (
+    (3.2404542, -1.5371385, -0.4985314),
+    (-0.9692660, 1.8760108, 0.0415560),
+    (0.0556434, -0.2040259, 1.0572252),
+)
+WHITE_D65 = (0.95047, 1.0, 1.08883)
+
+# linear sRGB <-> OKLab
+# Source: https://bottosson.github.io/posts/oklab/
+LINEAR_TO_LMS = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+LMS_TO_OKLAB = (
+    (0.2104542553, 0.7936177850, -0.0040720468),
+    (1.9779984951, -2.4285922050, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.8086757660),
+)
+OKLAB_TO_LMS = (
+    (1.0, 0.3963377774, 0.2158037573),
+    (1.0, -0.1055613458, -0.0638541728),
+    (1.0, -0.0894841775, -1.2914855480),
+)
+LMS_TO_LINEAR = (
+    (4.0767416621, -3.3077115913, 0.2309699292),
+    (-1.2684380046, 2.6097574011, -0.3413193965),
+    (-0.0041960863, -0.7034186147, 1.7076147010),
+)
+
+# CIELAB constants
+DELTA = 6 / 29
+XYZ_SCALE = 100
+
+
+def transform(matrix, values):
+    return [row[0] * values[0] + row[1] * values[1] + row[2] * values[2]
+            for row in matrix]
+
+
+def rgb_to_linear(rgb):
+    # rgb to linear sRGB components in the range 0.0 - 1.0
+    rgb_format = SCHEMAS['rgb'].format
+    rgb = [x / m[1] for x, m in zip(rgb, rgb_format)]
+    return [x / 12.92 if x <= 0.04045 else ((x + 0.055) / 1.055) ** 2.4
+            for x in rgb]
+
+
+def linear_to_rgb_values(linear):
+    # linear sRGB to rgb components in the range 0.0 - 1.0, colors outside
+    # the sRGB gamut are clamped
+    linear = [min(max(x, 0.0), 1.0) for x in linear]
+    return [x * 12.92 if x <= 0.0031308 else 1.055 * x ** (1 / 2.4) - 0.055
+            for x in linear]
+
+
+def linear_to_rgb(linear):
+    rgb_format = SCHEMAS['rgb'].format
+    rgb = linear_to_rgb_values(linear)
+    rgb = [round(x * m[1]) for x, m in zip(rgb, rgb_format)]
+    return SCHEMAS['rgb'].output_type(*rgb)
+
+
+def xyz_to_lab_values(xyz):
+    f = [x / w for x, w in zip(xyz, WHITE_D65)]
+    f = [x ** (1 / 3) if x > DELTA ** 3 else x / (3 * DELTA ** 2) + 4 / 29
+         for x in f]
+    return [116 * f[1] - 16, 500 * (f[0] - f[1]), 200 * (f[1] - f[2])]
+
+
+def lab_values_to_xyz(lab):
+    fy = (lab[0] + 16) / 116
+    f = [fy + lab[1] / 500, fy, fy - lab[2] / 200]
+    f = [x ** 3 if x > DELTA else 3 * DELTA ** 2 * (x - 4 / 29) for x in f]
+    return [x * w for x, w in zip(f, WHITE_D65)]
+
+
+def lab_values_to_lch(lab):
+    c = math.sqrt(lab[1] * lab[1] + lab[2] * lab[2])
+    h = math.degrees(math.atan2(lab[2], lab[1])) % SCHEMAS['lch'].format.h[1]
+    return [lab[0], c, h]
+
+
+def lch_values_to_lab(lch):
+    h = math.radians(lch[2])
+    return [lch[0], lch[1] * math.cos(h), lch[1] * math.sin(h)]
+
+
+def linear_to_oklab_values(linear):
+    lms = [x ** (1 / 3) for x in transform(LINEAR_TO_LMS, linear)]
+    return transform(LMS_TO_OKLAB, lms)
+
+
+def oklab_values_to_linear(oklab):
+    lms = [x ** 3 for x in transform(OKLAB_TO_LMS, oklab)]
+    return transform(LMS_TO_LINEAR, lms)
+
+
+def output(values, colorspace):
+    # round values the same way for every perceptual colorspace
+    schema = SCHEMAS[colorspace]
+    return schema.output_type(*[round(x, schema.precision) for x in values])
+
+
+# - - - - - - - - - - - - - -
+
+
 def rgb_to_hsl(rgb):
     rgb_format, hsl_format = SCHEMAS['rgb'].format, SCHEMAS['hsl'].format
 
@@ -25,7 +141,7 @@ def rgb_to_hsv(rgb):
 
 
 def rgb_to_hex(rgb):
-    return SCHEMAS['hex'].output_type(''.join(f'{x:02X}' for x in rgb))
+    return '#%02X%02X%02X' % tuple(rgb)
 
 
 def rgb_to_name(rgb):
@@ -33,10 +149,18 @@ def rgb_to_name(rgb):
 
 
 def rgb_to_ryb(rgb):
+    ryb_format = SCHEMAS['ryb'].format
+    ryb = rgb_to_ryb_values(rgb)
+    result = [round(x * m[1]) for x, m in zip(ryb, ryb_format)]
+    return SCHEMAS['ryb'].output_type(*result)
+
+
+def rgb_to_ryb_values(rgb):
+    # rgb to ryb components in the range 0.0 - 1.0
     # Source:
     # https://www.jstage.jst.go.jp/article/tievciieej/5/2/5_110/_pdf/-char/en
 
-    rgb_format, ryb_format = SCHEMAS['rgb'].format, SCHEMAS['ryb'].format
+    rgb_format = SCHEMAS['rgb'].format
     rgb_r, rgb_g, rgb_b = [x / m[1] for x, m in zip(rgb, rgb_format)]
 
     white = min(rgb_r, rgb_g, rgb_b)
@@ -53,10 +177,26 @@ def rgb_to_ryb(rgb):
         norm = max(ryb_r, ryb_y, ryb_b) / max(rgb_r, rgb_g, rgb_b)
 
     ryb = [x / norm if norm > 0 else x for x in (ryb_r, ryb_y, ryb_b)]
-    ryb = [x + black for x in ryb]
+    return [x + black for x in ryb]
 
-    result = [round(x * m[1]) for x, m in zip(ryb, ryb_format)]
-    return SCHEMAS['ryb'].output_type(*result)
+
+def rgb_to_xyz(rgb):
+    xyz = transform(SRGB_TO_XYZ, rgb_to_linear(rgb))
+    return output([x * XYZ_SCALE for x in xyz], 'xyz')
+
+
+def rgb_to_lab(rgb):
+    xyz = transform(SRGB_TO_XYZ, rgb_to_linear(rgb))
+    return output(xyz_to_lab_values(xyz), 'lab')
+
+
+def rgb_to_lch(rgb):
+    xyz = transform(SRGB_TO_XYZ, rgb_to_linear(rgb))
+    return output(lab_values_to_lch(xyz_to_lab_values(xyz)), 'lch')
+
+
+def rgb_to_oklab(rgb):
+    return output(linear_to_oklab_values(rgb_to_linear(rgb)), 'oklab')
 
 
 # - - - - - - - - - - - - - -
@@ -83,8 +223,10 @@ def hsv_to_rgb(hsv):
 
 
 def hex_to_rgb(hex_str):
-    rgb = [int(hex_str[x:x + 2], 16) for x in range(1, 7, 2)]
-    return SCHEMAS['rgb'].output_type(*rgb)
+    value = int(hex_str[1:], 16)
+    return SCHEMAS['rgb'].output_type(
+        value >> 16, (value >> 8) & 255, value & 255
+    )
 
 
 def name_to_rgb(name):
@@ -94,10 +236,18 @@ def name_to_rgb(name):
 
 
 def ryb_to_rgb(ryb):
+    rgb_format = SCHEMAS['rgb'].format
+    rgb = ryb_to_rgb_values(ryb)
+    result = [round(x * m[1]) for x, m in zip(rgb, rgb_format)]
+    return SCHEMAS['rgb'].output_type(*result)
+
+
+def ryb_to_rgb_values(ryb):
+    # ryb to rgb components in the range 0.0 - 1.0
     # Source:
     # https://www.jstage.jst.go.jp/article/tievciieej/5/2/5_110/_pdf/-char/en
 
-    rgb_format, ryb_format = SCHEMAS['rgb'].format, SCHEMAS['ryb'].format
+    ryb_format = SCHEMAS['ryb'].format
     ryb_r, ryb_y, ryb_b = [x / m[1] for x, m in zip(ryb, ryb_format)]
 
     black = min(ryb_r, ryb_y, ryb_b)
@@ -114,10 +264,163 @@ def ryb_to_rgb(ryb):
         norm = max(rgb_r, rgb_g, rgb_b) / max(ryb_r, ryb_y, ryb_b)
 
     rgb = [x / norm if norm > 0 else x for x in (rgb_r, rgb_g, rgb_b)]
-    rgb = [x + white for x in rgb]
+    return [x + white for x in rgb]
 
-    result = [round(x * m[1]) for x, m in zip(rgb, rgb_format)]
-    return SCHEMAS['rgb'].output_type(*result)
+
+def xyz_to_rgb(xyz):
+    xyz = [x / XYZ_SCALE for x in xyz]
+    return linear_to_rgb(transform(XYZ_TO_SRGB, xyz))
+
+
+def lab_to_rgb(lab):
+    return linear_to_rgb(transform(XYZ_TO_SRGB, lab_values_to_xyz(lab)))
+
+
+def lch_to_rgb(lch):
+    xyz = lab_values_to_xyz(lch_values_to_lab(lch))
+    return linear_to_rgb(transform(XYZ_TO_SRGB, xyz))
+
+
+def oklab_to_rgb(oklab):
+    return linear_to_rgb(oklab_values_to_linear(oklab))
+
+
+# - - - - - - - - - - - - - -
+
+
+def hsl_to_hsv_values(hsl):
+    # hsl to hsv components in the range 0.0 - 1.0
+    (h, s, l) = [x / m[1] for x, m in zip(hsl, SCHEMAS['hsl'].format)]
+    v = l + s * min(l, 1 - l)
+    s = 0.0 if v == 0 else 2 * (1 - l / v)
+    return [h, s, v]
+
+
+def hsv_to_hsl_values(hsv):
+    # hsv to hsl components in the range 0.0 - 1.0
+    (h, s, v) = [x / m[1] for x, m in zip(hsv, SCHEMAS['hsv'].format)]
+    l = v * (1 - s / 2)
+    s = 0.0 if l == 0 or l == 1 else (v - l) / min(l, 1 - l)
+    return [h, s, l]
+
+
+def hsl_to_hsv(hsl):
+    hsv_format = SCHEMAS['hsv'].format
+    hsv = [round(x * m[1], PRECISION)
+           for x, m in zip(hsl_to_hsv_values(hsl), hsv_format)]
+    return SCHEMAS['hsv'].output_type(*hsv)
+
+
+def hsv_to_hsl(hsv):
+    hsl_format = SCHEMAS['hsl'].format
+    hsl = [round(x * m[1], PRECISION)
+           for x, m in zip(hsv_to_hsl_values(hsv), hsl_format)]
+    return SCHEMAS['hsl'].output_type(*hsl)
+
+
+def rgb_to_int(rgb):
+    return (rgb[0] << 16) | (rgb[1] << 8) | rgb[2]
+
+
+def int_to_rgb(value):
+    return SCHEMAS['rgb'].output_type(
+        value >> 16, (value >> 8) & 255, value & 255
+    )
+
+
+def hex_to_name(hex_str):
+    return hex_names.get(hex_str, '-')
+
+
+def name_to_hex(name):
+    return name_hexes.get(name, '#000000')
+
+
+hex_names = {rgb_to_hex(k): v for k, v in color_names_reverse.items()}
+name_hexes = {k: rgb_to_hex(v) for k, v in color_names.items()}
+
+
+# - - - - - - - - - - - - - -
+# precise converters keep unrounded floats for every format, including rgb
+# and ryb, only hex and name are found from the nearest integer rgb values
+
+
+def scale(values, colorspace):
+    # components in the range 0.0 - 1.0 to the range of `colorspace`
+    schema = SCHEMAS[colorspace]
+    return schema.output_type(
+        *[x * m[1] for x, m in zip(values, schema.format)]
+    )
+
+
+def normalize(values, colorspace):
+    schema_format = SCHEMAS[colorspace].format
+    return [x / m[1] for x, m in zip(values, schema_format)]
+
+
+def rounded_rgb(rgb):
+    return SCHEMAS['rgb'].output_type(*[round(x) for x in rgb])
+
+
+def precise_rgb_to_hsl(rgb):
+    h, l, s = colorsys.rgb_to_hls(*normalize(rgb, 'rgb'))
+    return scale([h, s, l], 'hsl')
+
+
+def precise_rgb_to_hsv(rgb):
+    return scale(colorsys.rgb_to_hsv(*normalize(rgb, 'rgb')), 'hsv')
+
+
+def precise_rgb_to_xyz(rgb):
+    xyz = transform(SRGB_TO_XYZ, rgb_to_linear(rgb))
+    return SCHEMAS['xyz'].output_type(*[x * XYZ_SCALE for x in xyz])
+
+
+def precise_rgb_to_lab(rgb):
+    xyz = transform(SRGB_TO_XYZ, rgb_to_linear(rgb))
+    return SCHEMAS['lab'].output_type(*xyz_to_lab_values(xyz))
+
+
+def precise_rgb_to_lch(rgb):
+    xyz = transform(SRGB_TO_XYZ, rgb_to_linear(rgb))
+    lch = lab_values_to_lch(xyz_to_lab_values(xyz))
+    return SCHEMAS['lch'].output_type(*lch)
+
+
+def precise_rgb_to_oklab(rgb):
+    oklab = linear_to_oklab_values(rgb_to_linear(rgb))
+    return SCHEMAS['oklab'].output_type(*oklab)
+
+
+def precise_hsl_to_rgb(hsl):
+    (h, s, l) = normalize(hsl, 'hsl')
+    return scale(colorsys.hls_to_rgb(h, l, s), 'rgb')
+
+
+def precise_hsv_to_rgb(hsv):
+    return scale(colorsys.hsv_to_rgb(*normalize(hsv, 'hsv')), 'rgb')
+
+
+def precise_xyz_to_rgb(xyz):
+    xyz = [x / XYZ_SCALE for x in xyz]
+    linear = transform(XYZ_TO_SRGB, xyz)
+    return scale(linear_to_rgb_values(linear), 'rgb')
+
+
+def precise_lab_to_rgb(lab):
+    linear = transform(XYZ_TO_SRGB, lab_values_to_xyz(lab))
+    return scale(linear_to_rgb_values(linear), 'rgb')
+
+
+def precise_lch_to_rgb(lch):
+    xyz = lab_values_to_xyz(lch_values_to_lab(lch))
+    linear = transform(XYZ_TO_SRGB, xyz)
+    return scale(linear_to_rgb_values(linear), 'rgb')
+
+
+def precise_oklab_to_rgb(oklab):
+    linear = oklab_values_to_linear(oklab)
+    return scale(linear_to_rgb_values(linear), 'rgb')
 
 
 # - - - - - - - - - - - - - -
@@ -129,6 +432,10 @@ rgb_to = {
     'hex': rgb_to_hex,
     'name': rgb_to_name,
     'ryb': rgb_to_ryb,
+    'xyz': rgb_to_xyz,
+    'lab': rgb_to_lab,
+    'lch': rgb_to_lch,
+    'oklab': rgb_to_oklab,
 }
 
 
@@ -138,4 +445,123 @@ rgb_from = {
     'hex': hex_to_rgb,
     'name': name_to_rgb,
     'ryb': ryb_to_rgb,
+    'xyz': xyz_to_rgb,
+    'lab': lab_to_rgb,
+    'lch': lch_to_rgb,
+    'oklab': oklab_to_rgb,
+}
+
+
+precise_rgb_to = {
+    'hsl': precise_rgb_to_hsl,
+    'hsv': precise_rgb_to_hsv,
+    'hex': lambda rgb: rgb_to_hex(rounded_rgb(rgb)),
+    'name': lambda rgb: rgb_to_name(rounded_rgb(rgb)),
+    'ryb': lambda rgb: scale(rgb_to_ryb_values(rgb), 'ryb'),
+    'xyz': precise_rgb_to_xyz,
+    'lab': precise_rgb_to_lab,
+    'lch': precise_rgb_to_lch,
+    'oklab': precise_rgb_to_oklab,
+}
+
+
+precise_rgb_from = {
+    'hsl': precise_hsl_to_rgb,
+    'hsv': precise_hsv_to_rgb,
+    'hex': hex_to_rgb,
+    'name': name_to_rgb,
+    'ryb': lambda ryb: scale(ryb_to_rgb_values(ryb), 'rgb'),
+    'xyz': precise_xyz_to_rgb,
+    'lab': precise_lab_to_rgb,
+    'lch': precise_lch_to_rgb,
+    'oklab': precise_oklab_to_rgb,
 }
+
+
+# conversions between two formats that do not go through rgb, these keep
+# the precision of float formats instead of rounding to integer rgb
+direct = {
+    ('hsl', 'hsv'): hsl_to_hsv,
+    ('hsv', 'hsl'): hsv_to_hsl,
+    ('hex', 'name'): hex_to_name,
+    ('name', 'hex'): name_to_hex,
+}
+
+
+precise_direct = {
+    ('hsl', 'hsv'): lambda hsl: scale(hsl_to_hsv_values(hsl), 'hsv'),
+    ('hsv', 'hsl'): lambda hsv: scale(hsv_to_hsl_values(hsv), 'hsl'),
+    ('hex', 'name'): hex_to_name,
+    ('name', 'hex'): name_to_hex,
+}
+
+
+def unwrap(table, key, wrapper):
+    # removes `wrapper` from the functions in `table[key]`, also when it is
+    # wrapped by other functions (like `acrylic.Cache` inside
+    # `acrylic.Instrument`), which call the function in their `__wrapped__`
+    # so that it can be replaced. Returns False if `wrapper` is not found
+    if table[key] is wrapper:
+        table[key] = wrapper.__wrapped__
+        return True
+
+    outer = table[key]
+    while hasattr(outer, '__wrapped__'):
+        if outer.__wrapped__ is wrapper:
+            outer.__wrapped__ = wrapper.__wrapped__
+            return True
+        outer = outer.__wrapped__
+    return False
+
+
+def converter(src, dst, precise=False):
+    # function for a single edge of the conversion graph, rgb_to and
+    # rgb_from are looked up on every call so that wrapped functions
+    # (like the ones from `acrylic.Cache`) are used
+    if precise:
+        if src == 'rgb':
+            return precise_rgb_to[dst]
+        if dst == 'rgb':
+            return precise_rgb_from[src]
+        return precise_direct[(src, dst)]
+
+    if src == 'rgb':
+        return rgb_to[dst]
+    if dst == 'rgb':
+        return rgb_from[src]
+    return direct[(src, dst)]
+
+
+@functools.lru_cache(maxsize=None)
+def path(src, dst):
+    '''
+    Returns the shortest list of formats to convert through to get from
+    `src` to `dst`, including both. Every format can be converted to and
+    from rgb, and a few pairs have a `direct` conversion.
+    '''
+    paths = {src: (src,)}
+    queue = [src]
+    for current in queue:
+        if current == dst:
+            return list(paths[current])
+
+        neighbours = [x for a, x in direct if a == current]
+        neighbours += list(rgb_to) if current == 'rgb' else ['rgb']
+        for x in neighbours:
+            if x not in paths:
+                paths[x] = paths[current] + (x,)
+                queue.append(x)
+
+    raise ValueError(f'no conversion from {src!r} to {dst!r}')
+
+
+def convert(value, src, dst, precise=False):
+    '''
+    Converts a single valid value from `src` to `dst` using the shortest
+    path in the conversion graph. With precise=True values are not rounded
+    at any step, check `help(acrylic.PreciseColor)`
+    '''
+    steps = path(src, dst)
+    for a, b in zip(steps, steps[1:]):
+        value = converter(a, b, precise)(value)
+    return value
@@ -1,6 +1,5 @@
 import re
 from collections import namedtuple
-from random import randint, uniform, choice
 
 from acrylic.color_names import color_names
 
@@ -9,54 +8,69 @@ Rgb = namedtuple('Rgb', 'r g b')
 Hsl = namedtuple('Hsl', 'h s l')
 Hsv = namedtuple('Hsv', 'h s v')
 Ryb = namedtuple('Ryb', 'r y b')
+Xyz = namedtuple('Xyz', 'x y z')
+Lab = namedtuple('Lab', 'l a b')
+Lch = namedtuple('Lch', 'l c h')
+Oklab = namedtuple('Oklab', 'l a b')
+Rgba = namedtuple('Rgba', 'r g b a')
+Hsla = namedtuple('Hsla', 'h s l a')
 
 
 Schema = namedtuple(
     'Schema',
-    'format names length rng input_type output_type validation_type'
+    'format names length rng input_type output_type validation_type '
+    'precision'
 )
 
 
 RANDOM = -1
 PRECISION = 2
 
+COLOR_NAMES = tuple(color_names.keys())
 
+
+# `rng` of every schema picks random values using its first argument, any
+# object with the interface of the `random` module, like `random.Random()`
 SCHEMAS = {
     'rgb': Schema(
         format=Rgb((0, 255), (0, 255), (0, 255)),
         names=Rgb('red', 'green', 'blue'),
         length=3,
-        rng=lambda a, b: randint(a, b),
+        rng=lambda rng, a, b: rng.randint(a, b),
         input_type=int,
         output_type=Rgb,
         validation_type='values',
+        precision=0,
     ),
     'hsl': Schema(
         format=Hsl((0, 360.0), (0, 100.0), (0, 100.0)),
         names=Hsl('hue', 'saturation', 'lightness'),
         length=3,
-        rng=lambda a, b: round(uniform(a, b), PRECISION),
+        rng=lambda rng, a, b: round(rng.uniform(a, b), PRECISION),
         input_type=float,
         output_type=Hsl,
         validation_type='values',
+        precision=PRECISION,
     ),
     'hsv': Schema(
         format=Hsv((0, 360.0), (0, 100.0), (0, 100.0)),
         names=Hsv('hue', 'saturation', 'value'),
         length=3,
-        rng=lambda a, b: round(uniform(a, b), PRECISION),
+        rng=lambda rng, a, b: round(rng.uniform(a, b), PRECISION),
         input_type=float,
         output_type=Hsv,
         validation_type='values',
+        precision=PRECISION,
     ),
     'ryb': Schema(
         format=Ryb((0, 255), (0, 255), (0, 255)),
         names=Rgb('red', 'yellow', 'blue'),
         length=3,
-        rng=lambda a, b: randint(a, b),
+        rng=lambda rng, a, b: rng.randint(a, b),
         input_type=int,
         output_type=Ryb,
         validation_type='values',
+        precision=0,
     ),
     'hex': Schema(
         format=re.compile(r''.join([
@@ -68,18 +82,94 @@ SCHEMAS = {
         ])),
         names=tuple(),
         length=0,
-        rng='#' + ''.join(choice('0123456789ABCDEF') for _ in range(6)),
+        rng=lambda rng: f'#{rng.randint(0, 0xFFFFFF):06X}',
         input_type=str,
         output_type=lambda x: f'#{x.upper()}',
         validation_type='string',
+        precision=None,
     ),
     'name': Schema(
         format=color_names,
         names=tuple(),
         length=0,
-        rng=choice(list(color_names.keys())),
+        rng=lambda rng: rng.choice(COLOR_NAMES),
         input_type=str,
         output_type=str,
         validation_type='string',
+        precision=None,
+    ),
+    'xyz': Schema(
+        format=Xyz((0, 95.05), (0, 100.0), (0, 108.89)),
+        names=Xyz('x', 'y', 'z'),
+        length=3,
+        rng=lambda rng, a, b: round(rng.uniform(a, b), PRECISION + 1),
+        input_type=float,
+        output_type=Xyz,
+        validation_type='values',
+        precision=PRECISION + 1,
+    ),
+    'lab': Schema(
+        format=Lab((0, 100.0), (-128.0, 128.0), (-128.0, 128.0)),
+        names=Lab('lightness', 'a', 'b'),
+        length=3,
+        rng=lambda rng, a, b: round(rng.uniform(a, b), PRECISION),
+        input_type=float,
+        output_type=Lab,
+        validation_type='values',
+        precision=PRECISION,
+    ),
+    'lch': Schema(
+        format=Lch((0, 100.0), (0, 150.0), (0, 360.0)),
+        names=Lch('lightness', 'chroma', 'hue'),
+        length=3,
+        rng=lambda rng, a, b: round(rng.uniform(a, b), PRECISION),
+        input_type=float,
+        output_type=Lch,
+        validation_type='values',
+        precision=PRECISION,
     ),
+    'oklab': Schema(
+        format=Oklab((0, 1.0), (-0.4, 0.4), (-0.4, 0.4)),
+        names=Oklab('lightness', 'a', 'b'),
+        length=3,
+        rng=lambda rng, a, b: round(rng.uniform(a, b), PRECISION + 3),
+        input_type=float,
+        output_type=Oklab,
+        validation_type='values',
+        precision=PRECISION + 3,
+    ),
+}
+
+
+# alpha of a color, from 0 for transparent to 1 for opaque, validated like
+# a component of the colorspaces it is added to. It is not a colorspace, so
+# it is not converted and does not change how colors are converted
+ALPHA = Schema(
+    format=((0, 1.0),),
+    names=('alpha',),
+    length=1,
+    rng=lambda rng, a, b: round(rng.uniform(a, b), PRECISION + 1),
+    input_type=float,
+    output_type=float,
+    validation_type='values',
+    precision=PRECISION + 1,
+)
+
+
+def alpha_schema(colorspace, output_type):
+    schema = SCHEMAS[colorspace]
+    return schema._replace(
+        format=output_type(*schema.format, *ALPHA.format),
+        names=output_type(*schema.names, *ALPHA.names),
+        length=schema.length + 1,
+        output_type=output_type,
+        validation_type='alpha',
+    )
+
+
+# colorspaces with alpha added as the last component, every key is the
+# name of the colorspace it extends followed by 'a'
+ALPHA_SCHEMAS = {
+    'rgba': alpha_schema('rgb', Rgba),
+    'hsla': alpha_schema('hsl', Hsla),
 }
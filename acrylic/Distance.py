@@ -0,0 +1,203 @@
+import numpy as np
+
+from acrylic.Arrays import lab_values
+
+
+def euclidean(a, b):
+    return np.sqrt(np.sum((a - b) ** 2, axis=-1))
+
+
+def cie94(lab1, lab2):
+    # graphic arts weights, lab1 is the reference color so the distance is
+    # not symmetric
+    l1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    l2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    c1, c2 = np.sqrt(a1 ** 2 + b1 ** 2), np.sqrt(a2 ** 2 + b2 ** 2)
+    dl, dc = l1 - l2, c1 - c2
+    dh = np.maximum((a1 - a2) ** 2 + (b1 - b2) ** 2 - dc ** 2, 0)
+
+    sc = 1 + 0.045 * c1
+    sh = 1 + 0.015 * c1
+    return np.sqrt(dl ** 2 + (dc / sc) ** 2 + dh / sh ** 2)
+
+
+def ciede2000(lab1, lab2):
+    # Source:
+    # http://www2.ece.rochester.edu/~gsharma/ciede2000/ciede2000noteCRNA.pdf
+    l1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    l2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    c_mean = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2
+    g = 0.5 * (1 - np.sqrt(c_mean ** 7 / (c_mean ** 7 + 25 ** 7)))
+    a1, a2 = a1 * (1 + g), a2 * (1 + g)
+    c1, c2 = np.hypot(a1, b1), np.hypot(a2, b2)
+    h1 = np.degrees(np.arctan2(b1, a1)) % 360
+    h2 = np.degrees(np.arctan2(b2, a2)) % 360
+
+    dl, dc = l2 - l1, c2 - c1
+    dh = h2 - h1
+    dh = np.where(dh > 180, dh - 360, np.where(dh < -180, dh + 360, dh))
+    dh = np.where(c1 * c2 == 0, 0, dh)
+    dh = 2 * np.sqrt(c1 * c2) * np.sin(np.radians(dh / 2))
+
+    l_mean, c_mean = (l1 + l2) / 2, (c1 + c2) / 2
+    h_mean = h1 + h2
+    h_mean = np.where(
+        np.abs(h1 - h2) > 180,
+        np.where(h_mean < 360, h_mean + 360, h_mean - 360),
+        h_mean
+    ) / 2
+    h_mean = np.where(c1 * c2 == 0, h1 + h2, h_mean)
+
+    t = (
+        1
+        - 0.17 * np.cos(np.radians(h_mean - 30))
+        + 0.24 * np.cos(np.radians(2 * h_mean))
+        + 0.32 * np.cos(np.radians(3 * h_mean + 6))
+        - 0.20 * np.cos(np.radians(4 * h_mean - 63))
+    )
+    sl = 1 + 0.015 * (l_mean - 50) ** 2 / np.sqrt(20 + (l_mean - 50) ** 2)
+    sc = 1 + 0.045 * c_mean
+    sh = 1 + 0.015 * c_mean * t
+    rt = (
+        -2 * np.sqrt(c_mean ** 7 / (c_mean ** 7 + 25 ** 7))
+        * np.sin(np.radians(60 * np.exp(-(((h_mean - 275) / 25) ** 2))))
+    )
+
+    dl, dc, dh = dl / sl, dc / sc, dh / sh
+    return np.sqrt(dl ** 2 + dc ** 2 + dh ** 2 + rt * dc * dh)
+
+
+# - - - - - - - - - - - - - -
+
+
+# each metric is a pair of (function that converts rgb to the space the
+# distance is measured in, distance function)
+metrics = {
+    'rgb': (lambda rgb: np.asarray(rgb, dtype=np.float64), euclidean),
+    'cie76': (lab_values, euclidean),
+    'cie94': (lab_values, cie94),
+    'ciede2000': (lab_values, ciede2000),
+}
+
+# metrics that are euclidean distances in their space
+euclidean_metrics = {'rgb', 'cie76'}
+
+
+def check_metric(metric):
+    if metric not in metrics:
+        raise ValueError(f'{metric!r} is not a valid distance metric')
+    return metric
+
+
+# maximum number of distances computed at once by `pairwise()`
+BLOCK_SIZE = 1 << 18
+
+
+def points(rgb, metric):
+    rgb = np.asarray(rgb).reshape(-1, 3)
+    return metrics[metric][0](rgb)
+
+
+def distance(rgb1, rgb2, metric='ciede2000'):
+    '''
+    Returns the distance between two rgb colors,
+    check `help(acrylic.Distance.distances)` for the supported metrics
+    '''
+    return float(distances(rgb1, [rgb2], metric)[0])
+
+
+def distances(rgb, others, metric='ciede2000'):
+    '''
+    Returns the distance from one color to every color in an array
+
+    Examples:
+        >>> from acrylic.Distance import distances
+        >>> distances([255, 0, 0], [[250, 5, 10], [0, 0, 255]], 'cie76')
+        array([  3.85390957, 176.31403909])
+
+    Args:
+        rgb:
+            iterable with 3 rgb values, the reference color
+        others:
+            (N, 3) array-like of rgb values, like `ColorArray().rgb`
+        metric(str, optional):
+            'rgb': euclidean distance between rgb values
+            'cie76': euclidean distance between CIELAB values
+            'cie94': CIE94 color difference, with `rgb` as the reference
+            'ciede2000': CIEDE2000 color difference
+            Default: 'ciede2000'
+
+    Returns:
+        numpy.ndarray of N floats
+
+    Raises:
+        ValueError: invalid metric
+    '''
+    distance = metrics[check_metric(metric)][1]
+    return distance(points(rgb, metric), points(others, metric))
+
+
+def iter_pairwise(rgb1, rgb2=None, metric='ciede2000', block_size=None):
+    '''
+    Computes the distance between every color in `rgb1` and every color in
+    `rgb2` one block of rows at a time, so that memory stays bounded no
+    matter how many colors there are. Yields `(start, block)` where `block`
+    holds the distances of `rgb1[start:start + len(block)]` to all of `rgb2`.
+    check `help(acrylic.Distance.pairwise)` for details
+    '''
+    distance = metrics[check_metric(metric)][1]
+    points1 = points(rgb1, metric)
+    points2 = points1 if rgb2 is None else points(rgb2, metric)
+
+    if block_size is None:
+        block_size = max(1, BLOCK_SIZE // max(1, len(points2)))
+
+    for start in range(0, len(points1), block_size):
+        block = points1[start:start + block_size, None, :]
+        yield start, distance(block, points2[None, :, :])
+
+
+def pairwise(rgb1, rgb2=None, metric='ciede2000', block_size=None, out=None):
+    '''
+    Returns the matrix of distances between every pair of colors
+
+    Examples:
+        >>> from acrylic.Distance import pairwise
+        >>> pairwise([[255, 0, 0], [250, 5, 10], [0, 0, 255]], metric='rgb')
+        array([[  0.        ,  12.24744871, 360.62445841],
+               [ 12.24744871,   0.        , 350.07142128],
+               [360.62445841, 350.07142128,   0.        ]])
+
+    Args:
+        rgb1:
+            (N, 3) array-like of rgb values, like `ColorArray().rgb`
+        rgb2(optional):
+            (M, 3) array-like of rgb values
+            Default: None, distances between the colors of `rgb1`
+        metric(str, optional):
+            same as for `acrylic.Distance.distances()`
+            Default: 'ciede2000'
+        block_size(int, optional):
+            number of rows computed at once
+            Default: None, as many rows as fit in `BLOCK_SIZE` distances
+        out(optional):
+            (N, M) float array to write the distances to, for example a
+            `numpy.memmap` when the matrix is too large for memory
+            Default: None, a new array is created
+
+    Returns:
+        numpy.ndarray of shape (N, M), or `out`
+
+    Raises:
+        ValueError: invalid metric
+    '''
+    if out is None:
+        rows = len(np.asarray(rgb1).reshape(-1, 3))
+        cols = rows if rgb2 is None else len(np.asarray(rgb2).reshape(-1, 3))
+        out = np.empty((rows, cols))
+
+    for start, block in iter_pairwise(rgb1, rgb2, metric, block_size):
+        out[start:start + len(block)] = block
+    return out
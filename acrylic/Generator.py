@@ -0,0 +1,115 @@
+import random
+
+from acrylic.Color import Color
+from acrylic.Defaults import SCHEMAS
+
+
+class ColorGenerator():
+    '''
+    Reproducible source of random colors
+
+    Every generator has its own random state, so colors picked with
+    `RANDOM` or ranges only depend on the seed and not on other uses of the
+    `random` module. Separate generators for parallel workers can be
+    created with `spawn()`.
+
+    Examples:
+        >>> from acrylic import ColorGenerator, RANDOM
+        >>> generator = ColorGenerator(seed=42)
+        >>> generator.color(hsl=[RANDOM, (20, 70), 62])
+        Color(hsl=(230.19, 21.25, 62.0))
+        >>> ColorGenerator(seed=42).color(hsl=[RANDOM, (20, 70), 62])
+        Color(hsl=(230.19, 21.25, 62.0))
+    '''
+
+    def __init__(self, seed=None):
+        '''
+        Args:
+            seed(optional):
+                any value accepted by `random.seed()`
+                Default: None, seeded from the operating system
+        '''
+        self.seed = seed
+        self.random = random.Random(seed)
+        self._numpy_random = None
+
+    def color(self, **kwargs):
+        '''
+        Create a `Color`, check `help(acrylic.Color.__init__)` for arguments
+        '''
+        return Color(rng=self.random, **kwargs)
+
+    def colors(self, count, **kwargs):
+        '''
+        Create a list of `count` colors from the same arguments
+        '''
+        return [Color(rng=self.random, **kwargs) for _ in range(count)]
+
+    @property
+    def numpy_random(self):
+        '''
+        (readonly) `numpy.random.Generator` used by `sample()` and `array()`
+
+        It is seeded from `seed` independently of `random`, so batches do not
+        change the colors picked one at a time and vice versa
+        '''
+        if self._numpy_random is None:
+            import numpy as np
+            seed = random.Random(self.seed).getrandbits(128)
+            self._numpy_random = np.random.default_rng(seed)
+        return self._numpy_random
+
+    def sample(self, count, **kwargs):
+        '''
+        Picks `count` colors at once, and returns their values as a numpy
+        array in the format they were given in. Accepts the same arguments
+        as `Color()`, including `RANDOM` and ranges.
+
+        Needs numpy, check `help(acrylic.Arrays.sample)` for details
+
+        Examples:
+            >>> generator = ColorGenerator(seed=42)
+            >>> generator.sample(1000000, hsl=[RANDOM, (20, 70), 62]).shape
+            (1000000, 3)
+        '''
+        from acrylic.Arrays import sample
+
+        colorspace, values = self._single(kwargs)
+        return sample(values, colorspace, count, self.numpy_random)
+
+    def array(self, count, **kwargs):
+        '''
+        Same as `sample()`, but returns a `ColorArray` of the colors
+        '''
+        from acrylic.ColorArray import ColorArray
+
+        colorspace, _ = self._single(kwargs)
+        return ColorArray(**{colorspace: self.sample(count, **kwargs)})
+
+    @staticmethod
+    def _single(kwargs):
+        if len(kwargs) != 1:
+            raise TypeError('expected a single keyword argument')
+        colorspace, values = list(kwargs.items())[0]
+        if colorspace not in SCHEMAS:
+            msg = f'got an unexpected keyword argument {colorspace!r}'
+            raise TypeError(msg)
+        return colorspace, values
+
+    def scheme(self, color, name, in_rgb=False, fuzzy=0):
+        '''
+        Returns a color scheme for `color` using this generator's random
+        state, check `help(acrylic.Color.scheme)` for arguments
+        '''
+        return color.scheme(name, in_rgb, fuzzy, rng=self.random)
+
+    def spawn(self, count):
+        '''
+        Returns `count` new independent generators, seeded from this one
+        '''
+        return [
+            type(self)(self.random.getrandbits(64)) for _ in range(count)
+        ]
+
+    def __repr__(self):
+        return f'{type(self).__name__}(seed={self.seed!r})'
@@ -0,0 +1,347 @@
+'''
+Gradients of colors interpolated in any colorspace
+
+Stops are interpolated in the values of a colorspace with components, like
+'oklab' (the default, which is perceptually uniform), 'lab', 'rgb' or
+'hsl', with straight lines or a smooth spline through all the stops. Hues
+of hsl, hsv and lch take the shorter way around the color wheel by
+default. Alpha is interpolated the same way as the other components.
+
+`iter_gradient()` creates the colors lazily one at a time, `gradient()`
+computes all of them at once as a numpy array, with the same values.
+
+Examples:
+    >>> from acrylic import Color
+    >>> from acrylic.Gradients import iter_gradient, gradient
+    >>> stops = [Color(name='red'), Color(name='blue')]
+    >>> list(iter_gradient(stops, 3, colorspace='hsl'))
+    [Color(hsl=(0.0, 100.0, 50.0)), Color(hsl=(300.0, 100.0, 50.0)),
+     Color(hsl=(240.0, 100.0, 50.0))]
+    >>> gradient(stops, 3, colorspace='hsl', dst='rgb')
+    array([[255,   0,   0],
+           [255,   0, 255],
+           [  0,   0, 255]], dtype=uint8)
+'''
+from bisect import bisect_right
+from collections import namedtuple
+
+from acrylic.Defaults import SCHEMAS, ALPHA
+from acrylic.Validators import check_datatype
+
+
+# (index of the hue, index of the component that is 0 when the hue has no
+# meaning, like the saturation of grays) of colorspaces with a hue
+HUES = {
+    'hsl': (0, 1),
+    'hsv': (0, 1),
+    'lch': (2, 1),
+}
+
+
+def shorter(delta, full):
+    if delta > full / 2:
+        return delta - full
+    if delta < -full / 2:
+        return delta + full
+    return delta
+
+
+def longer(delta, full):
+    if 0 < delta < full / 2:
+        return delta - full
+    if -full / 2 < delta <= 0:
+        return delta + full
+    return delta
+
+
+# how the difference between the hues of 2 stops is changed, so that
+# interpolation goes the intended way around the color wheel
+hue_modes = {
+    'shorter': shorter,
+    'longer': longer,
+    'increasing': lambda delta, full: delta + full if delta < 0 else delta,
+    'decreasing': lambda delta, full: delta - full if delta > 0 else delta,
+    'raw': lambda delta, full: delta,
+}
+
+
+def linear(positions, values):
+    # every segment is a line between 2 stops
+    return [
+        [(a, b - a, 0.0, 0.0) for a, b in zip(start, end)]
+        for start, end in zip(values, values[1:])
+    ]
+
+
+def spline(positions, values):
+    # cubic hermite spline through every stop (catmull-rom), the tangent at
+    # each stop is the slope between its neighbours
+    last = len(values) - 1
+    tangents = list()
+    for i in range(len(values)):
+        before, after = max(i - 1, 0), min(i + 1, last)
+        width = positions[after] - positions[before]
+        tangents.append([
+            (b - a) / width for a, b in zip(values[before], values[after])
+        ])
+
+    segments = list()
+    for i in range(last):
+        width = positions[i + 1] - positions[i]
+        segments.append([
+            (
+                p0,
+                width * m0,
+                3 * (p1 - p0) - width * (2 * m0 + m1),
+                2 * (p0 - p1) + width * (m0 + m1),
+            )
+            for p0, p1, m0, m1 in zip(
+                values[i], values[i + 1], tangents[i], tangents[i + 1]
+            )
+        ])
+    return segments
+
+
+# functions that return the (c0, c1, c2, c3) coefficients of the cubic
+# c0 + c1 * u + c2 * u ** 2 + c3 * u ** 3 of every component of every
+# segment between 2 stops, where u goes from 0 to 1 along the segment
+methods = {
+    'linear': linear,
+    'spline': spline,
+}
+
+
+Plan = namedtuple(
+    'Plan', 'colorspace cls positions widths segments hue precise'
+)
+
+
+def stop_values(stops, colorspace):
+    # values of every stop in `colorspace`, with alpha as the last one
+    values = [list(getattr(x, colorspace)) + [x.alpha] for x in stops]
+
+    if colorspace in HUES:
+        hue, chroma = HUES[colorspace]
+        colored = [x for x in values if x[chroma] != 0]
+
+        # stops without a hue use the hue of the previous stop, or of the
+        # first stop that has one, so that grays, black and white don't pull
+        # the hue towards red
+        if colored:
+            previous = colored[0][hue]
+            for x in values:
+                if x[chroma] == 0:
+                    x[hue] = previous
+                previous = x[hue]
+    return values
+
+
+def unwrap(values, index, mode, full):
+    # replaces hues by values that go the intended way between stops
+    for start, end in zip(values, values[1:]):
+        delta = hue_modes[mode](end[index] - start[index] % full, full)
+        end[index] = start[index] % full + delta
+
+
+def plan(stops, colorspace, method, hue, positions):
+    # everything needed to compute colors of a gradient, shared by
+    # `iter_gradient()` and `gradient()` so that both give the same values
+    if colorspace not in SCHEMAS:
+        raise ValueError(f'{colorspace!r} is not a valid colorspace')
+    if SCHEMAS[colorspace].validation_type != 'values':
+        msg = f'{colorspace!r} has no components to interpolate, use rgb'
+        raise ValueError(msg)
+    if method not in methods:
+        raise ValueError(f'{method!r} is not a valid interpolation method')
+    if hue not in hue_modes:
+        raise ValueError(f'{hue!r} is not a valid hue interpolation')
+
+    stops = list(stops)
+    if len(stops) < 2:
+        raise ValueError('a gradient needs at least 2 stops')
+
+    if positions is None:
+        positions = [i / (len(stops) - 1) for i in range(len(stops))]
+    else:
+        positions = [check_datatype(float, x, 'position') for x in positions]
+    if len(positions) != len(stops):
+        raise ValueError('there should be one position for every stop')
+    if any(a >= b for a, b in zip(positions, positions[1:])):
+        raise ValueError('positions should be increasing')
+
+    values = stop_values(stops, colorspace)
+    if colorspace in HUES:
+        index = HUES[colorspace][0]
+        full = SCHEMAS[colorspace].format[index][1]
+        unwrap(values, index, hue, full)
+
+    widths = [b - a for a, b in zip(positions, positions[1:])]
+    segments = methods[method](positions, values)
+    return Plan(
+        colorspace, type(stops[0]), positions, widths, segments,
+        HUES[colorspace][0] if colorspace in HUES else None,
+        type(stops[0]).precise,
+    )
+
+
+def check_steps(steps):
+    steps = check_datatype(int, steps, 'steps')
+    if steps < 1:
+        raise ValueError(f'{"steps"!r} should be at least 1')
+    return steps
+
+
+def finish(values, colorspace, hue, precise):
+    # wraps the hue and keeps the values of one color within valid ranges
+    schema = SCHEMAS[colorspace]
+    values = list(values)
+    for i, (a, b) in enumerate(schema.format + ((0, ALPHA.format[0][1]),)):
+        if i == hue:
+            values[i] = values[i] % b
+        else:
+            values[i] = min(max(values[i], a), b)
+
+    *values, alpha = values
+    if precise:
+        return schema.output_type(*values), alpha
+    if schema.input_type == int:
+        values = [round(x) for x in values]
+    else:
+        values = [round(x, schema.precision) for x in values]
+    return schema.output_type(*values), round(alpha, ALPHA.precision)
+
+
+def iter_gradient(stops, steps, colorspace='oklab', method='linear',
+                  hue='shorter', positions=None):
+    '''
+    Yields `steps` colors evenly spaced along a gradient, one at a time,
+    from the first stop to the last one
+
+    Examples:
+        >>> from acrylic import Color
+        >>> from acrylic.Gradients import iter_gradient
+        >>> stops = [Color(hex='#ff6b6b'), Color(hex='#4ecdc4')]
+        >>> for color in iter_gradient(stops, 1000, method='spline'):
+        ...     print(color.hex)
+
+    Args:
+        stops:
+            iterable of 2 or more `Color`, the colors are instances of the
+            class of the first one, so stops that are `PreciseColor` give
+            colors that are not rounded
+        steps(int):
+            number of colors
+        colorspace(str, optional):
+            colorspace the values are interpolated in, any colorspace other
+            than hex and name. Colors are created in this colorspace.
+            Default: 'oklab'
+        method(str, optional):
+            'linear': straight lines between stops
+            'spline': smooth cubic spline that goes through every stop
+            Default: 'linear'
+        hue(str, optional):
+            for hsl, hsv and lch, 'shorter' or 'longer' way around the
+            color wheel, always 'increasing' or 'decreasing' the hue, or
+            'raw' to interpolate the values of the hue as they are
+            Default: 'shorter'
+        positions(optional):
+            increasing position of every stop, between 0 and 1, colors
+            before the first stop and after the last one are the same as
+            that stop
+            Default: None, stops are evenly spaced
+
+    Yields:
+        Color
+
+    Raises:
+        TypeError, ValueError: invalid arguments
+    '''
+    plan_ = plan(stops, colorspace, method, hue, positions)
+    steps = check_steps(steps)
+    positions, widths, segments = plan_.positions, plan_.widths, plan_.segments
+    last = len(segments) - 1
+
+    for k in range(steps):
+        t = k / (steps - 1) if steps > 1 else 0.0
+        t = min(max(t, positions[0]), positions[-1])
+        i = min(bisect_right(positions, t) - 1, last)
+        u = (t - positions[i]) / widths[i]
+
+        values = [
+            ((c3 * u + c2) * u + c1) * u + c0 for c0, c1, c2, c3 in segments[i]
+        ]
+        value, alpha = finish(values, colorspace, plan_.hue, plan_.precise)
+        yield plan_.cls._from_trusted(colorspace, value, alpha)
+
+
+def gradient(stops, steps, colorspace='oklab', method='linear',
+             hue='shorter', positions=None, dst=None, alpha=False):
+    '''
+    Computes all the colors of a gradient at once, with the same values as
+    `iter_gradient()`. Needs numpy.
+
+    Examples:
+        >>> from acrylic import Color
+        >>> from acrylic.Gradients import gradient
+        >>> stops = [Color(hex='#ff6b6b'), Color(hex='#4ecdc4')]
+        >>> gradient(stops, 1000000, method='spline', dst='hex')[:2]
+        array(['#FF6B6B', '#FF6B6B'], dtype='<U7')
+
+    Args:
+        stops, steps, colorspace, method, hue, positions:
+            same as for `iter_gradient()`, values are always rounded
+        dst(str, optional):
+            colorspace of the returned values, check
+            `help(acrylic.Arrays.convert)` for their format
+            Default: None, the colorspace of the interpolation
+        alpha(bool, optional):
+            also return the (steps,) float array of alphas
+            Default: False
+
+    Returns:
+        numpy.ndarray of the values of the colors, or a tuple of the values
+        and alphas
+
+    Raises:
+        TypeError, ValueError: invalid arguments
+    '''
+    import numpy as np
+    from acrylic.Arrays import convert_valid, round_array
+
+    plan_ = plan(stops, colorspace, method, hue, positions)
+    steps = check_steps(steps)
+    if dst is not None and dst not in SCHEMAS:
+        raise ValueError(f'{dst!r} is not a valid colorspace')
+
+    positions = np.array(plan_.positions)
+    widths = np.array(plan_.widths)
+    segments = np.array(plan_.segments)
+
+    t = np.arange(steps) / (steps - 1) if steps > 1 else np.zeros(1)
+    t = np.clip(t, positions[0], positions[-1])
+    i = np.minimum(np.searchsorted(positions, t, 'right') - 1,
+                   len(widths) - 1)
+    u = ((t - positions[i]) / widths[i])[:, None]
+
+    c0, c1, c2, c3 = np.moveaxis(segments[i], -1, 0)
+    values = ((c3 * u + c2) * u + c1) * u + c0
+
+    # same as `finish()` for every color
+    schema = SCHEMAS[colorspace]
+    limits = schema.format + ((0, ALPHA.format[0][1]),)
+    for j, (a, b) in enumerate(limits):
+        if j == plan_.hue:
+            values[:, j] = np.mod(values[:, j], b)
+        else:
+            values[:, j] = np.clip(values[:, j], a, b)
+
+    values, alphas = values[:, :-1], round_array(values[:, -1],
+                                                  ALPHA.precision)
+    if schema.input_type == int:
+        values = np.rint(values).astype(np.uint8)
+    else:
+        values = round_array(values, schema.precision)
+
+    if dst is not None:
+        values = convert_valid(values, colorspace, dst)
+    return (values, alphas) if alpha else values
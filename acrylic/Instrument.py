@@ -0,0 +1,241 @@
+'''
+Opt-in instrumentation of validation, conversions, lazy properties and
+color schemes
+
+When enabled, the validators, every function in the conversion tables of
+`acrylic.Converters`, the lazy properties of `Color` and its subclasses and
+`Color().scheme()` are wrapped to count calls and add up the time spent in
+them. Nothing is wrapped while disabled, so there is no overhead at all.
+
+Times are inclusive, the time of a property that has to be converted also
+contains the time of the conversion functions it calls.
+
+Examples:
+    >>> from acrylic import Instrument, Color
+    >>> Instrument.enable()
+    >>> color = Color(hex='#80ffd4')
+    >>> _ = color.hsl, color.hsl
+    >>> Instrument.info()['property.hsl']
+    PropertyStats(calls=2, conversions=1, seconds=1.5e-05)
+    >>> Instrument.info()['rgb_to.hsl']
+    Stats(calls=1, seconds=4.2e-06)
+    >>> Instrument.disable()
+
+To export the metrics as they happen, add a callback that gets the name
+and duration of every call:
+    >>> Instrument.subscribe(lambda name, seconds: histogram.observe(...))
+'''
+import threading
+from time import perf_counter
+from collections import namedtuple
+
+from acrylic.Color import Color
+from acrylic.Defaults import SCHEMAS
+from acrylic.Validators import validators
+from acrylic import Converters
+
+
+Stats = namedtuple('Stats', 'calls seconds')
+PropertyStats = namedtuple('PropertyStats', 'calls conversions seconds')
+
+
+class Timer():
+    '''
+    Thread-safe counter of calls and of the total time spent in them
+    '''
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = self.conversions = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, seconds, conversion=True):
+        with self._lock:
+            self.calls += 1
+            if conversion:
+                self.conversions += 1
+                self.seconds += seconds
+        if conversion:
+            for callback in callbacks:
+                callback(self.name, seconds)
+
+    def clear(self):
+        with self._lock:
+            self.calls = self.conversions = 0
+            self.seconds = 0.0
+
+
+def timed(function, timer):
+    # wraps `function` to add the time of every call to `timer`
+    def wrapper(*args, **kwargs):
+        # looked up on every call, see `acrylic.Converters.unwrap()`
+        function = wrapper.__wrapped__
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timer.add(perf_counter() - start)
+
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    wrapper.timer = timer
+    return wrapper
+
+
+def timed_property(prop, attr, cls, timer):
+    # wraps a lazy property of `cls` to count every access, and the time
+    # of the accesses that have to convert the value
+    get_slot = getattr(cls, f'_{attr}').__get__
+    fget = prop.fget
+
+    def getter(instance):
+        if get_slot(instance) is not None:
+            timer.add(0.0, conversion=False)
+            return fget(instance)
+
+        start = perf_counter()
+        try:
+            return fget(instance)
+        finally:
+            timer.add(perf_counter() - start)
+
+    wrapper = property(getter, prop.fset, doc=prop.__doc__)
+    getter.__wrapped__ = prop
+    getter.timer = timer
+    return wrapper
+
+
+def tables():
+    # (prefix, table) of every dispatch table with functions to wrap
+    yield 'rgb_to', Converters.rgb_to
+    yield 'rgb_from', Converters.rgb_from
+    yield 'direct', Converters.direct
+    yield 'precise_rgb_to', Converters.precise_rgb_to
+    yield 'precise_rgb_from', Converters.precise_rgb_from
+    yield 'precise_direct', Converters.precise_direct
+    yield 'validate', validators
+
+
+def key_name(key):
+    return '_to_'.join(key) if isinstance(key, tuple) else key
+
+
+def classes(cls=Color):
+    # Color and all its subclasses that currently exist
+    yield cls
+    for subclass in cls.__subclasses__():
+        yield from classes(subclass)
+
+
+timers = dict()
+callbacks = list()
+
+# (object, key, original, wrapper) of everything that was wrapped
+wrapped = list()
+
+
+def get_timer(name):
+    if name not in timers:
+        timers[name] = Timer(name)
+    return timers[name]
+
+
+def enable():
+    '''
+    Enable instrumentation and reset all counters
+
+    Only subclasses of `Color` that exist when this is called are
+    instrumented. `acrylic.Cache` can be enabled and disabled in any order
+    with this.
+    '''
+    disable()
+    for prefix, table in tables():
+        for key in list(table):
+            name = f'{prefix}.{key_name(key)}'
+            wrapper = timed(table[key], get_timer(name))
+            wrapped.append((table, key, table[key], wrapper))
+            table[key] = wrapper
+
+    for cls in classes():
+        for attr in SCHEMAS:
+            if attr in vars(cls):
+                prop = vars(cls)[attr]
+                name = f'property.{attr}'
+                wrapper = timed_property(prop, attr, cls, get_timer(name))
+                wrapped.append((cls, attr, prop, wrapper))
+                setattr(cls, attr, wrapper)
+
+        if 'scheme' in vars(cls):
+            function = vars(cls)['scheme']
+            wrapper = timed(function, get_timer('scheme'))
+            wrapped.append((cls, 'scheme', function, wrapper))
+            setattr(cls, 'scheme', wrapper)
+
+
+def disable():
+    '''
+    Disable instrumentation and drop all counters, callbacks are kept
+    '''
+    for owner, key, original, wrapper in reversed(wrapped):
+        if isinstance(owner, dict):
+            Converters.unwrap(owner, key, wrapper)
+        elif vars(owner).get(key) is wrapper:
+            setattr(owner, key, original)
+    wrapped.clear()
+    timers.clear()
+
+
+def enabled():
+    '''
+    Returns True if instrumentation is enabled
+    '''
+    return bool(wrapped)
+
+
+def clear():
+    '''
+    Reset all counters to 0, instrumentation stays enabled
+    '''
+    for item in timers.values():
+        item.clear()
+
+
+def info():
+    '''
+    Returns a dict with the counters of every instrumented function, empty
+    when instrumentation is disabled:
+        `Stats(calls, seconds)` for validators and conversion functions
+        (like 'validate.values', 'rgb_to.hsl', 'direct.hsl_to_hsv') and for
+        'scheme'
+        `PropertyStats(calls, conversions, seconds)` for the lazy properties
+        of colors (like 'property.hsl'), where calls counts every access,
+        and conversions and seconds only count accesses that had to convert
+        the value because it was not cached yet
+    '''
+    stats = dict()
+    for name, item in timers.items():
+        if name.startswith('property.'):
+            stats[name] = PropertyStats(
+                item.calls, item.conversions, item.seconds
+            )
+        else:
+            stats[name] = Stats(item.calls, item.seconds)
+    return stats
+
+
+def subscribe(callback):
+    '''
+    Add a function that is called as `callback(name, seconds)` after every
+    instrumented call, with the same names as `info()`. Accesses of
+    properties that were already converted are not reported.
+    '''
+    callbacks.append(callback)
+
+
+def unsubscribe(callback):
+    '''
+    Remove a function added with `subscribe()`
+    '''
+    callbacks.remove(callback)
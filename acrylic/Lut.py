@@ -0,0 +1,244 @@
+'''
+Precomputed lookup tables for conversions from rgb
+
+There are only 256 ** 3 possible rgb colors, so every conversion from rgb
+can be stored in a table indexed by the packed 0xRRGGBB value of a color.
+Tables are built once, saved to disk and loaded using `mmap`, so processes
+that use the same tables share a single copy of them in memory.
+
+Build tables and check them against the scalar converters:
+    python -m acrylic.Lut build /path/to/tables
+    python -m acrylic.Lut verify /path/to/tables
+'''
+import os
+import json
+import struct
+import argparse
+
+import numpy as np
+
+from acrylic import __version__
+from acrylic.Defaults import SCHEMAS
+from acrylic.Converters import rgb_to as scalar_rgb_to
+from acrylic.Arrays import rgb_to, pack, unpack, validate
+from acrylic.Nearest import get_index
+from acrylic.color_names import color_names_reverse
+
+
+MAGIC = b'ACRYLUT1'
+SIZE = (SCHEMAS['rgb'].format.r[1] + 1) ** 3
+CHUNK_SIZE = 1 << 20
+
+TABLES = ['hsl', 'hsv', 'ryb', 'name', 'nearest_rgb', 'nearest_cie76']
+DEFAULT_TABLES = ['hsl', 'hsv', 'ryb', 'name', 'nearest_rgb']
+
+
+def encoder(table):
+    # returns (function that computes encoded values for an array of rgb
+    # colors, numpy dtype, number of columns, header with decoding info)
+    if table in ('hsl', 'hsv'):
+        scale = 10 ** SCHEMAS[table].precision
+        largest = max(b for a, b in SCHEMAS[table].format) * scale
+        dtype = np.uint16 if largest < 2 ** 16 else np.uint32
+
+        def encode(rgb):
+            return np.rint(rgb_to[table](rgb) * scale)
+        return encode, dtype, 3, {'scale': scale}
+
+    if table == 'ryb':
+        return rgb_to[table], np.uint8, 3, {}
+
+    if table == 'name':
+        names = np.array(sorted(set(color_names_reverse.values()) | {'-'}))
+
+        def encode(rgb):
+            return np.searchsorted(names, rgb_to['name'](rgb))
+        return encode, np.uint8, 1, {'names': names.tolist()}
+
+    if table.startswith('nearest_'):
+        index = get_index(table[len('nearest_'):])
+        return index.query, np.uint8, 1, {'names': index.names.tolist()}
+
+    raise ValueError(f'{table!r} is not a valid lookup table')
+
+
+def scalar_converter(table):
+    # the function each table is checked against in `Lut.verify()`
+    if not table.startswith('nearest_'):
+        return scalar_rgb_to[table]
+
+    # check against a linear scan over all names instead of the grid index
+    # the table was built with
+    index = get_index(table[len('nearest_'):])
+
+    def nearest(rgb):
+        distances = index.distance(index.space([rgb]), index.points)
+        return index.names[distances.argmin()]
+    return nearest
+
+
+def path_for(directory, table):
+    return os.path.join(directory, f'{table}.lut')
+
+
+def build(directory, tables=DEFAULT_TABLES):
+    '''
+    Builds lookup tables and saves them in `directory`, one file per table
+
+    Each file has a small header followed by the raw values of the table:
+        - 8 bytes magic `ACRYLUT1`
+        - 4 bytes little-endian length of the json header
+        - json header with the table name, dtype, shape and decoding info
+        - padding to align values to 64 bytes
+        - values of the table in native byte order, indexed by 0xRRGGBB
+    '''
+    os.makedirs(directory, exist_ok=True)
+
+    for table in tables:
+        encode, dtype, width, info = encoder(table)
+        header = dict(
+            info, table=table, dtype=np.dtype(dtype).str,
+            shape=[SIZE, width], version=__version__,
+        )
+        header = json.dumps(header).encode()
+        offset = -(-(len(MAGIC) + 4 + len(header)) // 64) * 64
+
+        path = path_for(directory, table)
+        with open(path, 'wb') as f:
+            f.write(MAGIC + struct.pack('<I', len(header)) + header)
+            f.write(b'\0' * (offset - f.tell()))
+
+            for start in range(0, SIZE, CHUNK_SIZE):
+                keys = np.arange(start, min(start + CHUNK_SIZE, SIZE))
+                values = encode(unpack(keys)).astype(dtype)
+                f.write(values.reshape(-1, width).tobytes())
+
+
+def read_header(path):
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'{path!r} is not a valid lookup table')
+        length, = struct.unpack('<I', f.read(4))
+        header = json.loads(f.read(length).decode())
+    header['offset'] = -(-(len(MAGIC) + 4 + length) // 64) * 64
+    return header
+
+
+class Lut():
+    '''
+    Lookup tables loaded from a directory created by `acrylic.Lut.build()`
+
+    Examples:
+        >>> from acrylic.Lut import Lut
+        >>> lut = Lut('/path/to/tables')
+        >>> lut.convert([[83, 237, 229], [255, 0, 0]], 'hsl')
+        array([[176.88,  81.05,  62.75],
+               [  0.  , 100.  ,  50.  ]])
+
+    Results are identical to `acrylic.Arrays.convert(rgb, 'rgb', dst)`, and
+    for nearest_<metric> to `acrylic.Nearest.nearest_names(rgb, metric)`.
+    '''
+
+    def __init__(self, directory, tables=None):
+        self.directory = directory
+        self.tables = dict()
+
+        if tables is None:
+            tables = [x for x in TABLES
+                      if os.path.exists(path_for(directory, x))]
+
+        for table in tables:
+            path = path_for(directory, table)
+            header = read_header(path)
+            values = np.memmap(
+                path, dtype=np.dtype(header['dtype']), mode='r',
+                offset=header['offset'], shape=tuple(header['shape']),
+            )
+            self.tables[table] = (values, header)
+
+    def convert(self, rgb, dst):
+        '''
+        Converts an (N, 3) array of rgb colors to `dst` using a lookup table
+
+        Raises:
+            ValueError: table is not loaded, or invalid shape or rgb values
+        '''
+        if dst not in self.tables:
+            raise ValueError(f'lookup table for {dst!r} is not loaded')
+
+        values, header = self.tables[dst]
+        result = values[pack(validate(rgb, 'rgb'))]
+
+        if 'scale' in header:
+            return result / header['scale']
+        if 'names' in header:
+            return np.array(header['names'])[result[:, 0]]
+        return np.array(result)
+
+    def verify(self, sample=100000, seed=0):
+        '''
+        Compares tables with the scalar converters in `acrylic.Converters`
+        for `sample` random colors, or for every color if `sample` is None.
+        Returns a dict with the number of mismatches for each table.
+        '''
+        if sample is None:
+            keys = np.arange(SIZE)
+        else:
+            keys = np.random.default_rng(seed).integers(0, SIZE, sample)
+            keys = np.concatenate([keys, [0, SIZE - 1]])
+
+        mismatches = dict()
+        for table in self.tables:
+            scalar = scalar_converter(table)
+            mismatches[table] = 0
+            for start in range(0, len(keys), CHUNK_SIZE):
+                rgbs = unpack(keys[start:start + CHUNK_SIZE])
+                result = self.convert(rgbs, table).tolist()
+                for rgb, value in zip(map(tuple, rgbs.tolist()), result):
+                    expected = scalar(rgb)
+                    if isinstance(value, list):
+                        value, expected = tuple(value), tuple(expected)
+                    mismatches[table] += value != expected
+
+        return mismatches
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m acrylic.Lut',
+        description='build and verify lookup tables for rgb conversions',
+    )
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    build_parser = commands.add_parser('build', help='build lookup tables')
+    build_parser.add_argument('directory')
+    build_parser.add_argument(
+        '--tables', nargs='+', choices=TABLES, default=DEFAULT_TABLES
+    )
+
+    verify_parser = commands.add_parser(
+        'verify', help='check lookup tables against the scalar converters'
+    )
+    verify_parser.add_argument('directory')
+    verify_parser.add_argument('--sample', type=int, default=100000)
+    verify_parser.add_argument(
+        '--full', action='store_true', help='check all 16777216 colors'
+    )
+
+    args = parser.parse_args(args)
+
+    if args.command == 'build':
+        build(args.directory, args.tables)
+        return 0
+
+    mismatches = Lut(args.directory).verify(
+        sample=None if args.full else args.sample
+    )
+    for table, count in mismatches.items():
+        print(f'{table}: {"ok" if not count else f"{count} mismatches"}')
+    return 1 if any(mismatches.values()) else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
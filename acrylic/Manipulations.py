@@ -0,0 +1,308 @@
+from acrylic.Defaults import SCHEMAS, ALPHA
+from acrylic.Validators import in_range, check_datatype
+
+
+HSL = SCHEMAS['hsl']
+RGB = SCHEMAS['rgb']
+
+# index of the hsl component changed by each adjustment
+HUE, SATURATION, LIGHTNESS = range(3)
+
+
+# every blend mode works on backdrop and source rgb values from 0.0 to 1.0,
+# with arithmetic only so that it works the same on floats and numpy arrays
+blend_modes = {
+    'multiply': lambda b, s: b * s,
+    'screen': lambda b, s: b + s - b * s,
+    'overlay': lambda b, s: (
+        (b <= 0.5) * (2 * b * s) + (b > 0.5) * (1 - 2 * (1 - b) * (1 - s))
+    ),
+}
+
+
+def check_blend_mode(mode):
+    if mode not in blend_modes:
+        raise ValueError(f'{mode!r} is not a valid blend mode')
+    return mode
+
+
+def check_amount(amount, component):
+    # amounts added to or removed from a component are within its range
+    a, b = HSL.format[component]
+    amount = check_datatype(float, amount, 'amount')
+    return in_range(amount, 0, b - a, 'amount')
+
+
+def check_weight(weight):
+    weight = check_datatype(float, weight, 'weight')
+    return in_range(weight, 0, 1, 'weight')
+
+
+def adjust(self, component, delta):
+    # copy of the color with `delta` added to one of its hsl components,
+    # hue wraps around while saturation and lightness stay within range
+    Color = type(self)
+    values = list(self.hsl)
+    a, b = HSL.format[component]
+
+    if component == HUE:
+        values[component] = (values[component] + delta) % b
+    else:
+        values[component] = min(max(values[component] + delta, a), b)
+
+    if not Color.precise:
+        values[component] = round(values[component], HSL.precision)
+    return Color._from_trusted('hsl', HSL.output_type(*values), self.alpha)
+
+
+def lighten(self, amount):
+    '''
+    Returns a lighter copy of this color
+
+    Args:
+        amount(float):
+            0.0 <= amount <= 100.0, added to the hsl lightness, which stays
+            within 0.0 - 100.0
+
+    Returns:
+        Color, with the same alpha
+    '''
+    return adjust(self, LIGHTNESS, check_amount(amount, LIGHTNESS))
+
+
+def darken(self, amount):
+    '''
+    Returns a darker copy of this color, same as `lighten()` but `amount`
+    is subtracted from the lightness
+    '''
+    return adjust(self, LIGHTNESS, -check_amount(amount, LIGHTNESS))
+
+
+def saturate(self, amount):
+    '''
+    Returns a more saturated copy of this color
+
+    Args:
+        amount(float):
+            0.0 <= amount <= 100.0, added to the hsl saturation, which stays
+            within 0.0 - 100.0
+
+    Returns:
+        Color, with the same alpha
+    '''
+    return adjust(self, SATURATION, check_amount(amount, SATURATION))
+
+
+def desaturate(self, amount):
+    '''
+    Returns a less saturated copy of this color, same as `saturate()` but
+    `amount` is subtracted from the saturation
+    '''
+    return adjust(self, SATURATION, -check_amount(amount, SATURATION))
+
+
+def rotate_hue(self, degrees):
+    '''
+    Returns a copy of this color with its hsl hue rotated by `degrees`,
+    which can be negative
+
+    Returns:
+        Color, with the same alpha
+    '''
+    return adjust(self, HUE, check_datatype(float, degrees, 'degrees'))
+
+
+def mix(self, other, weight=0.5):
+    '''
+    Returns a mix of the rgb values and alphas of this color and `other`
+
+    Args:
+        other(Color):
+            the color to mix with
+        weight(float, optional):
+            0.0 <= weight <= 1.0, the fraction of this color in the mix
+            Default: 0.5
+
+    Returns:
+        Color
+    '''
+    Color = type(self)
+    weight = check_weight(weight)
+    rgb = [
+        weight * x + (1 - weight) * y for x, y in zip(self.rgb, other.rgb)
+    ]
+    alpha = weight * self.alpha + (1 - weight) * other.alpha
+
+    if not Color.precise:
+        rgb = [round(x) for x in rgb]
+        alpha = round(alpha, ALPHA.precision)
+    return Color._from_trusted('rgb', RGB.output_type(*rgb), alpha)
+
+
+def blend(self, backdrop, mode='multiply'):
+    '''
+    Returns this color blended on top of `backdrop` with a separable blend
+    mode, which combines their rgb values
+
+    Args:
+        backdrop(Color):
+            the color below this one
+        mode(str, optional):
+            'multiply': darkens, white is neutral
+            'screen': lightens, black is neutral
+            'overlay': multiplies dark and screens light parts of backdrop
+            Default: 'multiply'
+
+    Returns:
+        Color, with the alpha of this color
+
+    Raises:
+        ValueError: invalid mode
+    '''
+    Color = type(self)
+    function = blend_modes[check_blend_mode(mode)]
+    m = RGB.format.r[1]
+    rgb = [function(b / m, s / m) * m for s, b in zip(self.rgb, backdrop.rgb)]
+
+    if not Color.precise:
+        rgb = [round(x) for x in rgb]
+    return Color._from_trusted('rgb', RGB.output_type(*rgb), self.alpha)
+
+
+# - - - - - - - - - - - - - -
+
+
+def rgb_values(colors, param):
+    # (N, 3) rgb values of a `ColorArray` or an array-like of rgb values of
+    # shape (..., 3), like the pixels of an image, and that shape
+    import numpy as np
+    from acrylic.Arrays import validate
+
+    rgb = np.asarray(getattr(colors, 'rgb', colors))
+    if rgb.shape[-1:] != (3,):
+        raise ValueError(f'{param!r} should be an array of shape (..., 3)')
+    return validate(rgb.reshape(-1, 3), 'rgb'), rgb.shape
+
+
+def amounts(amount, limits, param):
+    # array of one amount for all colors or one for every color
+    import numpy as np
+
+    amount = np.asarray(amount, dtype=np.float64)
+    if limits and ((amount < limits[0]) | (amount > limits[1])).any():
+        raise ValueError(f'{param!r} should be in range {limits[0]} - '
+                         f'{limits[1]}')
+    return amount
+
+
+def adjust_many(colors, component, amount, sign=1):
+    import numpy as np
+    from acrylic.Arrays import rgb_to, rgb_from, round_array
+
+    rgb, shape = rgb_values(colors, 'colors')
+    a, b = HSL.format[component]
+    if component == HUE:
+        delta = amounts(amount, None, 'degrees')
+    else:
+        delta = sign * amounts(amount, (0, b - a), 'amount')
+
+    hsl = rgb_to['hsl'](rgb)
+    values = hsl[:, component] + np.broadcast_to(delta, shape[:-1]).ravel()
+    if component == HUE:
+        values = np.mod(values, b)
+    else:
+        values = np.clip(values, a, b)
+    hsl[:, component] = round_array(values, HSL.precision)
+    return rgb_from['hsl'](hsl).reshape(shape)
+
+
+def lighten_many(colors, amount):
+    '''
+    Lightens many colors at once, the same as calling `Color().lighten()`
+    for each of them without creating any `Color`. Needs numpy.
+
+    Examples:
+        >>> from acrylic.Manipulations import lighten_many
+        >>> lighten_many([[83, 237, 229], [255, 0, 0]], 10)
+        array([[129, 242, 236],
+               [255,  51,  51]], dtype=uint8)
+
+    Args:
+        colors:
+            `ColorArray` or array-like of rgb values of shape (..., 3), like
+            a palette or the pixels of an image
+        amount:
+            same as for `Color().lighten()`, or an array with an amount for
+            every color
+
+    Returns:
+        numpy.ndarray of rgb values, uint8 of the same shape as `colors`
+
+    Raises:
+        ValueError: invalid shape, rgb values or amount
+    '''
+    return adjust_many(colors, LIGHTNESS, amount)
+
+
+def darken_many(colors, amount):
+    '''
+    Vectorized `Color().darken()`, check `lighten_many()` for details
+    '''
+    return adjust_many(colors, LIGHTNESS, amount, sign=-1)
+
+
+def saturate_many(colors, amount):
+    '''
+    Vectorized `Color().saturate()`, check `lighten_many()` for details
+    '''
+    return adjust_many(colors, SATURATION, amount)
+
+
+def desaturate_many(colors, amount):
+    '''
+    Vectorized `Color().desaturate()`, check `lighten_many()` for details
+    '''
+    return adjust_many(colors, SATURATION, amount, sign=-1)
+
+
+def rotate_hue_many(colors, degrees):
+    '''
+    Vectorized `Color().rotate_hue()`, check `lighten_many()` for details
+    '''
+    return adjust_many(colors, HUE, degrees)
+
+
+def mix_many(colors, others, weight=0.5):
+    '''
+    Vectorized `Color().mix()` of the rgb values of `colors` and `others`,
+    which are broadcast together, so either can be a single color. Check
+    `lighten_many()` for details, `weight` can also be an array with a
+    weight for every color.
+    '''
+    import numpy as np
+
+    rgb, shape = rgb_values(colors, 'colors')
+    other_rgb, other_shape = rgb_values(others, 'others')
+    rgb, other_rgb = rgb.reshape(shape), other_rgb.reshape(other_shape)
+
+    weight = amounts(weight, (0, 1), 'weight')[..., None]
+    mixed = weight * rgb + (1 - weight) * other_rgb
+    return np.rint(mixed).astype(np.uint8)
+
+
+def blend_many(colors, backdrops, mode='multiply'):
+    '''
+    Vectorized `Color().blend()` of `colors` on top of `backdrops`, which
+    are broadcast together. Check `lighten_many()` for details.
+    '''
+    import numpy as np
+
+    function = blend_modes[check_blend_mode(mode)]
+    rgb, shape = rgb_values(colors, 'colors')
+    backdrop_rgb, backdrop_shape = rgb_values(backdrops, 'backdrops')
+
+    m = RGB.format.r[1]
+    blended = function(
+        backdrop_rgb.reshape(backdrop_shape) / m, rgb.reshape(shape) / m
+    )
+    return np.rint(blended * m).astype(np.uint8)
@@ -0,0 +1,151 @@
+import numpy as np
+
+from acrylic.Defaults import SCHEMAS
+from acrylic.color_names import color_names_reverse
+from acrylic.Distance import metrics, euclidean_metrics, check_metric
+
+
+GRID_SIZE = 32
+CHUNK_SIZE = 32768
+
+
+class NameIndex():
+    '''
+    Spatial index over all CSS3 color names, to find the nearest name for
+    any color
+
+    For euclidean metrics ('rgb', 'cie76'), the space is divided in a grid
+    and every cell stores the few names that can possibly be the nearest to
+    a color within that cell. A query then only measures the distances to
+    those candidates instead of to every name. 'cie94' and 'ciede2000' are
+    not euclidean, so all names are checked, in vectorized chunks.
+    '''
+
+    def __init__(self, metric='rgb'):
+        self.metric = check_metric(metric)
+        self.space, self.distance = metrics[metric]
+
+        self.names = np.array(list(color_names_reverse.values()))
+        self.points = self.space(list(color_names_reverse.keys()))
+
+        if metric in euclidean_metrics:
+            self._build_grid()
+        else:
+            self.candidates = None
+
+    def _build_grid(self):
+        # bounds of the grid are the bounds of the whole rgb cube in the
+        # metric's space, so that every possible color falls inside
+        rgb_max = SCHEMAS['rgb'].format.r[1]
+        cube = np.stack(np.meshgrid(*[np.linspace(0, rgb_max, 33)] * 3), -1)
+        cube = self.space(cube.reshape(-1, 3))
+        self.low = cube.min(axis=0) - 1e-6
+        self.cell = (cube.max(axis=0) + 1e-6 - self.low) / GRID_SIZE
+
+        # lower and upper corners of every cell
+        index = np.indices((GRID_SIZE,) * 3).reshape(3, -1).T
+        lower = self.low + index * self.cell
+        upper = lower + self.cell
+
+        # a name can only be the nearest for some color in a cell if its
+        # minimum distance to the cell is <= the smallest maximum distance
+        # of any name to that cell
+        points = self.points[None, :, :]
+        lower, upper = lower[:, None, :], upper[:, None, :]
+        nearest = np.clip(points, lower, upper)
+        farthest = np.where(points - lower > upper - points, lower, upper)
+        dmin = np.sqrt(np.sum((points - nearest) ** 2, axis=-1))
+        dmax = np.sqrt(np.sum((points - farthest) ** 2, axis=-1))
+        possible = dmin <= dmax.min(axis=1, keepdims=True) + 1e-9
+
+        # pad candidates of every cell to the same length by repeating the
+        # first candidate, candidates stay in the order of self.points
+        count = possible.sum(axis=1)
+        order = np.argsort(~possible, axis=1, kind='stable')
+        order = order[:, :count.max()]
+        padding = np.arange(order.shape[1]) >= count[:, None]
+        self.candidates = np.where(padding, order[:, :1], order)
+        self.axes = [np.ascontiguousarray(x) for x in self.points.T]
+
+    def query(self, rgb):
+        '''
+        Return index into `self.names` of the nearest name for an (N, 3)
+        array of rgb colors
+        '''
+        rgb = np.asarray(rgb).reshape(-1, 3)
+        result = np.empty(len(rgb), dtype=np.intp)
+
+        for start in range(0, len(rgb), CHUNK_SIZE):
+            chunk = self.space(rgb[start:start + CHUNK_SIZE])
+
+            if self.candidates is None:
+                distances = self.distance(chunk[:, None, :], self.points)
+                result[start:start + CHUNK_SIZE] = distances.argmin(axis=1)
+                continue
+
+            cell = ((chunk - self.low) // self.cell).astype(np.intp)
+            cell = np.clip(cell, 0, GRID_SIZE - 1)
+            cell = np.ravel_multi_index(cell.T, (GRID_SIZE,) * 3)
+
+            # compare one column of candidates at a time, this keeps every
+            # operation on flat arrays instead of (N, candidates, 3) arrays
+            best = np.full(len(chunk), np.inf)
+            nearest = np.zeros(len(chunk), dtype=np.intp)
+            for candidate in self.candidates[cell].T:
+                distance = sum(
+                    (self.axes[i][candidate] - chunk[:, i]) ** 2
+                    for i in range(3)
+                )
+                closer = distance < best
+                best = np.where(closer, distance, best)
+                nearest = np.where(closer, candidate, nearest)
+            result[start:start + CHUNK_SIZE] = nearest
+
+        return result
+
+
+# indexes are built once for each metric when they are first needed
+indexes = dict()
+
+
+def get_index(metric):
+    if metric not in indexes:
+        indexes[metric] = NameIndex(metric)
+    return indexes[metric]
+
+
+def nearest_names(rgb, metric='rgb'):
+    '''
+    Returns the nearest CSS3 color name for every color in an array
+
+    Examples:
+        >>> from acrylic.Nearest import nearest_names
+        >>> nearest_names([[120, 250, 210], [250, 5, 10]])
+        array(['aquamarine', 'red'], dtype='<U20')
+
+    Args:
+        rgb:
+            (N, 3) array-like of rgb values
+        metric(str, optional):
+            'rgb': euclidean distance between rgb values
+            'cie76': euclidean distance between CIELAB values
+            'cie94': CIE94 color difference
+            'ciede2000': CIEDE2000 color difference
+            Default: 'rgb'
+
+    Returns:
+        numpy.ndarray of N strings
+
+    Raises:
+        ValueError: invalid metric
+    '''
+    index = get_index(check_metric(metric))
+    return index.names[index.query(rgb)]
+
+
+def nearest_name(rgb, metric='rgb'):
+    '''
+    Returns the nearest CSS3 color name for a single rgb color,
+    check `help(acrylic.Nearest.nearest_names)` for details
+    '''
+    return str(nearest_names([rgb], metric)[0])
@@ -0,0 +1,280 @@
+'''
+Extract palettes of the most representative colors from images
+
+Pixels are first reduced to a histogram of 32768 bins (5 bits for each of
+r, g and b), which keeps the exact mean color and pixel count of every bin.
+The quantizers only work on these bins instead of every pixel, so even
+images with millions of pixels take a fraction of a second.
+
+Examples:
+    >>> from acrylic.Palette import extract
+    >>> image = numpy.array(PIL.Image.open('photo.jpg').convert('RGB'))
+    >>> extract(image, count=3, method='kmeans')
+    [Swatch(color=Color(rgb=(32, 41, 57)), weight=0.5213),
+     Swatch(color=Color(rgb=(196, 148, 93)), weight=0.3025),
+     Swatch(color=Color(rgb=(236, 229, 214)), weight=0.1762)]
+'''
+from collections import namedtuple
+
+import numpy as np
+
+from acrylic.Color import Color
+
+
+Swatch = namedtuple('Swatch', 'color weight')
+
+BITS = 5
+BATCH_SIZE = 1024
+ITERATIONS = 100
+
+
+def pixels(data):
+    # (N, 3) uint8 array of rgb values from a buffer of packed rgb values,
+    # or an array of shape (..., 3) or (..., 4) where alpha is ignored
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = np.frombuffer(data, dtype=np.uint8)
+        if len(data) % 3:
+            raise ValueError('buffer size should be a multiple of 3')
+        return data.reshape(-1, 3)
+
+    data = np.asarray(data)
+    if data.ndim < 2 or data.shape[-1] not in (3, 4):
+        msg = f'pixels should have 3 or 4 channels, got shape {data.shape}'
+        raise ValueError(msg)
+    if data.dtype != np.uint8:
+        if data.size and (data.min() < 0 or data.max() > 255):
+            raise ValueError('pixel values should be between 0 and 255')
+        data = data.astype(np.uint8)
+    return data.reshape(-1, data.shape[-1])[:, :3]
+
+
+def histogram(rgb):
+    # returns (mean rgb of every non empty bin, pixel count of every bin)
+    # uint16 is enough for the 15 bit keys and faster than larger ints
+    shift = 8 - BITS
+    key = rgb[:, 0].astype(np.uint16) >> shift
+    for i in (1, 2):
+        key <<= BITS
+        key |= rgb[:, i] >> shift
+
+    size = 1 << (3 * BITS)
+    counts = np.bincount(key, minlength=size)
+    sums = np.stack([
+        np.bincount(key, weights=rgb[:, i], minlength=size) for i in range(3)
+    ], axis=1)
+
+    used = counts > 0
+    return sums[used] / counts[used, None], counts[used].astype(np.float64)
+
+
+def summarize(points, weights, labels, count):
+    # weighted mean and total weight of every group of points
+    totals = np.bincount(labels, weights=weights, minlength=count)
+    sums = np.stack([
+        np.bincount(labels, weights=points[:, i] * weights, minlength=count)
+        for i in range(3)
+    ], axis=1)
+    used = totals > 0
+    return sums[used] / totals[used, None], totals[used]
+
+
+# - - - - - - - - - - - - - -
+
+
+def median_cut(points, weights, count, seed=None):
+    '''
+    Splits the box with the largest weighted variance along its widest side
+    at the weighted median, until there are `count` boxes
+    '''
+    def error(box):
+        # weighted sum of squared distances to the mean of the box, and the
+        # axis along which they are largest
+        w = weights[box, None]
+        deviation = points[box] - (points[box] * w).sum(axis=0) / w.sum()
+        spread = (deviation ** 2 * w).sum(axis=0)
+        return spread.sum(), spread.argmax()
+
+    boxes = [np.arange(len(points))]
+    errors = [error(boxes[0])]
+
+    while len(boxes) < count:
+        i = max(range(len(boxes)), key=lambda x: errors[x][0])
+        if errors[i][0] <= 0:
+            break
+
+        box, (_, axis) = boxes.pop(i), errors.pop(i)
+        box = box[np.argsort(points[box, axis], kind='stable')]
+
+        # split at the weighted median, keeping at least one point each side
+        cumulative = np.cumsum(weights[box])
+        split = np.searchsorted(cumulative, cumulative[-1] / 2) + 1
+        split = min(split, len(box) - 1)
+        boxes += [box[:split], box[split:]]
+        errors += [error(box[:split]), error(box[split:])]
+
+    labels = np.empty(len(points), dtype=np.intp)
+    for i, box in enumerate(boxes):
+        labels[box] = i
+    return summarize(points, weights, labels, len(boxes))
+
+
+def octree(points, weights, count, seed=None):
+    '''
+    Builds an octree of the colors and merges the nodes with the fewest
+    pixels into their parent, deepest level first, until there are at most
+    `count` leaves
+    '''
+    rgb = np.clip(np.rint(points), 0, 255).astype(np.intp)
+
+    def node(level):
+        # id of the node at `level` that contains each point, tagged with
+        # the level so that nodes of different levels never share an id
+        shift = 8 - level
+        ids = (
+            (rgb[:, 0] >> shift) << (2 * level)
+            | (rgb[:, 1] >> shift) << level
+            | (rgb[:, 2] >> shift)
+        )
+        return ids | (level << 24)
+
+    leaves = node(BITS)
+    for level in range(BITS, 0, -1):
+        ids, labels = np.unique(leaves, return_inverse=True)
+        labels = labels.ravel()
+        reduce = len(ids) - count
+        if reduce <= 0:
+            break
+
+        parents = node(level - 1)
+        parent_ids, parent_labels = np.unique(parents, return_inverse=True)
+        parent_labels = parent_labels.ravel()
+        first = np.unique(labels, return_index=True)[1]
+        children = np.bincount(parent_labels[first], minlength=len(parent_ids))
+        parent_weights = np.bincount(parent_labels, weights=weights)
+
+        # merge the parents with the fewest pixels first, as long as that
+        # does not leave fewer than `count` leaves
+        order = np.argsort(parent_weights, kind='stable')
+        removed = np.cumsum(children[order] - 1)
+        full = np.searchsorted(removed, reduce, side='right')
+        merged = np.zeros(len(parent_ids), dtype=bool)
+        merged[order[:full]] = True
+        leaves = np.where(merged[parent_labels], parents, leaves)
+
+        remaining = reduce - (removed[full - 1] if full else 0)
+        if remaining and full < len(order):
+            # merging the next parent completely would leave too few
+            # leaves, so only merge its lightest children
+            under = np.flatnonzero(parent_labels[first] == order[full])
+            leaf_weights = np.bincount(labels, weights=weights)
+            lightest = np.argsort(leaf_weights[under], kind='stable')
+            lightest = under[lightest[:remaining + 1]]
+            leaves = np.where(np.isin(labels, lightest), parents, leaves)
+            break
+
+    labels = np.unique(leaves, return_inverse=True)[1].ravel()
+    return summarize(points, weights, labels, labels.max() + 1)
+
+
+def kmeans(points, weights, count, seed=None, batch_size=BATCH_SIZE,
+           iterations=ITERATIONS):
+    '''
+    Mini-batch k-means, starting from the median cut palette. Each
+    iteration moves the centers towards a batch of points picked in
+    proportion to their pixel counts, a final full pass then assigns every
+    point to its nearest center.
+    '''
+    centers, _ = median_cut(points, weights, count)
+    centers = centers.copy()
+    seen = np.zeros(len(centers))
+
+    rng = np.random.default_rng(seed)
+    probabilities = weights / weights.sum()
+
+    def nearest(batch):
+        distances = sum(
+            (batch[:, None, i] - centers[None, :, i]) ** 2 for i in range(3)
+        )
+        return distances.argmin(axis=1)
+
+    for _ in range(iterations):
+        batch = points[rng.choice(len(points), batch_size, p=probabilities)]
+        labels = nearest(batch)
+
+        sizes = np.bincount(labels, minlength=len(centers))
+        sums = np.stack([
+            np.bincount(labels, weights=batch[:, i], minlength=len(centers))
+            for i in range(3)
+        ], axis=1)
+
+        seen += sizes
+        moved = sizes > 0
+        rate = (sizes[moved] / seen[moved])[:, None]
+        means = sums[moved] / sizes[moved, None]
+        centers[moved] += rate * (means - centers[moved])
+
+    return summarize(points, weights, nearest(points), len(centers))
+
+
+quantizers = {
+    'median_cut': median_cut,
+    'octree': octree,
+    'kmeans': kmeans,
+}
+
+
+def extract(data, count=8, method='median_cut', sample=None, seed=None):
+    '''
+    Returns a palette of the most representative colors of an image
+
+    Args:
+        data:
+            numpy array of shape (..., 3) or (..., 4) with rgb(a) values,
+            like an (H, W, 3) image, or a bytes-like object of packed rgb
+            values with 3 bytes per pixel
+        count(int, optional):
+            maximum number of colors in the palette
+            Default: 8
+        method(str, optional):
+            'median_cut', 'octree' or 'kmeans'
+            Default: 'median_cut'
+        sample(int, optional):
+            only use this many randomly picked pixels
+            Default: None, all pixels are used
+        seed(int, optional):
+            seed for subsampling and for kmeans
+            Default: None
+
+    Returns:
+        list of `Swatch(color, weight)`, where weight is the fraction of
+        pixels represented by that color, sorted by weight
+
+    Raises:
+        ValueError: invalid method, count or pixel data
+    '''
+    if method not in quantizers:
+        raise ValueError(f'{method!r} is not a valid quantization method')
+    if count < 1:
+        raise ValueError(f'{"count"!r} should be at least 1')
+
+    rgb = pixels(data)
+    if sample is not None and sample < len(rgb):
+        rng = np.random.default_rng(seed)
+        rgb = rgb[rng.integers(0, len(rgb), sample)]
+    if not len(rgb):
+        return []
+
+    points, weights = histogram(rgb)
+    if len(points) <= count:
+        colors, totals = points, weights
+    else:
+        colors, totals = quantizers[method](points, weights, count, seed)
+
+    colors = np.clip(np.rint(colors), 0, 255).astype(np.uint8).tolist()
+    totals = (totals / totals.sum()).tolist()
+
+    palette = [
+        Swatch(Color.from_rgb_unchecked(*rgb), weight)
+        for rgb, weight in zip(colors, totals)
+    ]
+    return sorted(palette, key=lambda x: x.weight, reverse=True)
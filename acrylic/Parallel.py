@@ -0,0 +1,189 @@
+'''
+Convert very large batches of colors using multiple processes
+
+Inputs and results are passed to the worker processes through shared
+memory as packed numpy arrays, so only the name of the shared memory block
+and the range of rows to convert are sent to each worker.
+
+Random values (`RANDOM` or ranges) are picked in the calling process before
+the work is split up, in the same order as when validating the colors one
+at a time, so results are identical to the serial path for the same state
+of the `random` module, or for the same `rng`.
+
+Examples:
+    >>> from acrylic.Parallel import convert_many
+    >>> convert_many([[83, 237, 229], [255, 0, 0]], 'rgb', 'hsl', workers=2)
+    array([[176.88,  81.05,  62.75],
+           [  0.  , 100.  ,  50.  ]])
+'''
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    msg = 'acrylic.Parallel needs Python 3.8 or newer for shared memory'
+    raise ImportError(msg) from None
+
+import numpy as np
+
+from acrylic.Defaults import RANDOM, SCHEMAS
+from acrylic.Validators import validate as validate_scalar
+from acrylic.Arrays import convert
+
+
+# inputs smaller than this are converted in the calling process
+MIN_SIZE = 65536
+TASKS_PER_WORKER = 4
+
+
+def is_random(value, colorspace):
+    # True if validating `value` picks a random value for any component
+    if SCHEMAS[colorspace].validation_type == 'string':
+        return isinstance(value, int) and value == RANDOM
+    if isinstance(value, int) and value == RANDOM:
+        return True
+
+    for x, (a, b) in zip(value, SCHEMAS[colorspace].format):
+        if isinstance(x, (list, tuple)):
+            return True
+        if x == RANDOM and not a <= RANDOM <= b:
+            return True
+    return False
+
+
+def resolve(values, colorspace, rng=random):
+    '''
+    Returns `values` as a numpy array, with every value that contains
+    `RANDOM` or ranges validated one at a time, in order
+    '''
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        if SCHEMAS[colorspace].validation_type == 'string':
+            return values.astype(str)
+        schema = SCHEMAS[colorspace]
+        randomizable = [
+            i for i, (a, b) in enumerate(schema.format)
+            if not a <= RANDOM <= b
+        ]
+        if values.ndim != 2 or not (values[:, randomizable] == RANDOM).any():
+            return values
+        values = values.tolist()
+
+    values = [
+        validate_scalar(x, colorspace, rng) if is_random(x, colorspace)
+        else x
+        for x in values
+    ]
+    if SCHEMAS[colorspace].validation_type == 'string':
+        return np.asarray(values, dtype=str)
+    return np.asarray(values)
+
+
+def share(array):
+    # copies `array` to a new shared memory block
+    size = max(array.nbytes, 1)
+    memory = shared_memory.SharedMemory(create=True, size=size)
+    shared = np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)
+    shared[...] = array
+    return memory, shared
+
+
+def attach(name, shape, dtype):
+    memory = shared_memory.SharedMemory(name=name)
+    return memory, np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+
+
+def work(source, destination, start, stop, src, dst):
+    # runs in a worker process, converts rows start:stop of the shared
+    # input and writes them to the shared output
+    source_memory, values = attach(*source)
+    destination_memory, result = attach(*destination)
+    try:
+        result[start:stop] = convert(values[start:stop], src, dst)
+    finally:
+        del values, result
+        source_memory.close()
+        destination_memory.close()
+
+
+def convert_many(values, src='rgb', dst='hsl', workers=None, executor=None,
+                 rng=random):
+    '''
+    Converts a batch of colors from one colorspace to another using a pool
+    of processes, check `help(acrylic.Arrays.convert)` for the format of
+    values and results
+
+    Args:
+        values:
+            (N, 3) array-like for component colorspaces, (N,) for hex and
+            name. Lists can also contain `RANDOM` and ranges, like `Color()`
+        src(str, optional):
+            colorspace of the given values
+            Default: 'rgb'
+        dst(str, optional):
+            colorspace to convert to
+            Default: 'hsl'
+        workers(int, optional):
+            number of processes
+            Default: None, the number of cpus
+        executor(concurrent.futures.ProcessPoolExecutor, optional):
+            reuse an existing pool instead of starting a new one
+            Default: None
+        rng(optional):
+            source of random values for `RANDOM` and ranges, like
+            `ColorGenerator(seed).random`
+            Default: the `random` module
+
+    Returns:
+        numpy.ndarray, identical to the result of `acrylic.Arrays.convert()`
+
+    Raises:
+        ValueError: invalid colorspace, shape or values not within valid
+                    ranges
+    '''
+    for colorspace in (src, dst):
+        if colorspace not in SCHEMAS:
+            raise ValueError(f'{colorspace!r} is not a valid colorspace')
+
+    values = resolve(values, src, rng)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(values) < MIN_SIZE:
+        return convert(values, src, dst)
+
+    # shape and dtype of the results, from converting the first color
+    sample = convert(values[:1], src, dst)
+    shape = (len(values),) + sample.shape[1:]
+
+    source_memory, source = share(values)
+    destination_memory, destination = share(np.empty(shape, sample.dtype))
+    try:
+        source_info = (source_memory.name, source.shape, source.dtype)
+        destination_info = (
+            destination_memory.name, destination.shape, destination.dtype
+        )
+
+        tasks = workers * TASKS_PER_WORKER
+        bounds = np.linspace(0, len(values), tasks + 1).astype(int)
+        pool = executor or ProcessPoolExecutor(workers)
+        try:
+            futures = [
+                pool.submit(
+                    work, source_info, destination_info, start, stop, src, dst
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+                if stop > start
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+        return destination.copy()
+    finally:
+        del source, destination
+        for memory in (source_memory, destination_memory):
+            memory.close()
+            memory.unlink()
@@ -1,6 +1,6 @@
-from random import uniform, randint
+import random
 
-from acrylic.Defaults import RANDOM, SCHEMAS
+from acrylic.Defaults import RANDOM, PRECISION, SCHEMAS
 from acrylic.Validators import in_range, check_datatype
 
 
@@ -18,7 +18,29 @@ COMPLEMENTARY_TRIADIC = 11
 MODIFIED_TRIADIC = 12
 
 
-def scheme(self, name, in_rgb=False, fuzzy=0):
+def hue_deltas(b):
+    # angles to rotate the hue by for each scheme, `b` is the maximum hue
+    return {
+        ANALOGOUS: [b / 24, -(b / 24), b / 12, -(b / 12)],
+        COMPLEMENTARY: [b / 2],
+        TRIADIC: [b / 3, -(b / 3)],
+        SQUARE: [b / 4, -(b / 4), b / 2],
+        SPLIT_COMPLEMENTARY: [(b / 2) - (b / 12), (b / 2) + (b / 12)],
+        ACCENTED_ANALOGOUS: [b / 12, -(b / 12), b / 2],
+        RECTANGLE: [b / 2, (b / 2) - (b / 8), b / 8],
+        NEAR_COMPLEMENTARY: [(b / 2) - (b / 12)],
+        COMPLEMENTARY_TRIADIC: [b / 2, b / 4],
+        MODIFIED_TRIADIC: [b / 12, b / 6],
+    }
+
+
+DELTAS = hue_deltas(SCHEMAS['hsl'].format.h[1])
+
+# number of colors in the MONOCHROMATIC and SHADES schemes
+VARIANTS = 4
+
+
+def scheme(self, name, in_rgb=False, fuzzy=0, rng=random):
     '''
     Returns a list of `Color` according to the given color scheme
 
@@ -35,6 +57,10 @@ def scheme(self, name, in_rgb=False, fuzzy=0):
             the generated hue. Can be set to `RANDOM` to use
             the recommended value.
             Default: 0
+        rng(optional):
+            source of random values, like `random.Random(seed)` or
+            `ColorGenerator(seed).random`
+            Default: the `random` module
 
     Returns:
         list of Color
@@ -43,48 +69,145 @@ def scheme(self, name, in_rgb=False, fuzzy=0):
 
     colors, (a, b) = list(), SCHEMAS['hsl'].format.h
     if fuzzy == RANDOM:
-        fuzzy = uniform(b / 20, b / 5) if randint(0, 5) else 0
+        fuzzy = rng.uniform(b / 20, b / 5) if rng.randint(0, 5) else 0
     else:
         fuzzy = check_datatype(float, fuzzy, 'fuzzy')
         fuzzy = in_range(fuzzy, a, b, 'fuzzy')
 
-    deltas = {
-        ANALOGOUS: [b / 24, -(b / 24), b / 12, -(b / 12)],
-        COMPLEMENTARY: [b / 2],
-        TRIADIC: [b / 3, -(b / 3)],
-        SQUARE: [b / 4, -(b / 4), b / 2],
-        SPLIT_COMPLEMENTARY: [(b / 2) - (b / 12), (b / 2) + (b / 12)],
-        ACCENTED_ANALOGOUS: [b / 12, -(b / 12), b / 2],
-        RECTANGLE: [b / 2, (b / 2) - (b / 8), b / 8],
-        NEAR_COMPLEMENTARY: [(b / 2) - (b / 12)],
-        COMPLEMENTARY_TRIADIC: [b / 2, b / 4],
-        MODIFIED_TRIADIC: [b / 12, b / 6],
-    }
+    # all values used below are taken from valid colors or computed within
+    # valid ranges, so colors are created without validating them again
+    hsv = SCHEMAS['hsv']
+
+    # precise colors keep unrounded values
+    def rounded(x):
+        return x if Color.precise else round(x, PRECISION)
 
     if name == MONOCHROMATIC:
-        m = (SCHEMAS['hsv'].format.s[1] / (SCHEMAS['hsv'].format.s[1] / 30))
+        m = (hsv.format.s[1] / (hsv.format.s[1] / 30))
         if self.hsv.s > m:
             s = [self.hsv.s, self.hsv.s - m, self.hsv.s, self.hsv.s - m]
         else:
             s = [self.hsv.s, self.hsv.s + m, self.hsv.s, self.hsv.s + m]
-        v = [SCHEMAS['hsv'].format.v[1] / 5, SCHEMAS['hsv'].format.v[1]]
-        for i in range(4):
-            colors.append(Color(hsv=(self.hsl.h, s[i], v)))
+        v = [hsv.format.v[1] / 5, hsv.format.v[1]]
+        for i in range(VARIANTS):
+            value = hsv.output_type(
+                self.hsl.h, rounded(s[i]), hsv.rng(rng, *v)
+            )
+            colors.append(Color._from_trusted('hsv', value))
         return colors
 
     elif name == SHADES:
-        v = [SCHEMAS['hsv'].format.v[1] / 5, SCHEMAS['hsv'].format.v[1]]
-        for i in range(4):
-            colors.append(Color(hsv=(self.hsl.h, self.hsv.s, v)))
+        v = [hsv.format.v[1] / 5, hsv.format.v[1]]
+        for i in range(VARIANTS):
+            value = hsv.output_type(self.hsl.h, self.hsv.s, hsv.rng(rng, *v))
+            colors.append(Color._from_trusted('hsv', value))
         return colors
 
-    elif name not in deltas:
+    elif name not in DELTAS:
         raise ValueError(f'{name!r} is not a valid color scheme')
 
-    for angle in deltas[name]:
-        h = (self.hsl.h + angle + uniform(-fuzzy, +fuzzy)) % b
+    for angle in DELTAS[name]:
+        h = (self.hsl.h + angle + rng.uniform(-fuzzy, +fuzzy)) % b
+        value = hsv.output_type(rounded(h), self.hsv.s, self.hsv.v)
         if not in_rgb:
-            colors.append(Color(hsv=(h, self.hsv.s, self.hsv.v))._in_ryb())
+            colors.append(Color._from_trusted('hsv', value)._in_ryb())
         else:
-            colors.append(Color(hsv=(h, self.hsv.s, self.hsv.v)))
+            colors.append(Color._from_trusted('hsv', value))
     return colors
+
+
+def schemes_for(colors, name, in_rgb=False, fuzzy=0, rng=None):
+    '''
+    Computes a color scheme for many base colors at once
+
+    Gives the same colors as calling `Color(rgb=x).scheme(name, in_rgb)`
+    for each base color, without creating any `Color`. Needs numpy.
+
+    Examples:
+        >>> from acrylic import ColorArray, Schemes
+        >>> colors = ColorArray(rgb=[[83, 237, 229], [255, 0, 0]])
+        >>> Schemes.schemes_for(colors, Schemes.TRIADIC)
+        array([[[156,  83, 237],
+                [237, 158,  83]],
+        <BLANKLINE>
+               [[255, 255,   0],
+                [  0,   0, 255]]], dtype=uint8)
+
+    Args:
+        colors:
+            `ColorArray` or (N, 3) array-like of rgb values
+        name, in_rgb:
+            same as for `Color().scheme()`
+        fuzzy(optional):
+            same as for `Color().scheme()`, with `RANDOM` a separate value
+            is picked for each base color
+            Default: 0
+        rng(optional):
+            `numpy.random.Generator` or a seed for one, used for `fuzzy`
+            and for the random values of MONOCHROMATIC and SHADES
+            Default: None, a new unseeded generator
+
+    Returns:
+        numpy.ndarray of shape (N, colors in the scheme, 3) with the rgb
+        values of every color of every scheme
+
+    Raises:
+        ValueError: invalid scheme or rgb values
+    '''
+    import numpy as np
+    from acrylic.Arrays import validate, rgb_to, rgb_from, round_array
+
+    rgb = validate(getattr(colors, 'rgb', colors), 'rgb')
+    rng = np.random.default_rng(rng)
+    hsl, hsv = rgb_to['hsl'](rgb), rgb_to['hsv'](rgb)
+    hue, s, v = hsl[:, :1], hsv[:, 1:2], hsv[:, 2:]
+    size, hsv_format = len(rgb), SCHEMAS['hsv'].format
+
+    (a, b) = SCHEMAS['hsl'].format.h
+    if fuzzy == RANDOM:
+        fuzzy = np.where(
+            rng.integers(0, 5, size, endpoint=True) != 0,
+            rng.uniform(b / 20, b / 5, size), 0
+        )[:, None]
+    else:
+        fuzzy = check_datatype(float, fuzzy, 'fuzzy')
+        fuzzy = in_range(fuzzy, a, b, 'fuzzy')
+
+    def pick_values():
+        # rounded like the random values of `SCHEMAS['hsv'].rng`
+        low, high = hsv_format.v[1] / 5, hsv_format.v[1]
+        values = rng.uniform(low, high, (size, VARIANTS))
+        return round_array(values, SCHEMAS['hsv'].precision)
+
+    def to_rgb(h, s, v):
+        # (N, K) arrays of hsv components to (N, K, 3) rgb values
+        h, s, v = np.broadcast_arrays(h, s, v)
+        values = np.stack([h, s, v], axis=-1).reshape(-1, 3)
+        return rgb_from['hsv'](values).reshape(h.shape + (3,))
+
+    if name == MONOCHROMATIC:
+        m = (hsv_format.s[1] / (hsv_format.s[1] / 30))
+        shifted = round_array(np.where(s > m, s - m, s + m), PRECISION)
+        s = np.concatenate([s, shifted] * (VARIANTS // 2), axis=1)
+        return to_rgb(hue, s, pick_values())
+
+    elif name == SHADES:
+        return to_rgb(hue, s, pick_values())
+
+    elif name not in DELTAS:
+        raise ValueError(f'{name!r} is not a valid color scheme')
+
+    angles = np.array(DELTAS[name])
+    noise = rng.uniform(-1, 1, (size, len(angles))) * fuzzy
+    h = round_array((hue + angles + noise) % b, PRECISION)
+    result = to_rgb(h, s, v)
+    if in_rgb:
+        return result
+
+    # same as `Color()._in_ryb()`, the rgb values are used as ryb values to
+    # find the hue on the ryb color wheel
+    flat = result.reshape(-1, 3)
+    new_hue = rgb_to['hsl'](rgb_from['ryb'](flat))[:, 0]
+    hsl = rgb_to['hsl'](flat)
+    hsl[:, 0] = new_hue
+    return rgb_from['hsl'](hsl).reshape(result.shape)
@@ -0,0 +1,217 @@
+'''
+Streaming conversion of large numbers of colors
+
+Values are read and converted in chunks using the batch converters of
+`acrylic.Arrays`, and results are written as soon as each chunk is done,
+so memory use only depends on the chunk size and not on the number of
+colors.
+
+Examples:
+    >>> from acrylic.Stream import convert_iter
+    >>> list(convert_iter(['#80ffd4', '#ff0000'], src='hex', dst='hsl'))
+    [[159.69, 100.0, 75.1], [0.0, 100.0, 50.0]]
+
+Convert a csv or jsonl file from the command line:
+    python -m acrylic convert --from hex --to hsl,name colors.csv out.csv
+'''
+import re
+import csv
+import json
+import itertools
+
+from acrylic.Defaults import SCHEMAS
+from acrylic.Converters import path
+from acrylic.Arrays import validate, converter
+
+
+CHUNK_SIZE = 65536
+FORMATS = ('csv', 'jsonl')
+ERRORS = ('raise', 'skip')
+
+
+def chunked(iterable, size):
+    # yields lists of at most `size` items
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse(value, colorspace):
+    # components can be given as a string like '83, 237, 229' in csv files
+    if SCHEMAS[colorspace].validation_type == 'string':
+        return value
+    if isinstance(value, str):
+        return [float(x) for x in re.split(r'[\s,]+', value.strip('()[] '))]
+    return value
+
+
+def format_csv(value):
+    if isinstance(value, list):
+        return ','.join(str(x) for x in value)
+    return '' if value is None else value
+
+
+def to_valid(values, src):
+    return validate([parse(x, src) for x in values], src)
+
+
+def convert_chunk(values, src, dst, errors='raise'):
+    '''
+    Converts a list of values from `src` to every colorspace in `dst`,
+    returns a list of converted values for each of them. With
+    errors='skip', invalid values are converted to None instead of raising
+    ValueError.
+    '''
+    valid = None
+    try:
+        validated = to_valid(values, src)
+    except ValueError:
+        if errors == 'raise':
+            raise
+
+        # find the invalid values one at a time, only for this chunk
+        valid = []
+        for value in values:
+            try:
+                to_valid([value], src)
+            except ValueError:
+                valid.append(False)
+            else:
+                valid.append(True)
+        # nothing left to validate or convert
+        if not any(valid):
+            return [[None] * len(values) for _ in dst]
+        validated = to_valid([x for x, ok in zip(values, valid) if ok], src)
+
+    # every format on the way is converted once, even if it is on the
+    # conversion path of several colorspaces in `dst`
+    formats = {src: validated}
+    results = []
+    for colorspace in dst:
+        steps = path(src, colorspace)
+        for a, b in zip(steps, steps[1:]):
+            if b not in formats:
+                formats[b] = converter(a, b)(formats[a])
+        converted = iter(formats[colorspace].tolist())
+        if valid is None:
+            results.append(list(converted))
+        else:
+            results.append([next(converted) if x else None for x in valid])
+    return results
+
+
+def convert_iter(values, src='hex', dst='hsl', chunk_size=CHUNK_SIZE,
+                 errors='raise'):
+    '''
+    Converts an iterable of colors from `src` to `dst` lazily, one chunk at
+    a time. Components are yielded as lists, hex and name as strings.
+
+    Raises:
+        ValueError: invalid colorspace, or values when errors='raise'
+    '''
+    check(src, [dst], chunk_size, errors)
+    for chunk in chunked(values, chunk_size):
+        yield from convert_chunk(chunk, src, [dst], errors)[0]
+
+
+def check(src, dst, chunk_size, errors):
+    for colorspace in [src, *dst]:
+        if colorspace not in SCHEMAS:
+            raise ValueError(f'{colorspace!r} is not a valid colorspace')
+    if errors not in ERRORS:
+        raise ValueError(f'{errors!r} is not a valid way to handle errors')
+    if chunk_size < 1:
+        raise ValueError(f'{"chunk_size"!r} should be at least 1')
+
+
+# - - - - - - - - - - - - - -
+
+
+def read_rows(infile, file_format):
+    # returns (iterator over rows as dicts, list of fields or None)
+    if file_format == 'csv':
+        reader = csv.DictReader(infile)
+        return reader, reader.fieldnames or []
+    rows = (json.loads(line) for line in infile if line.strip())
+    return rows, None
+
+
+def convert_file(infile, outfile, src='hex', dst=('hsl',), field=None,
+                 file_format='csv', chunk_size=CHUNK_SIZE, errors='raise'):
+    '''
+    Converts colors in a csv or jsonl file, writing every row with the
+    converted values added under the name of each colorspace in `dst`
+
+    Examples:
+        >>> from acrylic.Stream import convert_file
+        >>> with open('in.csv', newline='') as i:
+        ...     with open('out.csv', 'w', newline='') as o:
+        ...         convert_file(i, o, src='hex', dst=['hsl', 'name'])
+        2
+
+    Args:
+        infile, outfile:
+            file objects open in text mode, csv files should be opened
+            with newline=''
+        src(str, optional):
+            colorspace of the values in the input
+            Default: 'hex'
+        dst(list, optional):
+            colorspaces to convert to
+            Default: ['hsl']
+        field(str, optional):
+            column (csv) or key (jsonl) that contains the values, components
+            are given as a list in jsonl, or like '83,237,229' in csv
+            Default: None, same as `src`
+        file_format(str, optional):
+            'csv' or 'jsonl'
+            Default: 'csv'
+        chunk_size(int, optional):
+            number of rows read and converted at once
+            Default: 65536
+        errors(str, optional):
+            'raise': raise ValueError for the first invalid value
+            'skip': leave converted values empty for invalid values
+            Default: 'raise'
+
+    Returns:
+        number of rows written
+
+    Raises:
+        ValueError: invalid arguments, or values when errors='raise'
+        KeyError: a row does not contain `field`
+    '''
+    dst = list(dst)
+    check(src, dst, chunk_size, errors)
+    if file_format not in FORMATS:
+        raise ValueError(f'{file_format!r} is not a valid file format')
+    field = src if field is None else field
+
+    rows, fields = read_rows(infile, file_format)
+    if file_format == 'csv':
+        if field not in fields:
+            raise KeyError(field)
+        fields = fields + [x for x in dst if x not in fields]
+        writer = csv.DictWriter(outfile, fields)
+        writer.writeheader()
+
+    count = 0
+    for chunk in chunked(rows, chunk_size):
+        values = [row[field] for row in chunk]
+        results = convert_chunk(values, src, dst, errors)
+        for colorspace, values in zip(dst, results):
+            if file_format == 'csv':
+                values = [format_csv(x) for x in values]
+            for row, value in zip(chunk, values):
+                row[colorspace] = value
+
+        if file_format == 'csv':
+            writer.writerows(chunk)
+        else:
+            outfile.writelines(json.dumps(row) + '\n' for row in chunk)
+        count += len(chunk)
+
+    return count
@@ -1,13 +1,15 @@
+import random
 import itertools
 
-from acrylic.Defaults import RANDOM, PRECISION, SCHEMAS
+from acrylic.Defaults import RANDOM, SCHEMAS, ALPHA, ALPHA_SCHEMAS
 
 
-def validate(value, colorspace):
-    if SCHEMAS[colorspace].validation_type == 'values':
-        return validate_values(value, colorspace)
-    if SCHEMAS[colorspace].validation_type == 'string':
-        return validate_string(value, colorspace)
+def validate(value, colorspace, rng=random, precise=False):
+    if colorspace in SCHEMAS:
+        validator = validators[SCHEMAS[colorspace].validation_type]
+    else:
+        validator = validators[ALPHA_SCHEMAS[colorspace].validation_type]
+    return validator(value, colorspace, rng, precise)
 
 
 def in_range(x, a, b, p):
@@ -52,12 +54,18 @@ def check_iter(iterable, length, param):
         raise ValueError(msg) from None
 
 
-def validate_values(values, colorspace):
-    schema = SCHEMAS[colorspace]
-    datatype = schema.input_type
+def validate_values(values, colorspace, rng=random, precise=False,
+                    schema=None):
+    # with precise=True every component is a float and is not rounded
+    # `schema` validates values that are not a colorspace, like alpha
+    if schema is None:
+        schema = SCHEMAS[colorspace]
+    datatype = float if precise else schema.input_type
 
     if values == RANDOM:
-        return [schema.rng(a, b) for a, b in schema.format]
+        return schema.output_type(*[
+            datatype(schema.rng(rng, a, b)) for a, b in schema.format
+        ])
 
     values = check_iter(values, schema.length, colorspace)
 
@@ -65,8 +73,12 @@ def validate_values(values, colorspace):
     for x, (a, b), p in zip(values, schema.format, schema.names):
         value = None
 
-        if x == RANDOM:
-            validated.append(schema.rng(a, b))
+        # -1 is a valid value for components that can be negative (like a
+        # and b of lab), these can only be randomized by giving a range
+        randomizable = not a <= RANDOM <= b
+
+        if randomizable and x == RANDOM:
+            validated.append(schema.rng(rng, a, b))
             continue
 
         try:
@@ -80,40 +92,47 @@ def validate_values(values, colorspace):
                 msg = f'{p!r} when given as a range needs 2 values'
                 raise ValueError(msg) from None
         else:
-            if datatype != float:
+            if datatype != float or precise:
                 validated.append(in_range(value, a, b, p))
             else:
-                validated.append(round(in_range(value, a, b, p), PRECISION))
+                value = in_range(value, a, b, p)
+                validated.append(round(value, schema.precision))
             continue
 
-        limits = [check_datatype(datatype, x, 'r') for x in limits]
+        # random values are picked the same way in precise mode
+        limits = [check_datatype(schema.input_type, x, 'r') for x in limits]
 
-        if limits == [-1, -1]:
-            validated.append(schema.rng(a, b))
+        if randomizable and limits == [-1, -1]:
+            validated.append(schema.rng(rng, a, b))
             continue
 
-        limits = [in_range(x, a, b, p) if x != RANDOM else x for x in limits]
+        limits = [
+            x if randomizable and x == RANDOM else in_range(x, a, b, p)
+            for x in limits
+        ]
 
-        if limits[0] == RANDOM:
-            limits[0] = schema.rng(a, limits[1])
-        if limits[1] == RANDOM:
-            limits[1] = schema.rng(limits[0], b)
+        if randomizable and limits[0] == RANDOM:
+            limits[0] = schema.rng(rng, a, limits[1])
+        if randomizable and limits[1] == RANDOM:
+            limits[1] = schema.rng(rng, limits[0], b)
 
-        validated.append(schema.rng(min(limits), max(limits)))
+        validated.append(schema.rng(rng, min(limits), max(limits)))
 
+    if precise:
+        validated = [float(x) for x in validated]
     return schema.output_type(*validated)
 
 
-def validate_string(value, colorspace):
+def validate_string(value, colorspace, rng=random, precise=False):
     schema = SCHEMAS[colorspace]
 
     if value == RANDOM:
-        return schema.rng
+        return schema.rng(rng)
 
     value = check_datatype(schema.input_type, value, colorspace)
 
     if colorspace == 'hex':
-        match = schema.format.match(value, 0, 10)
+        match = schema.format.fullmatch(value)
         if match and match.lastgroup == 'hex':
             return schema.output_type(match.group('hex'))
         elif match and match.lastgroup == 'hex_alpha':
@@ -128,3 +147,37 @@ def validate_string(value, colorspace):
             return schema.output_type(value)
 
     raise ValueError(f'{value!r} is not a valid value for {colorspace!r}')
+
+
+# - - - - - - - - - - - - - -
+
+
+def validate_alpha(values, colorspace, rng=random, precise=False):
+    # validates a colorspace with alpha like rgba, returns the validated
+    # value of the colorspace it extends and the alpha
+    schema = ALPHA_SCHEMAS[colorspace]
+
+    if values == RANDOM:
+        values = [RANDOM] * schema.length
+
+    values = check_iter(values, schema.length, colorspace)
+    value = validate(values[:-1], colorspace[:-1], rng, precise)
+    alpha = validate_values(values[-1:], 'alpha', rng, precise, ALPHA)
+    return value, alpha
+
+
+def hex_alpha(value, precise=False):
+    # alpha of an 8 digit hex value, 1.0 for other values
+    if isinstance(value, str) and len(value) >= 8:
+        match = SCHEMAS['hex'].format.fullmatch(value)
+        if match and match.lastgroup == 'hex_alpha':
+            alpha = int(value[-2:], 16) / 255
+            return alpha if precise else round(alpha, ALPHA.precision)
+    return 1.0
+
+
+validators = {
+    'values': validate_values,
+    'string': validate_string,
+    'alpha': validate_alpha,
+}
@@ -3,7 +3,8 @@ acrylic is a simple and intutive library to work with color in python.
 It can be used to handle color data, easily convert between different 
 color spaces and work with colorschemes. acrylic currently supports the 
 following color formats:
-rgb, hsl, hsv, hex, name, ryb
+rgb, hsl, hsv, hex, name, ryb, xyz, lab, lch, oklab, and rgba, hsla with
+alpha
 
 Try this for more details on how to use acrylic:
 >>> from acrylic import Color
@@ -14,6 +15,15 @@ Try this for more details on how to use acrylic:
 __version__ = '0.3.0'
 
 
-from .Color import Color
+from .Color import Color, PreciseColor
+from .Generator import ColorGenerator
 from .Defaults import RANDOM
 from . import Schemes
+from . import Cache
+from . import Instrument
+
+try:
+    from .ColorArray import ColorArray
+except ImportError:
+    # numpy is not installed
+    pass
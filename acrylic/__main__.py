@@ -0,0 +1,72 @@
+import sys
+import argparse
+from contextlib import ExitStack
+
+
+def convert(args):
+    from acrylic.Stream import convert_file, check
+
+    file_format = args.format
+    if file_format is None:
+        name = args.output if args.input == '-' else args.input
+        file_format = 'jsonl' if name.endswith(('.jsonl', '.json')) else 'csv'
+
+    dst = args.dst.split(',')
+    with ExitStack() as stack:
+        try:
+            # arguments are checked and the input is opened before the
+            # output, which would be truncated even if nothing is written
+            check(args.src, dst, args.chunk_size, args.errors)
+            infile = (
+                sys.stdin if args.input == '-'
+                else stack.enter_context(open(args.input, newline=''))
+            )
+            outfile = (
+                sys.stdout if args.output == '-'
+                else stack.enter_context(open(args.output, 'w', newline=''))
+            )
+            convert_file(
+                infile, outfile, src=args.src, dst=dst, field=args.field,
+                file_format=file_format, chunk_size=args.chunk_size,
+                errors=args.errors,
+            )
+        except (ValueError, KeyError, OSError) as e:
+            print(f'error: {e}', file=sys.stderr)
+            return 1
+    return 0
+
+
+def main(args=None):
+    from acrylic.Defaults import SCHEMAS
+
+    parser = argparse.ArgumentParser(prog='python -m acrylic')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    convert_parser = commands.add_parser(
+        'convert', help='convert colors in a csv or jsonl file in chunks'
+    )
+    convert_parser.add_argument(
+        '--from', dest='src', choices=list(SCHEMAS), default='hex'
+    )
+    convert_parser.add_argument(
+        '--to', dest='dst', default='hsl',
+        help='comma separated colorspaces to convert to, default: hsl',
+    )
+    convert_parser.add_argument(
+        '--field', help='column or key with the values, default: --from'
+    )
+    convert_parser.add_argument('--format', choices=['csv', 'jsonl'])
+    convert_parser.add_argument('--chunk-size', type=int, default=65536)
+    convert_parser.add_argument(
+        '--errors', choices=['raise', 'skip'], default='raise'
+    )
+    convert_parser.add_argument('input', nargs='?', default='-')
+    convert_parser.add_argument('output', nargs='?', default='-')
+
+    args = parser.parse_args(args)
+    return convert(args)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,58 @@
+'''
+Micro-benchmark for memory used by `Color` instances and for the cost of
+accessing their lazily converted properties
+
+Usage:
+    python benchmarks/bench_color.py
+'''
+import sys
+import timeit
+import tracemalloc
+
+from acrylic import Color
+
+
+def instance_size(n=10000):
+    # average number of bytes allocated per fully converted instance
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    colors = [Color(rgb=(x % 256, x // 256 % 256, 7)) for x in range(n)]
+    for color in colors:
+        _ = color.hsl, color.hsv, color.hex, color.name, color.ryb
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / n
+
+
+def access_time(attr, number=1000000):
+    # average time to access an already converted property
+    color = Color(rgb=(83, 237, 229))
+    getattr(color, attr)
+    timer = timeit.Timer(f'color.{attr}', globals={'color': color})
+    return min(timer.repeat(5, number)) / number
+
+
+def first_access_time(attr, number=20000):
+    # average time to create a color and convert it on first access
+    timer = timeit.Timer(
+        f'Color(rgb=(83, 237, 229)).{attr}', globals={'Color': Color}
+    )
+    return min(timer.repeat(5, number)) / number
+
+
+def main():
+    color = Color(rgb=(83, 237, 229))
+    print(f'sys.getsizeof(Color()):  {sys.getsizeof(color)} bytes')
+    if hasattr(color, '__dict__'):
+        size = sys.getsizeof(color.__dict__)
+        print(f'sys.getsizeof(__dict__): {size} bytes')
+    print(f'allocated per color:     {instance_size():.1f} bytes')
+
+    for attr in ['rgb', 'hsl', 'hex']:
+        cached = access_time(attr) * 1e9
+        first = first_access_time(attr) * 1e6
+        print(f'.{attr:<4} cached: {cached:6.1f} ns   first: {first:5.2f} us')
+
+
+if __name__ == '__main__':
+    main()
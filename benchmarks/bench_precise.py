@@ -0,0 +1,46 @@
+'''
+Micro-benchmark for the throughput of conversions and color schemes of
+`Color` and of `PreciseColor`, which skips rounding at every step
+
+Usage:
+    python benchmarks/bench_precise.py
+'''
+import timeit
+
+from acrylic import Color, PreciseColor, Schemes
+
+
+CONVERSIONS = [
+    ('rgb', (83, 237, 229), 'hsl'),
+    ('rgb', (83, 237, 229), 'ryb'),
+    ('rgb', (83, 237, 229), 'lab'),
+    ('hsl', (176.88, 81.05, 62.75), 'rgb'),
+    ('hsl', (176.88, 81.05, 62.75), 'hsv'),
+    ('lab', (84.2, -36.31, -10.4), 'rgb'),
+]
+
+
+def throughput(statement, cls, number):
+    # operations per second, best of 5 runs
+    timer = timeit.Timer(
+        statement, globals={'cls': cls, 'Schemes': Schemes}
+    )
+    return number / min(timer.repeat(5, number))
+
+
+def row(label, statement, number):
+    results = [throughput(statement, x, number) for x in (Color, PreciseColor)]
+    print(f'{label:<22}{results[0]:>10,.0f}/s{results[1]:>12,.0f}/s')
+
+
+def main(number=20000):
+    print(f'{"":<22}{"Color":>12}{"PreciseColor":>14}')
+    for src, value, dst in CONVERSIONS:
+        row(f'{src} -> {dst}', f'cls({src}={value!r}).{dst}', number)
+
+    statement = 'cls(rgb=(83, 237, 229)).scheme(Schemes.TRIADIC)'
+    row('scheme(TRIADIC)', statement, number // 4)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+'''
+Benchmark suite, needs pytest-benchmark
+
+Usage:
+    tox -e bench
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare --max-colors 100000
+
+Results are saved as JSON in `.benchmarks/` with `--benchmark-autosave`,
+and compared with the previous run using `--benchmark-compare`.
+'''
+import pytest
+
+from acrylic.Defaults import SCHEMAS
+
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    collect_ignore_glob = ['test_*.py']
+
+
+# number of colors converted by the loop benchmarks
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+
+# a valid value for every colorspace, all for the same color
+VALUES = {
+    'rgb': (127, 255, 212),
+    'hsl': (159.84, 100.0, 74.9),
+    'hsv': (159.84, 50.2, 100.0),
+    'hex': '#7FFFD4',
+    'name': 'aquamarine',
+    'ryb': (0, 77, 128),
+    'xyz': (56.391, 80.781, 74.895),
+    'lab': (92.03, -45.52, 9.72),
+    'lch': (92.03, 46.55, 167.95),
+    'oklab': (0.91499, -0.12799, 0.0249),
+}
+
+assert set(VALUES) == set(SCHEMAS)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--max-colors', type=int, default=max(SIZES),
+        help='largest number of colors used by the loop benchmarks',
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if 'size' in metafunc.fixturenames:
+        limit = metafunc.config.getoption('max_colors')
+        sizes = [x for x in SIZES if x <= limit]
+        metafunc.parametrize('size', sizes)
+
+
+@pytest.fixture(params=list(SCHEMAS))
+def colorspace(request):
+    return request.param
+
+
+@pytest.fixture
+def value(colorspace):
+    return VALUES[colorspace]
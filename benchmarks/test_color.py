@@ -0,0 +1,42 @@
+'''
+Construction of colors and access of their lazily converted properties
+'''
+from acrylic import Color
+
+
+ROUNDS = 20000
+
+
+def test_construction(benchmark, colorspace, value):
+    benchmark(lambda: Color(**{colorspace: value}))
+
+
+def test_unchecked_construction(benchmark):
+    benchmark(Color.from_rgb_unchecked, 127, 255, 212)
+
+
+def test_first_access(benchmark, colorspace):
+    # converting from rgb on the first access of a new color
+    def setup():
+        return (Color.from_rgb_unchecked(127, 255, 212), colorspace), {}
+
+    benchmark.pedantic(getattr, setup=setup, rounds=ROUNDS)
+
+
+def test_first_access_to_rgb(benchmark, colorspace, value):
+    # converting to rgb on the first access of a new color
+    def setup():
+        return (Color(**{colorspace: value}), 'rgb'), {}
+
+    benchmark.pedantic(getattr, setup=setup, rounds=ROUNDS)
+
+
+def test_cached_access(benchmark, colorspace):
+    color = Color.from_rgb_unchecked(127, 255, 212)
+    getattr(color, colorspace)
+    benchmark(getattr, color, colorspace)
+
+
+def test_equality(benchmark):
+    color, other = Color(hex='#7FFFD4'), Color(name='aquamarine')
+    benchmark(color.__eq__, other)
@@ -0,0 +1,87 @@
+'''
+Loops over large numbers of colors, from 10^3 up to `--max-colors`
+'''
+import random
+
+import pytest
+
+from acrylic import Color, Schemes
+from acrylic.Validators import validate_string
+
+
+def rgbs(size):
+    rng = random.Random(size)
+    return [
+        (rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255))
+        for _ in range(size)
+    ]
+
+
+def run(benchmark, function, size):
+    # large loops take seconds, so they are only run a few times
+    rounds = max(1, 10 ** 5 // size)
+    benchmark.extra_info['colors'] = size
+    benchmark.pedantic(function, rounds=min(rounds, 20), iterations=1)
+
+
+def test_construct(benchmark, size):
+    values = rgbs(size)
+    run(benchmark, lambda: [Color(rgb=x) for x in values], size)
+
+
+def test_construct_and_convert(benchmark, size):
+    values = rgbs(size)
+    run(benchmark, lambda: [Color(rgb=x).hsl for x in values], size)
+
+
+def test_hex_to_name(benchmark, size):
+    values = [Color(rgb=x).hex for x in rgbs(size)]
+    run(benchmark, lambda: [Color(hex=x).name for x in values], size)
+
+
+def test_validate_hex(benchmark, size):
+    values = [Color(rgb=x).hex.lower() for x in rgbs(size)]
+    run(benchmark, lambda: [validate_string(x, 'hex') for x in values], size)
+
+
+def test_parse_hex(benchmark, size):
+    # the same values as one buffer, like the lines of a file
+    pytest.importorskip('numpy')
+    from acrylic.Arrays import parse_hex
+
+    values = [Color(rgb=x).hex.lower() for x in rgbs(size)]
+    buffer = '\n'.join(values).encode()
+    run(benchmark, lambda: parse_hex(buffer), size)
+
+
+def test_iter_gradient(benchmark, size):
+    from acrylic.Gradients import iter_gradient
+
+    stops = [Color(rgb=x) for x in rgbs(5)]
+    run(benchmark, lambda: list(iter_gradient(stops, size, method='spline')),
+        size)
+
+
+def test_gradient(benchmark, size):
+    pytest.importorskip('numpy')
+    from acrylic.Gradients import gradient
+
+    stops = [Color(rgb=x) for x in rgbs(5)]
+    run(benchmark, lambda: gradient(stops, size, method='spline', dst='hex'),
+        size)
+
+
+def test_unique(benchmark, size):
+    # hashing, which converts every color to rgb
+    values = [Color(rgb=x).hsv for x in rgbs(size)]
+    run(benchmark, lambda: len({Color(hsv=x) for x in values}), size)
+
+
+def test_schemes(benchmark, size):
+    # schemes take much longer than conversions, only use a tenth as many
+    colors = [Color(rgb=x) for x in rgbs(size // 10)]
+
+    def schemes():
+        return [x.scheme(Schemes.TRIADIC) for x in colors]
+
+    run(benchmark, schemes, len(colors))
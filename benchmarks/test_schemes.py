@@ -0,0 +1,29 @@
+'''
+Color schemes of a single color, for every scheme
+'''
+import random
+
+import pytest
+
+from acrylic import Color, Schemes
+
+
+SCHEMES = [
+    'ANALOGOUS', 'COMPLEMENTARY', 'TRIADIC', 'TETRADIC', 'MONOCHROMATIC',
+    'SHADES', 'SPLIT_COMPLEMENTARY', 'ACCENTED_ANALOGOUS', 'RECTANGLE',
+    'NEAR_COMPLEMENTARY', 'COMPLEMENTARY_TRIADIC', 'MODIFIED_TRIADIC',
+]
+
+
+@pytest.mark.parametrize('name', SCHEMES)
+@pytest.mark.parametrize('in_rgb', [False, True], ids=['ryb', 'rgb'])
+def test_scheme(benchmark, name, in_rgb):
+    color = Color(rgb=(83, 237, 229))
+    rng = random.Random(0)
+    benchmark(color.scheme, getattr(Schemes, name), in_rgb, rng=rng)
+
+
+def test_scheme_fuzzy(benchmark):
+    color = Color(rgb=(83, 237, 229))
+    rng = random.Random(0)
+    benchmark(color.scheme, Schemes.TRIADIC, fuzzy=Schemes.RANDOM, rng=rng)
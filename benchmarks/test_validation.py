@@ -0,0 +1,33 @@
+'''
+Validation of values given to `Color()`
+'''
+import random
+
+import pytest
+
+from acrylic import RANDOM
+from acrylic.Validators import validate_string, validate_values
+
+
+@pytest.mark.parametrize('value', [
+    '#7FFFD4', '7fffd4', '0x7fffd4', '#7fd', '#7FFFD4FF',
+])
+def test_hex(benchmark, value):
+    benchmark(validate_string, value, 'hex')
+
+
+@pytest.mark.parametrize('value', ['aquamarine', ' Aqua Marine '])
+def test_name(benchmark, value):
+    benchmark(validate_string, value, 'name')
+
+
+@pytest.mark.parametrize('colorspace, value', [
+    ('rgb', (127, 255, 212)),
+    ('rgb', [127.0, '255', 212]),
+    ('hsl', (159.84, 100.0, 74.9)),
+    ('lab', (92.03, -45.52, 9.72)),
+    ('hsv', (RANDOM, (20, 70), 95)),
+], ids=['rgb', 'rgb-mixed', 'hsl', 'lab', 'hsv-random'])
+def test_values(benchmark, colorspace, value):
+    rng = random.Random(0)
+    benchmark(validate_values, value, colorspace, rng)
@@ -30,4 +30,7 @@ setuptools.setup(
         'Tracker': 'https://github.com/prdx23/acrylic/issues',
     },
     python_requires='>=3.6',
+    extras_require={
+        'numpy': ['numpy'],
+    },
 )
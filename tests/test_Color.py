@@ -1,7 +1,9 @@
+import gc
+
 import pytest
 from pytest import approx
 
-from acrylic import Color, RANDOM
+from acrylic import Color, PreciseColor, RANDOM, Schemes
 from acrylic.Defaults import SCHEMAS, Rgb
 
 
@@ -62,6 +64,31 @@ class Test_Color():
         test_set = set([color1, color2, color3])
         assert len(test_set) == 1
 
+    def test_int(self):
+        color = Color.from_int(0x7FFFD4)
+        assert color.rgb == (127, 255, 212)
+        assert color == Color(name='aquamarine')
+        assert Color.from_int(0).rgb == (0, 0, 0)
+        assert Color.from_int(0xFFFFFF).hex == '#FFFFFF'
+
+        assert Color(hsl=[160, 100, 75]).to_int() == 0x80FFD4
+        assert Color(name='aquamarine').to_int() == 0x7FFFD4
+        assert hex(Color(rgb=[1, 2, 3])) == '0x10203'
+        assert [0, 1, 2][Color(rgb=[0, 0, 1])] == 1
+
+        # packed directly from hex without converting to rgb
+        color = Color(hex='#80ffd4')
+        assert color.to_int() == 0x80FFD4
+        assert color._rgb is None
+        assert hash(color) == hash(Color(rgb=[128, 255, 212]))
+
+        with pytest.raises(ValueError):
+            Color.from_int(0x1000000)
+        with pytest.raises(ValueError):
+            Color.from_int(-1)
+        with pytest.raises(TypeError):
+            Color.from_int(None)
+
     def test_lazy_eval(self):
         color = Color(hsl=[160, 100, 75])
         assert color._hsl == (160, 100, 75)
@@ -73,6 +100,78 @@ class Test_Color():
         assert color._rgb == (128, 255, 212)
         assert color._hex == '#80FFD4'
 
+    def test_direct_conversion(self):
+        # hsl to hsv does not go through rgb, so it is not rounded to
+        # integer rgb values on the way
+        color = Color(hsl=[300, 2, 10])
+        assert color.hsv == (300, 3.92, 10.2)
+        assert color._rgb is None
+        assert Color(hsv=color.hsv).hsl == (300, 2, 10)
+
+        color = Color(hex='#7fffd4')
+        assert color.name == 'aquamarine'
+        assert color._rgb is None
+
+    def test_slots(self):
+        color = Color(hsl=[160, 100, 75])
+        assert not hasattr(color, '__dict__')
+
+        with pytest.raises(AttributeError):
+            color.test = 'test'
+
+        class SubColor(Color):
+            pass
+
+        color = SubColor(hex='#80ffd4')
+        assert color._rgb is None
+        assert color.rgb == (128, 255, 212)
+        assert color == Color(rgb=[128, 255, 212])
+
+    def test_unchecked(self):
+        color = Color.from_rgb_unchecked(128, 255, 212)
+        assert color == Color(rgb=[128, 255, 212])
+        assert isinstance(color.rgb, Rgb)
+        assert color._hsl is None
+        assert repr(color) == 'Color(rgb=(128, 255, 212))'
+
+        color = Color.from_hsl_unchecked(160.0, 100.0, 75.0)
+        assert color.hsl == Color(hsl=[160, 100, 75]).hsl
+        assert color.rgb == (128, 255, 212)
+
+        color = Color.from_hex_unchecked('#80FFD4')
+        assert color.hex == '#80FFD4'
+        assert color.rgb == (128, 255, 212)
+
+        color = Color.from_name_unchecked('aquamarine')
+        assert color.rgb == (127, 255, 212)
+
+        for colorspace in SCHEMAS:
+            assert hasattr(Color, f'from_{colorspace}_unchecked')
+
+    def test_intern(self):
+        color = Color.intern(hex='#80ffd4')
+        assert Color.intern(rgb=[128, 255, 212]) is color
+        assert Color.intern(hsl=[160, 100, 75]) is color
+        assert Color.intern(rgb=[128, 255, 213]) is not color
+        assert color == Color(hex='#80ffd4')
+        assert repr(color) == 'Color(rgb=(128, 255, 212))'
+
+        hsl = color.hsl
+        assert Color.intern(name='aquamarine').hsl is not hsl
+        assert Color.intern(hex='#80FFD4').hsl is hsl
+
+        assert 0x80FFD4 in Color._interned
+        del color, hsl
+        gc.collect()
+        assert 0x80FFD4 not in Color._interned
+
+        class SubColor(Color):
+            pass
+
+        color = SubColor.intern(hex='#80ffd4')
+        assert isinstance(color, SubColor)
+        assert SubColor.intern(rgb=[128, 255, 212]) is color
+
     def test_immutability(self):
         color = Color(rgb=[128, 255, 212])
 
@@ -123,3 +222,279 @@ class Test_Color():
         check_all(Color(ryb=[0, 77, 128]))
         check_all(Color(hex='#7FFFD4'))
         check_all(Color(name='aquamarine'))
+
+
+class Test_alpha():
+
+    def test_rgba(self):
+        color = Color(rgba=[128, 255, 212, 0.5])
+        assert color.alpha == 0.5
+        assert color.rgb == (128, 255, 212)
+        assert color.rgba == (128, 255, 212, 0.5)
+        assert color.rgba.a == 0.5
+        assert color.hsla == (159.69, 100.0, 75.1, 0.5)
+        assert color.hsl == Color(rgb=[128, 255, 212]).hsl
+        assert color.hexa == '#80FFD480'
+
+        color = Color(hsla=[160, 100, 75, 0.25])
+        assert color.hsla == (160.0, 100.0, 75.0, 0.25)
+        assert color.rgba == (128, 255, 212, 0.25)
+
+        assert Color().alpha == 1.0
+        assert Color(rgb=[128, 255, 212]).hexa == '#80FFD4FF'
+        assert Color(rgba=[128, 255, 212, (0.2, 0.4)]).alpha == approx(
+            0.3, abs=0.1
+        )
+        assert 0 <= Color(rgba=[128, 255, 212, RANDOM]).alpha <= 1
+        assert 0 <= Color(hsla=RANDOM).alpha <= 1
+
+        with pytest.raises(ValueError):
+            Color(rgba=[128, 255, 212, 1.5])
+        with pytest.raises(ValueError):
+            Color(rgba=[128, 255, 212])
+        with pytest.raises(AttributeError):
+            color.rgba = (1, 2, 3, 0.5)
+
+    def test_hex(self):
+        color = Color(hex='#80ffd480')
+        assert color.hex == '#80FFD4'
+        assert color.alpha == 0.502
+        assert color.hexa == '#80FFD480'
+        assert Color(hex='#80ffd4').alpha == 1.0
+        assert Color(hex='#8fd').alpha == 1.0
+
+        for alpha in range(256):
+            value = f'#80FFD4{alpha:02X}'
+            assert Color(hex=value).hexa == value
+            assert PreciseColor(hex=value).hexa == value
+
+    def test_repr(self):
+        for color in [
+            Color(rgba=[128, 255, 212, 0.5]),
+            Color(hsla=[160, 100, 75, 0.25]),
+            Color(hex='#80ffd480'),
+            Color(name='aquamarine').with_alpha(0.5),
+            Color(rgba=[128, 255, 212, 1]),
+        ]:
+            assert eval(repr(color)) == color
+
+        assert repr(Color(hex='#80ffd480')) == "Color(hex='#80FFD480')"
+        assert repr(Color(lab=[50, 10, 10]).with_alpha(0.5)) == (
+            'Color(rgba=(142, 113, 102, 0.5))'
+        )
+        assert repr(Color(rgba=[1, 2, 3, 1])) == 'Color(rgb=(1, 2, 3))'
+
+    def test_equality(self):
+        color = Color(rgba=[128, 255, 212, 0.5])
+        assert color == Color(hsla=[160, 100, 75, 0.5])
+        assert color != Color(rgb=[128, 255, 212])
+        assert color != Color(rgba=[128, 255, 212, 0.25])
+        assert Color(hex='#80ffd480') == Color(rgba=[128, 255, 212, 0.502])
+        assert PreciseColor(hex='#80ffd480') == Color(hex='#80ffd480')
+        assert hash(color) == hash(Color(rgb=[128, 255, 212]))
+
+        color = Color.intern(rgba=[128, 255, 212, 0.5])
+        assert Color.intern(hsla=[160, 100, 75, 0.5]) is color
+        assert Color.intern(rgb=[128, 255, 212]) is not color
+        assert Color.intern(rgb=[128, 255, 212]).alpha == 1.0
+        assert color.alpha == 0.5
+
+    def test_with_alpha(self):
+        color = Color(hsv=[160, 50, 100])
+        transparent = color.with_alpha(0.25)
+        assert transparent.alpha == 0.25
+        assert transparent.hsv == color.hsv
+        assert color.alpha == 1.0
+        assert transparent.with_alpha(1) == color
+        assert 0 <= color.with_alpha(RANDOM).alpha <= 1
+        assert PreciseColor(rgb=[1, 2, 3]).with_alpha(0.1234).alpha == 0.1234
+        assert Color(rgb=[1, 2, 3]).with_alpha(0.1234).alpha == 0.123
+
+        with pytest.raises(ValueError):
+            color.with_alpha(-0.5)
+        with pytest.raises(ValueError):
+            color.with_alpha('opaque')
+
+    def test_rounded(self):
+        color = PreciseColor(hex='#80ffd480')
+        assert color.alpha == 128 / 255
+        assert color.rounded().alpha == 0.502
+        assert repr(color.rounded()) == "Color(hex='#80FFD480')"
+
+    def test_composite(self):
+        pytest.importorskip('numpy')
+
+        red = Color(rgba=[255, 0, 0, 0.5])
+        assert red.composite(Color(name='blue')) == Color(rgb=[128, 0, 128])
+        assert red.composite(Color(rgba=[0, 0, 255, 0.3])).rgba == (
+            196, 0, 59, 0.65
+        )
+        assert red.composite(Color(name='blue'), 'in') == red
+        assert red.composite(Color(name='blue'), 'dst') == Color(name='blue')
+
+        color = PreciseColor(rgba=[255, 0, 0, 0.5])
+        assert color.composite(PreciseColor(name='blue')).rgba == (
+            127.5, 0.0, 127.5, 1.0
+        )
+
+
+class Test_manipulations():
+
+    color = Color(rgb=[83, 237, 229])
+
+    def test_lightness(self):
+        assert self.color.lighten(10).hsl == (176.88, 81.05, 72.75)
+        assert self.color.darken(20).hsl == (176.88, 81.05, 42.75)
+        assert self.color.lighten(50).hsl.l == 100.0
+        assert self.color.darken(100).hsl.l == 0.0
+        assert self.color.lighten(0) == self.color
+        assert repr(self.color.lighten(10)) == (
+            'Color(hsl=(176.88, 81.05, 72.75))'
+        )
+
+    def test_saturation(self):
+        assert self.color.saturate(10).hsl == (176.88, 91.05, 62.75)
+        assert self.color.saturate(30).hsl.s == 100.0
+        assert self.color.desaturate(30).hsl == (176.88, 51.05, 62.75)
+        assert self.color.desaturate(100).hsl.s == 0.0
+
+    def test_rotate_hue(self):
+        assert self.color.rotate_hue(10).hsl == (186.88, 81.05, 62.75)
+        assert self.color.rotate_hue(-200).hsl.h == 336.88
+        assert self.color.rotate_hue(360).hsl.h == 176.88
+        assert self.color.rotate_hue(183.123).hsl.h == 0.0
+
+    def test_mix(self):
+        red = Color(name='red')
+        assert self.color.mix(red).rgb == (169, 118, 114)
+        assert self.color.mix(red, 1) == self.color
+        assert self.color.mix(red, 0) == red
+        assert self.color.mix(red, 0.25).rgb == (212, 59, 57)
+
+        mixed = Color(rgba=[255, 0, 0, 0.5]).mix(Color(rgba=[0, 0, 255, 1]))
+        assert mixed.rgba == (128, 0, 128, 0.75)
+
+    def test_blend(self):
+        grey = Color(rgb=[128, 128, 128])
+        white, black = Color(name='white'), Color(name='black')
+        assert self.color.blend(white) == self.color
+        assert self.color.blend(grey).rgb == (42, 119, 115)
+        assert self.color.blend(black, 'screen') == self.color
+        assert self.color.blend(grey, 'screen').rgb == (169, 246, 242)
+        assert self.color.blend(grey, 'overlay').rgb == (84, 237, 229)
+        assert black.blend(self.color, 'overlay').rgb == (0, 219, 203)
+
+    def test_alpha(self):
+        color = self.color.with_alpha(0.5)
+        for result in [
+            color.lighten(10), color.darken(10), color.saturate(10),
+            color.desaturate(10), color.rotate_hue(10),
+            color.blend(Color(name='grey')),
+        ]:
+            assert result.alpha == 0.5
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            self.color.lighten(101)
+        with pytest.raises(ValueError):
+            self.color.darken(-1)
+        with pytest.raises(ValueError):
+            self.color.saturate('more')
+        with pytest.raises(ValueError):
+            self.color.mix(Color(), 1.5)
+        with pytest.raises(ValueError):
+            self.color.blend(Color(), 'burn')
+        with pytest.raises(TypeError):
+            self.color.rotate_hue(None)
+
+    def test_precise(self):
+        color = PreciseColor(rgb=[83, 237, 229])
+        lighter = color.lighten(10.005)
+        assert isinstance(lighter, PreciseColor)
+        assert lighter.hsl.l == approx(color.hsl.l + 10.005)
+        assert color.mix(PreciseColor(name='red')).rgb == (169, 118.5, 114.5)
+
+
+class Test_PreciseColor():
+
+    def test_unrounded(self):
+        color = PreciseColor(hsl=[176.5, 51.6, 62.1])
+        assert color.hsl == (176.5, 51.6, 62.1)
+        assert not color.rgb.r.is_integer()
+        assert color.hsv.s == approx(47.8992461)
+
+        color = PreciseColor(rgb=[12.5, 255, 0.25])
+        assert color.rgb == (12.5, 255, 0.25)
+        assert color.hex == '#0CFF00'
+        assert PreciseColor(hsl=[12.345678, 0, 0]).hsl.h == 12.345678
+
+        color = PreciseColor(rgb=[RANDOM, (10, 20), 5])
+        assert all(isinstance(x, float) for x in color.rgb)
+
+        with pytest.raises(ValueError):
+            PreciseColor(rgb=[255.5, 0, 0])
+
+    def test_round_trip(self):
+        # converting back and forth keeps the original values
+        values = [(183.3, 99.99, 61.07), (0.01, 0.5, 50), (300, 2, 10)]
+        for hsl in values:
+            color = PreciseColor(hsl=hsl)
+            for colorspace in ['rgb', 'hsv', 'ryb']:
+                value = getattr(color, colorspace)
+                other = PreciseColor(**{colorspace: value})
+                assert other.hsl == approx(hsl, abs=1e-9)
+
+            # the published sRGB <-> XYZ matrices are not exact inverses
+            for colorspace in ['xyz', 'lab', 'lch', 'oklab']:
+                value = getattr(color, colorspace)
+                other = PreciseColor(**{colorspace: value})
+                assert other.rgb == approx(color.rgb, abs=1e-3)
+
+    def test_rounded(self):
+        color = PreciseColor(hsl=[176.5, 51.6, 62.1])
+        assert type(color.rounded()) is Color
+        assert color.rounded() == Color(hsl=[176.5, 51.6, 62.1])
+        # rgb is rounded to the nearest integer, like hex and to_int()
+        for rgb in [[12.7, 0, 0], [12.5, 0, 3.7], [9.8, 20.2, 254.99]]:
+            color = PreciseColor(rgb=rgb)
+            assert color.rounded() == color
+            assert hash(color.rounded()) == hash(color)
+            assert color.rounded().hex == color.hex
+            assert color.rounded().name == color.name
+        assert PreciseColor(rgb=[12.7, 0, 0]).rounded().hex == '#0D0000'
+        assert repr(PreciseColor(rgb=[12.5, 0, 3.7]).rounded()) == (
+            'Color(rgb=(12, 0, 4))'
+        )
+
+    def test_equality(self):
+        color = PreciseColor(rgb=[127.4, 254.6, 212])
+        assert color == Color(rgb=[127, 255, 212])
+        assert Color(rgb=[127, 255, 212]) == color
+        assert hash(color) == hash(Color(rgb=[127, 255, 212]))
+        assert len({color, Color(name='aquamarine')}) == 1
+        assert color.to_int() == 0x7FFFD4
+
+        # precise colors compare unrounded values
+        assert PreciseColor.from_int(0x7FFFD4) != color
+        assert PreciseColor(rgb=[127.4, 254.6, 212.0]) == color
+        assert PreciseColor(rgba=[127.4, 254.6, 212, 0.5]) != color
+        assert len({color, PreciseColor.from_int(0x7FFFD4)}) == 2
+
+    def test_intern(self):
+        color = PreciseColor.intern(rgb=[10.2, 20, 30])
+        other = PreciseColor.intern(rgb=[9.8, 20, 30])
+        assert other is not color
+        assert other.rgb == (9.8, 20.0, 30.0)
+        assert PreciseColor.intern(rgb=[10.2, 20, 30]) is color
+        assert PreciseColor.intern(hex='#0A141E') is not color
+
+    def test_scheme(self):
+        color = PreciseColor(hsl=[176.5, 51.6, 62.1])
+        colors = color.scheme(Schemes.TRIADIC, in_rgb=True)
+        assert all(type(x) is PreciseColor for x in colors)
+        assert [x.hsl.h for x in colors] == approx([296.5, 56.5])
+        assert [x.hsl.s for x in colors] == approx([51.6, 51.6])
+
+        colors = color.scheme(Schemes.TRIADIC)
+        assert all(type(x) is PreciseColor for x in colors)
+        assert [x.hsl.l for x in colors] == approx([62.1, 62.1])
@@ -0,0 +1,116 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from acrylic import Color, ColorArray  # noqa: E402
+
+
+class Test_ColorArray():
+
+    rgbs = [[62, 244, 255], [255, 0, 0], [25, 24, 25], [127, 255, 212]]
+
+    def test_basic(self):
+        colors = ColorArray(rgb=self.rgbs)
+        assert len(colors) == 4
+        assert colors.rgb.dtype == np.uint8
+        assert colors.rgb.tolist() == self.rgbs
+        assert colors.nbytes == 12
+
+        assert len(ColorArray()) == 0
+        assert ColorArray().hsl.shape == (0, 3)
+
+    def test_init_errors(self):
+        with pytest.raises(TypeError):
+            ColorArray(rgb=self.rgbs, hex=['#3ef4ff'])
+
+        with pytest.raises(TypeError):
+            ColorArray(abc=self.rgbs)
+
+        with pytest.raises(ValueError):
+            ColorArray(rgb=[[256, 0, 0]])
+
+    def test_conversion(self):
+        colors = ColorArray(rgb=self.rgbs)
+        for rgb, hsl, hex_code, name in zip(
+                self.rgbs, colors.hsl, colors.hex, colors.name):
+            color = Color(rgb=rgb)
+            assert tuple(hsl) == color.hsl
+            assert hex_code == color.hex
+            assert name == color.name
+
+        colors = ColorArray(hex=['#3EF4FF', '#f00'])
+        assert colors.rgb.tolist() == self.rgbs[:2]
+
+        colors = ColorArray(hsl=[[160, 100, 75]])
+        assert colors.rgb.tolist() == [list(Color(hsl=[160, 100, 75]).rgb)]
+
+    def test_lazy_eval(self):
+        colors = ColorArray(rgb=self.rgbs)
+        assert colors._hsl is None
+        assert colors._hex is None
+
+        hsl = colors.hsl
+        assert colors._hsl is hsl
+        assert colors.hsl is hsl
+        assert colors._hex is None
+
+    def test_immutability(self):
+        colors = ColorArray(rgb=self.rgbs)
+
+        with pytest.raises(AttributeError):
+            colors.rgb = 'test'
+
+        with pytest.raises(ValueError):
+            colors.rgb[0, 0] = 0
+
+        with pytest.raises(ValueError):
+            colors.hsl[0, 0] = 0
+
+    def test_indexing(self):
+        colors = ColorArray(rgb=self.rgbs)
+        assert colors[0] == Color(rgb=self.rgbs[0])
+        assert colors[-1] == Color(rgb=self.rgbs[-1])
+        assert isinstance(colors[1], Color)
+        assert list(colors) == [Color(rgb=x) for x in self.rgbs]
+
+        assert isinstance(colors[1:3], ColorArray)
+        assert colors[1:3].rgb.tolist() == self.rgbs[1:3]
+
+        # lists, arrays and boolean masks of indices select colors
+        mask = np.array([True, False, True, False])
+        for index in ([0, 2], np.array([0, 2]), mask):
+            selected = colors[index]
+            assert isinstance(selected, ColorArray)
+            assert selected.rgb.tolist() == [self.rgbs[0], self.rgbs[2]]
+        assert colors[[0, 1, 2]].rgb.tolist() == self.rgbs[:3]
+        assert len(colors[np.zeros(4, dtype=bool)]) == 0
+        assert colors[np.int64(1)] == Color(rgb=self.rgbs[1])
+
+        with pytest.raises(IndexError):
+            colors[0, 1]
+        with pytest.raises(IndexError):
+            colors[:, 0]
+
+    def test_buffer(self):
+        colors = ColorArray(rgb=self.rgbs)
+        colors = ColorArray.frombuffer(colors.tobytes())
+        assert colors.rgb.tolist() == self.rgbs
+        assert len(colors.tobytes()) == 12
+
+        with pytest.raises(ValueError):
+            ColorArray.frombuffer(b'\x00\x00')
+
+        colors = ColorArray.from_colors([Color(hex='#3EF4FF'), Color()])
+        assert colors.rgb.tolist() == [[62, 244, 255], [0, 0, 0]]
+
+    def test_ints(self):
+        colors = ColorArray(rgb=self.rgbs)
+        ints = colors.to_ints()
+        assert ints.tolist() == [Color(rgb=x).to_int() for x in self.rgbs]
+        assert ColorArray.from_ints(ints).rgb.tolist() == self.rgbs
+
+        colors = ColorArray.from_ints([0x7FFFD4, 0])
+        assert colors.name.tolist() == ['aquamarine', 'black']
+
+        with pytest.raises(ValueError):
+            ColorArray.from_ints([0x1000000])
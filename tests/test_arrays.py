@@ -0,0 +1,269 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from acrylic.Defaults import SCHEMAS, RANDOM  # noqa: E402
+from acrylic.Validators import validate  # noqa: E402
+from acrylic.Converters import rgb_to, rgb_from, direct  # noqa: E402
+from acrylic.Arrays import (  # noqa: E402
+    convert, round_array, sample, pack, unpack, parse_hex
+)
+from acrylic.Arrays import validate as validate_array  # noqa: E402
+
+
+class Test_convert():
+
+    rgbs = np.array([
+        (62, 244, 255), (255, 0, 0), (25, 24, 25), (127, 255, 212),
+        (0, 0, 0), (255, 255, 255), (128, 128, 128), (0, 255, 255),
+    ])
+    random_rgbs = np.random.default_rng(0).integers(0, 256, (5000, 3))
+
+    def check_rgb_to(self, rgbs, colorspace):
+        result = convert(rgbs, 'rgb', colorspace)
+        expected = [rgb_to[colorspace](tuple(x)) for x in rgbs.tolist()]
+
+        assert len(result) == len(expected)
+        for value, scalar in zip(result.tolist(), expected):
+            if SCHEMAS[colorspace].validation_type == 'values':
+                assert tuple(value) == tuple(scalar)
+            else:
+                assert value == scalar
+
+    def check_rgb_from(self, values, colorspace):
+        result = convert(values, colorspace, 'rgb')
+
+        values = values.tolist()
+        if SCHEMAS[colorspace].validation_type == 'values':
+            values = [tuple(x) for x in values]
+        expected = [rgb_from[colorspace](validate(x, colorspace))
+                    for x in values]
+
+        for value, scalar in zip(result.tolist(), expected):
+            assert tuple(value) == tuple(scalar)
+
+    def test_rgb_to_matches_scalar(self):
+        for colorspace in rgb_to:
+            self.check_rgb_to(self.rgbs, colorspace)
+            self.check_rgb_to(self.random_rgbs, colorspace)
+
+    def test_rgb_from_matches_scalar(self):
+        for colorspace in rgb_from:
+            if colorspace != 'name':
+                values = convert(self.random_rgbs, 'rgb', colorspace)
+                self.check_rgb_from(values, colorspace)
+
+        # includes values outside the rgb gamut for perceptual colorspaces
+        rng = np.random.default_rng(1)
+        for colorspace in ['hsl', 'hsv', 'xyz', 'lab', 'lch', 'oklab']:
+            schema = SCHEMAS[colorspace]
+            low, high = np.array(schema.format).T
+            values = rng.uniform(low, high, (5000, 3))
+            self.check_rgb_from(np.round(values, schema.precision), colorspace)
+
+        self.check_rgb_from(np.array(['aquamarine', 'red', 'white']), 'name')
+
+    def test_direct_matches_scalar(self):
+        rng = np.random.default_rng(2)
+        for colorspace, other in [('hsl', 'hsv'), ('hsv', 'hsl')]:
+            schema = SCHEMAS[colorspace]
+            low, high = np.array(schema.format).T
+            values = np.round(rng.uniform(low, high, (5000, 3)), 2)
+            values[:100, 2] = rng.choice([0, 100], 100)
+
+            result = convert(values, colorspace, other).tolist()
+            expected = [
+                direct[(colorspace, other)](tuple(x)) for x in values.tolist()
+            ]
+            assert [tuple(x) for x in result] == expected
+
+        result = convert(['#7fffd4', '#7fffd5'], 'hex', 'name')
+        assert result.tolist() == ['aquamarine', '-']
+
+    def test_output_types(self):
+        assert convert(self.rgbs, 'rgb', 'hsl').shape == (8, 3)
+        assert convert(self.rgbs, 'rgb', 'hsl').dtype == np.float64
+        assert convert(self.rgbs, 'rgb', 'ryb').dtype == np.uint8
+        assert convert(self.rgbs, 'rgb', 'hex').shape == (8,)
+        assert convert(self.rgbs, 'rgb', 'rgb').dtype == np.uint8
+        assert convert(np.empty((0, 3)), 'rgb', 'hsv').shape == (0, 3)
+
+    def test_string_inputs(self):
+        result = convert(['#3ef4ff', '3EF4FF', '#3f5', 'ff0000FF'], 'hex')
+        assert result.tolist()[0] == list(rgb_to['hsl']((62, 244, 255)))
+        assert result.tolist()[1] == result.tolist()[0]
+
+        result = convert(['Aqua Marine', 'red'], 'name', 'hex')
+        assert result.tolist() == ['#7FFFD4', '#FF0000']
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            convert([[256, 0, 0]], 'rgb', 'hsl')
+        with pytest.raises(ValueError):
+            convert([[0, 0, -1]], 'rgb', 'hsl')
+        with pytest.raises(ValueError):
+            convert([[360.5, 0, 0]], 'hsl', 'rgb')
+        with pytest.raises(ValueError):
+            convert([[0, 0]], 'rgb', 'hsl')
+        with pytest.raises(ValueError):
+            convert([0, 0, 0], 'rgb', 'hsl')
+        with pytest.raises(ValueError):
+            convert(['#12345'], 'hex', 'rgb')
+        with pytest.raises(ValueError):
+            convert(['notacolor'], 'name', 'rgb')
+        with pytest.raises(ValueError):
+            convert([[0, 0, 0]], 'rgb', 'abc')
+
+        result = convert([[12.9, 0, 255.0]], 'rgb', 'rgb')
+        assert result.tolist() == [[12, 0, 255]]
+        result = convert([[12.345678, 0, 100]], 'hsl', 'hsl')
+        assert result.tolist() == [[12.35, 0, 100]]
+
+
+class Test_pack():
+
+    def test_round_trip(self):
+        rgbs = np.random.default_rng(0).integers(0, 256, (1000, 3))
+        keys = pack(rgbs)
+        assert keys.dtype == np.int64
+        assert keys[:3].tolist() == [
+            (r << 16) | (g << 8) | b for r, g, b in rgbs[:3].tolist()
+        ]
+        assert unpack(keys).dtype == np.uint8
+        assert np.array_equal(unpack(keys), rgbs)
+        assert unpack([]).shape == (0, 3)
+
+        with pytest.raises(ValueError):
+            unpack([0, -1])
+        with pytest.raises(ValueError):
+            unpack([0x1000000])
+
+
+class Test_parse_hex():
+
+    values = [
+        '#80ffd4', '80FFD4', '0x80ffd4', '#0x80ffd4', '#8fd', '8fd',
+        '#80ffd4ff', '0x80ffd4ff', '#0x80ffd4ff', '', '#', '0x', '#8f',
+        '#80ffd', '#80ffd4f', '#80ffd4ff0', '#80ffdg', 'x80ffd4', '#x8fd',
+        '0X80ffd4', '##8fd', '#0x80ffd4ffAB', ' #8fd', '#8fd ', '#8f\x00d',
+        '#8fé', 'aquamarine',
+    ]
+
+    def check(self, values, expected):
+        keys, valid = parse_hex(values)
+        assert keys.dtype == np.int64
+        assert valid.dtype == bool
+        assert keys.tolist() == [
+            int(validate(x, 'hex')[1:], 16) if x else 0 for x in expected
+        ]
+        assert valid.tolist() == [x is not None for x in expected]
+
+    def test_matches_scalar(self):
+        expected = []
+        for value in self.values:
+            try:
+                validate(value, 'hex')
+            except ValueError:
+                expected.append(None)
+            else:
+                expected.append(value)
+
+        assert expected.count(None) == 18
+        self.check(self.values, expected)
+        self.check(np.array(self.values), expected)
+
+    def test_bytes(self):
+        buffer = b'#80ffd4\nnope\r\n  0x8FD\t#80ffd4ff\n\n#8f\n'
+        expected = ['#80ffd4', None, '0x8FD', '#80ffd4ff', None]
+        self.check(buffer, expected)
+        self.check(bytearray(buffer), expected)
+        self.check(memoryview(buffer), expected)
+        self.check(np.array(buffer.split()), expected)
+        self.check(b'', [])
+        self.check(b' \n ', [])
+        self.check([], [])
+
+    def test_validate(self):
+        values = ['#80ffd4', '8fd', '0x80ffd4ff']
+        result = validate_array(values, 'hex')
+        assert result.tolist() == ['#80FFD4', '#88FFDD', '#80FFD4']
+        with pytest.raises(ValueError, match='nope'):
+            validate_array(values + ['nope'], 'hex')
+
+
+class Test_round_array():
+
+    def test_matches_round(self):
+        values = np.array([0.125, 2.675, 1.005, 0.285, 176.885, 62.745])
+        values = np.concatenate([values, np.random.default_rng(0).random(999)])
+        expected = [round(x, 2) for x in values.tolist()]
+        assert round_array(values, 2).tolist() == expected
+
+
+class Test_sample():
+
+    def test_ranges(self):
+        result = sample([RANDOM, (20, 70), 62.123], 'hsl', 10000, rng=0)
+        assert result.shape == (10000, 3) and result.dtype == np.float64
+        assert result[:, 0].min() >= 0 and result[:, 0].max() <= 360
+        assert result[:, 1].min() >= 20 and result[:, 1].max() <= 70
+        assert (result[:, 2] == 62.12).all()
+        assert result.tolist() == round_array(result, 2).tolist()
+
+        result = sample([(RANDOM, 100), (50, RANDOM), (9, 3)], 'rgb', 1000)
+        assert result.dtype == np.uint8
+        assert result[:, 0].max() <= 100
+        assert result[:, 1].min() >= 50
+        assert result[:, 2].min() >= 3 and result[:, 2].max() <= 9
+        assert len(np.unique(result[:, 2])) == 7
+
+    def test_all_random(self):
+        for colorspace in SCHEMAS:
+            result = sample(RANDOM, colorspace, 1000, rng=1)
+            assert len(result) == 1000
+            # every sampled color is valid, and unchanged by validation
+            for value in result[:50].tolist():
+                assert tuple(validate(value, colorspace)) == tuple(value)
+
+    def test_all_random_negative_components(self):
+        # a and b can be -1, they are still picked from their whole range
+        for colorspace in ['lab', 'oklab']:
+            result = sample(RANDOM, colorspace, 1000, rng=4)
+            (_, a), (_, b) = SCHEMAS[colorspace].format[1:]
+            for i in (1, 2):
+                assert len(np.unique(result[:, i])) > 100
+                assert result[:, i].min() < -a / 2
+                assert result[:, i].max() > b / 2
+
+    def test_negative_components(self):
+        result = sample([50, (-5, 5), -1], 'lab', 100, rng=2)
+        assert (result[:, 2] == -1).all()
+        assert np.abs(result[:, 1]).max() <= 5
+
+    def test_seed(self):
+        spec = [RANDOM, (20, 70), 62]
+        first = sample(spec, 'hsl', 100, rng=5)
+        assert np.array_equal(first, sample(spec, 'hsl', 100, rng=5))
+        generator = np.random.default_rng(5)
+        assert np.array_equal(first, sample(spec, 'hsl', 100, generator))
+        assert not np.array_equal(first, sample(spec, 'hsl', 100, rng=6))
+
+    def test_strings(self):
+        assert sample('Red', 'name', 2).tolist() == ['red', 'red']
+        assert sample('#abc', 'hex', 1).tolist() == ['#AABBCC']
+        hexes = sample(RANDOM, 'hex', 100, rng=3)
+        assert len(set(hexes.tolist())) > 90
+        names = sample(RANDOM, 'name', 100, rng=3)
+        assert set(names.tolist()) <= set(SCHEMAS['name'].format)
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            sample([RANDOM, (20, 170), 62], 'hsl', 10)
+        with pytest.raises(ValueError):
+            sample([RANDOM, (20, 70, 80), 62], 'hsl', 10)
+        with pytest.raises(ValueError):
+            sample([RANDOM, 62], 'hsl', 10)
+        with pytest.raises(TypeError):
+            sample([RANDOM, None, 62], 'hsl', 10)
+        with pytest.raises(ValueError):
+            sample(RANDOM, 'hsx', 10)
@@ -0,0 +1,121 @@
+import threading
+
+import pytest
+
+from acrylic import Cache, Color, RANDOM
+from acrylic.Validators import validators, validate
+from acrylic.Converters import rgb_to, rgb_from
+
+
+@pytest.fixture
+def cache():
+    Cache.enable(maxsize=2)
+    yield Cache
+    Cache.disable()
+
+
+class Test_BoundedCache():
+
+    def test_lru(self):
+        cache = Cache.BoundedCache(maxsize=2, policy='lru')
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+        cache.put('c', 3)
+
+        with pytest.raises(KeyError):
+            cache.get('b')
+        assert cache.get('a') == 1
+        assert cache.info() == (2, 1, 1, 2, 2)
+
+    def test_fifo(self):
+        cache = Cache.BoundedCache(maxsize=2, policy='fifo')
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+        cache.put('c', 3)
+
+        with pytest.raises(KeyError):
+            cache.get('a')
+        assert cache.get('b') == 2
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            Cache.BoundedCache(policy='abc')
+        with pytest.raises(ValueError):
+            Cache.BoundedCache(maxsize=0)
+
+
+class Test_Cache():
+
+    def test_enable_disable(self):
+        original = rgb_to['hsl'], rgb_from['hex'], validators['string']
+
+        Cache.enable()
+        assert rgb_to['hsl'].__wrapped__ is original[0]
+        assert rgb_from['hex'].__wrapped__ is original[1]
+        assert validators['string'].__wrapped__ is original[2]
+
+        Cache.disable()
+        assert rgb_to['hsl'] is original[0]
+        assert rgb_from['hex'] is original[1]
+        assert validators['string'] is original[2]
+        assert Cache.info() == {}
+
+        Cache.disable()
+        assert rgb_to['hsl'] is original[0]
+
+    def test_counters(self, cache):
+        assert Color(hex='#80ffd4').hsl == Color(hex='#80FFD4').hsl
+        assert Color(rgb=[128, 255, 212]).hsl == Color(hex='#80ffd4').hsl
+
+        info = cache.info()
+        assert info['rgb_to.hsl'].hits == 3
+        assert info['rgb_to.hsl'].misses == 1
+        assert info['rgb_from.hex'].hits == 2
+        assert info['validate_string'].misses == 2
+
+        Color(hex='#000000').hsl
+        Color(hex='#000001').hsl
+        assert cache.info()['rgb_to.hsl'].evictions == 1
+        assert cache.info()['rgb_to.hsl'].size == 2
+
+        cache.clear()
+        assert cache.info()['rgb_to.hsl'] == (0, 0, 0, 0, 2)
+
+    def test_random_and_errors(self, cache):
+        # random values are picked again every time, and never cached
+        values = {validate(RANDOM, 'hex') for _ in range(10)}
+        assert len(values) > 1
+        assert cache.info()['validate_string'] == (0, 0, 0, 0, 2)
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                Color(hex='#abc12')
+            with pytest.raises(ValueError):
+                Color(name=['red'])
+
+    def test_threads(self):
+        Cache.enable(maxsize=64)
+        errors = list()
+
+        def work(offset):
+            try:
+                for x in range(500):
+                    rgb = ((x + offset) % 256, x % 100, 7)
+                    expected = rgb_to['hsl'].__wrapped__(rgb)
+                    assert Color(rgb=rgb).hsl == expected
+            except Exception as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=work, args=(x,)) for x in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = Cache.info()['rgb_to.hsl']
+        Cache.disable()
+
+        assert not errors
+        assert info.hits + info.misses == 4000
+        assert info.size == 64
@@ -0,0 +1,76 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from acrylic.Compositing import composite, over, operators  # noqa: E402
+
+
+# expected rgba of a half transparent red on top of a half transparent blue
+EXPECTED = {
+    'clear': [0, 0, 0, 0],
+    'src': [255, 0, 0, 0.5],
+    'dst': [0, 0, 255, 0.5],
+    'over': [170, 0, 85, 0.75],
+    'dst_over': [85, 0, 170, 0.75],
+    'in': [255, 0, 0, 0.25],
+    'dst_in': [0, 0, 255, 0.25],
+    'out': [255, 0, 0, 0.25],
+    'dst_out': [0, 0, 255, 0.25],
+    'atop': [127.5, 0, 127.5, 0.5],
+    'dst_atop': [127.5, 0, 127.5, 0.5],
+    'xor': [127.5, 0, 127.5, 0.5],
+}
+
+assert set(EXPECTED) == set(operators)
+
+
+class Test_composite():
+
+    def test_operators(self):
+        red, blue = [[255, 0, 0, 0.5]], [[0, 0, 255, 0.5]]
+        for operator, expected in EXPECTED.items():
+            result = composite(red, blue, operator)
+            assert result.dtype == np.float64
+            assert result[0].tolist() == pytest.approx(expected)
+
+    def test_integer(self):
+        src = np.array([[255, 0, 0, 128], [0, 255, 0, 0]], dtype=np.uint8)
+        dst = np.array([[0, 0, 255, 255], [10, 20, 30, 255]], dtype=np.uint8)
+        result = over(src, dst)
+        assert result.dtype == np.uint8
+        assert result.tolist() == [[128, 0, 127, 255], [10, 20, 30, 255]]
+        assert over([[255, 0, 0, 128]], [[0, 0, 255, 255]]).tolist() == [
+            [128, 0, 127, 255]
+        ]
+
+        # a float array has alpha from 0 to 1
+        result = over(src, dst.astype(np.float64) / [1, 1, 1, 255])
+        assert result.dtype == np.float64
+        assert result[:, 3].tolist() == [1.0, 1.0]
+
+    def test_opaque(self):
+        rng = np.random.default_rng(0)
+        src = rng.integers(0, 256, (1000, 4)).astype(np.uint8)
+        dst = rng.integers(1, 256, (1000, 4)).astype(np.uint8)
+        src[:, 3] = 255
+        assert np.array_equal(over(src, dst), src)
+        src[:, 3] = 0
+        assert np.array_equal(over(src, dst), dst)
+
+    def test_broadcast(self):
+        image = np.zeros((4, 5, 4), dtype=np.uint8)
+        image[..., 3] = 255
+        overlay = np.array([83, 237, 229, 255], dtype=np.uint8)
+        result = over(overlay, image)
+        assert result.shape == (4, 5, 4)
+        assert (result == overlay).all()
+
+    def test_transparent(self):
+        result = composite([[255, 0, 0, 0.0]], [[0, 0, 255, 0.0]])
+        assert result.tolist() == [[0, 0, 0, 0]]
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            composite([[255, 0, 0, 0.5]], [[0, 0, 255, 0.5]], 'under')
+        with pytest.raises(ValueError):
+            composite([[255, 0, 0]], [[0, 0, 255, 0.5]])
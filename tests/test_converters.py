@@ -1,7 +1,7 @@
 from pytest import approx
 
 from acrylic.Defaults import SCHEMAS
-from acrylic.Converters import rgb_to, rgb_from
+from acrylic.Converters import rgb_to, rgb_from, direct, path, convert
 
 
 class Test_converters():
@@ -12,6 +12,22 @@ class Test_converters():
     hexes = ['#3EF4FF', '#FF0000', '#191819', '#7FFFD4']
     names = ['-', 'red', '-', 'aquamarine']
     rybs = [(0, 94, 193), (255, 0, 0), (231, 230, 230), (0, 77, 128)]
+    xyzs = [
+        (52.379, 72.939, 105.906), (41.246, 21.267, 1.933),
+        (0.903, 0.93, 1.051), (56.391, 80.781, 74.895),
+    ]
+    labs = [
+        (88.42, -40.15, -18.13), (53.24, 80.09, 67.2),
+        (8.4, 0.74, -0.53), (92.03, -45.52, 9.72),
+    ]
+    lchs = [
+        (88.42, 44.05, 204.3), (53.24, 104.55, 40.0),
+        (8.4, 0.91, 324.59), (92.03, 46.55, 167.95),
+    ]
+    oklabs = [
+        (0.88488, -0.12987, -0.05038), (0.62796, 0.22486, 0.12585),
+        (0.21058, 0.00205, -0.0014), (0.91499, -0.12799, 0.0249),
+    ]
 
     def test_rgb_to_hsl(self):
         for rgb, hsl in zip(self.rgbs, self.hsls):
@@ -39,6 +55,30 @@ class Test_converters():
             assert result == approx(ryb, abs=1)
             assert isinstance(result, SCHEMAS['ryb'].output_type)
 
+    def test_rgb_to_xyz(self):
+        for rgb, xyz in zip(self.rgbs, self.xyzs):
+            result = rgb_to['xyz'](rgb)
+            assert result == approx(xyz)
+            assert isinstance(result, SCHEMAS['xyz'].output_type)
+
+    def test_rgb_to_lab(self):
+        for rgb, lab in zip(self.rgbs, self.labs):
+            result = rgb_to['lab'](rgb)
+            assert result == approx(lab)
+            assert isinstance(result, SCHEMAS['lab'].output_type)
+
+    def test_rgb_to_lch(self):
+        for rgb, lch in zip(self.rgbs, self.lchs):
+            result = rgb_to['lch'](rgb)
+            assert result == approx(lch)
+            assert isinstance(result, SCHEMAS['lch'].output_type)
+
+    def test_rgb_to_oklab(self):
+        for rgb, oklab in zip(self.rgbs, self.oklabs):
+            result = rgb_to['oklab'](rgb)
+            assert result == approx(oklab)
+            assert isinstance(result, SCHEMAS['oklab'].output_type)
+
     # - - - - - - - - - -
 
     def test_hsl_to_rgb(self):
@@ -67,3 +107,72 @@ class Test_converters():
             result = rgb_from['ryb'](ryb)
             assert result == approx(rgb, abs=1)
             assert isinstance(result, SCHEMAS['rgb'].output_type)
+
+    def test_xyz_to_rgb(self):
+        for rgb, xyz in zip(self.rgbs, self.xyzs):
+            result = rgb_from['xyz'](xyz)
+            assert result == rgb
+            assert isinstance(result, SCHEMAS['rgb'].output_type)
+
+    def test_lab_to_rgb(self):
+        for rgb, lab in zip(self.rgbs, self.labs):
+            result = rgb_from['lab'](lab)
+            assert result == rgb
+            assert isinstance(result, SCHEMAS['rgb'].output_type)
+
+    def test_lch_to_rgb(self):
+        for rgb, lch in zip(self.rgbs, self.lchs):
+            result = rgb_from['lch'](lch)
+            assert result == rgb
+            assert isinstance(result, SCHEMAS['rgb'].output_type)
+
+    def test_oklab_to_rgb(self):
+        for rgb, oklab in zip(self.rgbs, self.oklabs):
+            result = rgb_from['oklab'](oklab)
+            assert result == rgb
+            assert isinstance(result, SCHEMAS['rgb'].output_type)
+
+
+class Test_direct():
+
+    def test_hsl_hsv(self):
+        pairs = [
+            ((183, 100, 62), (183, 76, 100)),
+            ((0, 100, 50), (0, 100, 100)),
+            ((300, 2, 10), (300, 3.92, 10.2)),
+            ((20, 0, 0), (20, 0, 0)),
+            ((20, 50, 100), (20, 0, 100)),
+        ]
+        for hsl, hsv in pairs:
+            result = direct[('hsl', 'hsv')](hsl)
+            assert result == approx(hsv)
+            assert isinstance(result, SCHEMAS['hsv'].output_type)
+            if 0 < hsl[2] < 100:
+                back = direct[('hsv', 'hsl')](result)
+                assert back == approx(hsl, abs=0.02)
+
+    def test_hex_name(self):
+        assert direct[('hex', 'name')]('#7FFFD4') == 'aquamarine'
+        assert direct[('hex', 'name')]('#7FFFD5') == '-'
+        assert direct[('name', 'hex')]('aquamarine') == '#7FFFD4'
+
+    def test_path(self):
+        assert path('hsl', 'hsv') == ['hsl', 'hsv']
+        assert path('hsl', 'lab') == ['hsl', 'rgb', 'lab']
+        assert path('name', 'hsv') == ['name', 'rgb', 'hsv']
+        assert path('rgb', 'oklab') == ['rgb', 'oklab']
+        assert path('rgb', 'rgb') == ['rgb']
+
+        # every path goes through rgb at most once, and the path to the
+        # previous format is the start of the path
+        for src in SCHEMAS:
+            for dst in SCHEMAS:
+                steps = path(src, dst)
+                assert len(steps) <= 3
+                if len(steps) > 1:
+                    assert path(src, steps[-2]) == steps[:-1]
+
+    def test_convert(self):
+        assert convert((300, 2, 10), 'hsl', 'hsv') == (300, 3.92, 10.2)
+        assert convert((300, 2, 10), 'hsl', 'hex') == '#1A191A'
+        assert convert('#7FFFD4', 'hex', 'rgb') == (127, 255, 212)
@@ -0,0 +1,98 @@
+import pytest
+from pytest import approx
+
+np = pytest.importorskip('numpy')
+
+from acrylic.Arrays import lab_values  # noqa: E402
+from acrylic import Color  # noqa: E402
+from acrylic.Distance import (  # noqa: E402
+    ciede2000, cie94, euclidean, metrics, distances, iter_pairwise, pairwise
+)
+
+
+class Test_distance():
+
+    def test_lab_values(self):
+        lab = lab_values([[255, 255, 255], [0, 0, 0], [255, 0, 0]])
+        assert lab[0] == approx([100, 0, 0], abs=0.01)
+        assert lab[1] == approx([0, 0, 0], abs=0.01)
+        assert lab[2] == approx([53.24, 80.09, 67.20], abs=0.01)
+
+    def test_euclidean(self):
+        a = np.array([[0, 0, 0], [1, 2, 3]])
+        b = np.array([[3, 4, 0], [1, 2, 3]])
+        assert euclidean(a, b).tolist() == [5, 0]
+
+    def test_ciede2000(self):
+        # test data from Sharma, Wu and Dalal
+        pairs = [
+            ((50, 2.6772, -79.7751), (50, 0, -82.7485), 2.0425),
+            ((50, 0, 0), (50, -1, 2), 2.3669),
+            ((50, 2.5, 0), (73, 25, -18), 27.1492),
+            ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387),
+             1.2644),
+            ((2.0776, 0.0795, -1.135), (0.9033, -0.0636, -0.5514), 0.9082),
+        ]
+        lab1 = np.array([x[0] for x in pairs])
+        lab2 = np.array([x[1] for x in pairs])
+        expected = [x[2] for x in pairs]
+
+        assert ciede2000(lab1, lab2) == approx(expected, abs=1e-4)
+        assert ciede2000(lab2, lab1) == approx(expected, abs=1e-4)
+        assert ciede2000(lab1, lab1) == approx([0] * 5, abs=1e-6)
+
+    def test_cie94(self):
+        lab1 = np.array([[50, 0, 0], [50, 10, 0], [60, 3, 4]])
+        lab2 = np.array([[50, 10, 0], [50, 0, 0], [50, 3, 4]])
+        expected = [10, 10 / 1.45, 10]
+        assert cie94(lab1, lab2) == approx(expected)
+
+
+class Test_matrices():
+
+    rgbs = np.random.default_rng(0).integers(0, 256, (300, 3))
+
+    def test_distances(self):
+        for metric, (space, distance) in metrics.items():
+            points = space(self.rgbs)
+            result = distances(self.rgbs[7], self.rgbs, metric)
+            assert result.shape == (300,)
+            assert result[7] == approx(0, abs=1e-9)
+            for i in (0, 42, 299):
+                expected = distance(points[7], points[i])
+                assert result[i] == approx(expected, abs=1e-9)
+
+    def test_pairwise(self):
+        for metric in metrics:
+            result = pairwise(self.rgbs, metric=metric)
+            assert result.shape == (300, 300)
+            for i in (0, 150, 299):
+                row = distances(self.rgbs[i], self.rgbs, metric)
+                assert result[i] == approx(row, abs=1e-9)
+
+        result = pairwise(self.rgbs[:10], self.rgbs, metric='cie76')
+        assert result.shape == (10, 300)
+        assert result == approx(pairwise(self.rgbs, metric='cie76')[:10])
+
+    def test_blocks(self):
+        expected = pairwise(self.rgbs)
+        blocks = list(iter_pairwise(self.rgbs, block_size=64))
+        assert [start for start, _ in blocks] == [0, 64, 128, 192, 256]
+        assert max(len(block) for _, block in blocks) == 64
+
+        out = np.zeros((300, 300))
+        assert pairwise(self.rgbs, block_size=7, out=out) is out
+        assert out == approx(expected)
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            distances([0, 0, 0], self.rgbs, 'cie2000')
+        with pytest.raises(ValueError):
+            pairwise(self.rgbs, metric='cie2000')
+
+    def test_color(self):
+        red, blue = Color(rgb=[255, 0, 0]), Color(hex='#0000ff')
+        assert red.distance(red) == 0
+        assert red.distance(blue, 'rgb') == approx(360.62445841)
+        assert red.distance(blue) == approx(blue.distance(red))
+        assert isinstance(red.distance(blue), float)
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from acrylic import Color, ColorGenerator, RANDOM
+from acrylic.Schemes import COMPLEMENTARY, SHADES
+
+
+class Test_ColorGenerator():
+
+    spec = dict(hsl=[RANDOM, (20, 70), 62])
+
+    def test_reproducible(self):
+        a, b = ColorGenerator(seed=7), ColorGenerator(seed=7)
+        assert a.colors(20, **self.spec) == b.colors(20, **self.spec)
+        assert a.color(hex=RANDOM) == b.color(hex=RANDOM)
+        assert a.color(name=RANDOM) == b.color(name=RANDOM)
+
+        assert ColorGenerator(1).colors(5, **self.spec) != \
+            ColorGenerator(2).colors(5, **self.spec)
+
+    def test_global_state(self):
+        # generators do not use or change the state of the random module
+        random.seed(0)
+        expected = random.random()
+        random.seed(0)
+        ColorGenerator(seed=7).colors(10, rgb=RANDOM)
+        assert random.random() == expected
+
+    def test_same_as_random(self):
+        colors = ColorGenerator(seed=3).colors(10, **self.spec)
+        rng = random.Random(3)
+        assert colors == [Color(rng=rng, **self.spec) for _ in range(10)]
+
+    def test_scheme(self):
+        color = Color(rgb=[83, 237, 229])
+        for name, fuzzy in ((COMPLEMENTARY, RANDOM), (SHADES, 0)):
+            a = ColorGenerator(seed=5).scheme(color, name, fuzzy=fuzzy)
+            b = ColorGenerator(seed=5).scheme(color, name, fuzzy=fuzzy)
+            assert a == b
+
+    def test_spawn(self):
+        children = ColorGenerator(seed=11).spawn(3)
+        again = ColorGenerator(seed=11).spawn(3)
+        assert len({x.seed for x in children}) == 3
+        for a, b in zip(children, again):
+            assert a.colors(5, rgb=RANDOM) == b.colors(5, rgb=RANDOM)
+        assert repr(children[0]) == f'ColorGenerator(seed={again[0].seed})'
+
+    def test_sample(self):
+        np = pytest.importorskip('numpy')
+        from acrylic import ColorArray
+
+        a, b = ColorGenerator(seed=7), ColorGenerator(seed=7)
+        first = a.sample(1000, **self.spec)
+        assert first.shape == (1000, 3)
+        assert first.tolist() == b.sample(1000, **self.spec).tolist()
+
+        # batches use a separate random state from single colors
+        assert a.color(**self.spec) == ColorGenerator(7).color(**self.spec)
+
+        lab = a.sample(100, lab=RANDOM)
+        assert len(np.unique(lab[:, 1])) > 50
+        assert len(np.unique(lab[:, 2])) > 50
+
+        colors = a.array(10, rgb=[RANDOM, 0, 0])
+        assert isinstance(colors, ColorArray) and len(colors) == 10
+        assert colors.rgb[:, 1:].max() == 0
+
+        with pytest.raises(TypeError):
+            a.sample(10, rgb=RANDOM, hsl=RANDOM)
+        with pytest.raises(TypeError):
+            a.sample(10, hsx=RANDOM)
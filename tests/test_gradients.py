@@ -0,0 +1,156 @@
+import pytest
+
+from acrylic import Color, PreciseColor
+from acrylic.Defaults import SCHEMAS
+from acrylic.Gradients import iter_gradient, gradient
+
+
+class Test_iter_gradient():
+
+    stops = [Color(name='red'), Color(name='blue')]
+    colorspaces = [
+        x for x in SCHEMAS if SCHEMAS[x].validation_type == 'values'
+    ]
+
+    def hexes(self, *args, **kwargs):
+        return [x.hex for x in iter_gradient(*args, **kwargs)]
+
+    def test_endpoints(self):
+        stops = [
+            Color(hex='#ff6b6b'), Color(hex='#4ecdc4'), Color(hex='#1a535c')
+        ]
+        for colorspace in self.colorspaces:
+            for method in ['linear', 'spline']:
+                colors = list(iter_gradient(stops, 9, colorspace, method))
+                assert len(colors) == 9
+                assert all(type(x) is Color for x in colors)
+                for i, stop in [(0, 0), (4, 1), (8, 2)]:
+                    value = getattr(stops[stop], colorspace)
+                    assert getattr(colors[i], colorspace) == value
+
+    def test_oklab(self):
+        assert self.hexes(self.stops, 5) == [
+            '#FF0000', '#C6496D', '#8C53A2', '#5147D2', '#0000FF'
+        ]
+        assert self.hexes(self.stops, 1) == ['#FF0000']
+
+    def test_hues(self):
+        assert self.hexes(self.stops, 5, 'hsl') == [
+            '#FF0000', '#FF0080', '#FF00FF', '#7F00FF', '#0000FF'
+        ]
+        longer = ['#FF0000', '#FFFF00', '#00FF00', '#00FFFF', '#0000FF']
+        assert self.hexes(self.stops, 5, 'hsl', hue='longer') == longer
+        assert self.hexes(self.stops, 5, 'hsv', hue='increasing') == longer
+        assert self.hexes(self.stops, 5, 'hsl', hue='decreasing') == (
+            self.hexes(self.stops, 5, 'hsl')
+        )
+        assert self.hexes(self.stops, 3, 'hsl', hue='raw')[1] == '#00FF00'
+
+        # shorter way across 0 degrees
+        stops = [Color(hsl=[350, 100, 50]), Color(hsl=[10, 100, 50])]
+        hues = [x.hsl.h for x in iter_gradient(stops, 3, 'hsl')]
+        assert hues == [350.0, 0.0, 10.0]
+
+    def test_achromatic_stops(self):
+        stops = [Color(name='white'), Color(name='red')]
+        assert self.hexes(stops, 3, 'hsl') == ['#FFFFFF', '#DF9F9F', '#FF0000']
+        stops = [Color(name='blue'), Color(name='gray'), Color(name='red')]
+        hues = [x.hsl.h for x in iter_gradient(stops, 5, 'hsl')]
+        assert hues[:3] == [240.0] * 3
+
+    def test_spline(self):
+        stops = [Color(rgb=[0, 0, 0]), Color(rgb=[200, 0, 0]),
+                 Color(rgb=[100, 0, 0])]
+        linear = [x.rgb.r for x in iter_gradient(stops, 9, 'rgb')]
+        spline = [x.rgb.r for x in iter_gradient(stops, 9, 'rgb', 'spline')]
+        assert linear == [0, 50, 100, 150, 200, 175, 150, 125, 100]
+        assert spline[::4] == [0, 200, 100]
+        # smooth around the middle stop instead of a sharp corner
+        assert spline[3] > 150 and spline[5] > 175
+
+        # values outside the range of the colorspace are clamped
+        stops = [Color(rgb=[0] * 3), Color(rgb=[255] * 3), Color(rgb=[0] * 3),
+                 Color(rgb=[255] * 3)]
+        for x in iter_gradient(stops, 50, 'rgb', 'spline'):
+            assert 0 <= min(x.rgb) and max(x.rgb) <= 255
+
+    def test_positions(self):
+        stops = [Color(name='red'), Color(name='lime'), Color(name='blue')]
+        colors = list(iter_gradient(stops, 11, 'rgb', positions=[0.2, 0.4, 1]))
+        assert colors[0] == colors[2] == stops[0]
+        assert colors[4] == stops[1]
+        assert colors[7].rgb.r == 0 and sum(colors[7].rgb) == 255
+        assert colors[10] == stops[2]
+
+    def test_alpha(self):
+        stops = [Color(rgba=[255, 0, 0, 0.0]), Color(hex='#0000FF')]
+        alphas = [x.alpha for x in iter_gradient(stops, 5)]
+        assert alphas == [0.0, 0.25, 0.5, 0.75, 1.0]
+
+    def test_precise(self):
+        stops = [PreciseColor(name='red'), PreciseColor(name='blue')]
+        colors = list(iter_gradient(stops, 3, 'lab'))
+        assert all(type(x) is PreciseColor for x in colors)
+        assert colors[1].lab.l == pytest.approx(
+            (stops[0].lab.l + stops[1].lab.l) / 2
+        )
+        assert colors[1].lab.l != round(colors[1].lab.l, 2)
+
+    def test_lazy(self):
+        colors = iter_gradient(self.stops, 10 ** 12)
+        assert next(colors) == self.stops[0]
+
+    def test_invalid(self):
+        for kwargs in [
+            dict(colorspace='hex'),
+            dict(colorspace='hsx'),
+            dict(method='cubic'),
+            dict(hue='shortest'),
+            dict(positions=[0, 0]),
+            dict(positions=[0.0, 0.5, 1.0]),
+            dict(steps=0),
+        ]:
+            kwargs = {'stops': self.stops, 'steps': 5, **kwargs}
+            with pytest.raises(ValueError):
+                next(iter_gradient(**kwargs))
+        with pytest.raises(ValueError):
+            next(iter_gradient(self.stops[:1], 5))
+        with pytest.raises(TypeError):
+            next(iter_gradient(self.stops, None))
+
+
+class Test_gradient():
+
+    stops = [Color(hex='#ff6b6b'), Color(hex='#4ecdc480'), Color(name='navy'),
+             Color(hsl=[120, 0, 40])]
+
+    def test_same_as_iter(self):
+        np = pytest.importorskip('numpy')
+
+        for colorspace in Test_iter_gradient.colorspaces:
+            for method in ['linear', 'spline']:
+                for positions in [None, [0, 0.1, 0.7, 0.8]]:
+                    args = self.stops, 301, colorspace, method
+                    colors = list(iter_gradient(*args, positions=positions))
+                    values, alphas = gradient(
+                        *args, positions=positions, alpha=True
+                    )
+                    assert values.tolist() == [
+                        list(getattr(x, colorspace)) for x in colors
+                    ]
+                    assert alphas.tolist() == [x.alpha for x in colors]
+
+                    hexes = gradient(*args, positions=positions, dst='hex')
+                    assert hexes.tolist() == [x.hex for x in colors]
+
+        rgb = gradient(self.stops, 5, 'rgb')
+        assert rgb.dtype == np.uint8 and rgb.shape == (5, 3)
+        assert gradient(self.stops, 1).shape == (1, 3)
+
+    def test_invalid(self):
+        pytest.importorskip('numpy')
+
+        with pytest.raises(ValueError):
+            gradient(self.stops, 5, dst='hsx')
+        with pytest.raises(ValueError):
+            gradient(self.stops, 5, 'name')
@@ -0,0 +1,124 @@
+import pytest
+
+from acrylic import Cache, Color, PreciseColor, Instrument, Schemes
+from acrylic.Validators import validators
+from acrylic.Converters import rgb_to, rgb_from, direct
+
+
+@pytest.fixture
+def instrument():
+    Instrument.enable()
+    yield Instrument
+    Instrument.disable()
+
+
+class Test_Instrument():
+
+    def test_disabled(self):
+        getter = vars(Color)['hsl']
+        function, scheme = rgb_to['hsl'], Color.scheme
+
+        Instrument.enable()
+        assert Instrument.enabled()
+        assert rgb_to['hsl'] is not function
+        assert vars(Color)['hsl'] is not getter
+
+        Instrument.disable()
+        assert not Instrument.enabled()
+        assert Instrument.info() == {}
+        assert rgb_to['hsl'] is function
+        assert vars(Color)['hsl'] is getter
+        assert Color.scheme is scheme
+
+    def test_functions(self, instrument):
+        color = Color(hex='#80ffd4')
+        _ = color.hsl, color.hsv
+
+        info = instrument.info()
+        assert info['validate.string'].calls == 1
+        assert info['validate.values'].calls == 0
+        assert info['rgb_from.hex'].calls == 1
+        assert info['rgb_to.hsl'].calls == 1
+        assert info['direct.hsl_to_hsv'].calls == 0
+        assert info['rgb_to.hsv'].calls == 1
+        assert info['rgb_to.hsl'].seconds > 0
+
+        _ = Color(hsl=[160, 100, 75]).hsv
+        assert instrument.info()['direct.hsl_to_hsv'].calls == 1
+
+    def test_properties(self, instrument):
+        color = Color(hex='#80ffd4')
+        for _ in range(3):
+            _ = color.hsl
+
+        info = instrument.info()
+        assert info['property.hsl'] == (3, 1, info['property.hsl'].seconds)
+        assert info['property.hsl'].seconds > 0
+        # rgb is converted once on the way to hsl
+        assert info['property.rgb'].conversions == 1
+
+        _ = PreciseColor(hsl=[160, 100, 75]).hsv
+        info = instrument.info()
+        assert info['property.hsv'].conversions == 1
+        assert info['precise_direct.hsl_to_hsv'].calls == 1
+
+    def test_scheme(self, instrument):
+        Color(rgb=[83, 237, 229]).scheme(Schemes.TRIADIC)
+        assert instrument.info()['scheme'].calls == 1
+
+    def test_clear(self, instrument):
+        _ = Color(rgb=[83, 237, 229]).hsl
+        instrument.clear()
+        assert instrument.enabled()
+        assert all(x.calls == 0 for x in instrument.info().values())
+
+    def test_callbacks(self, instrument):
+        calls = []
+
+        def callback(name, seconds):
+            calls.append(name)
+
+        instrument.subscribe(callback)
+        color = Color(rgb=[83, 237, 229])
+        _ = color.hsl, color.hsl
+        instrument.unsubscribe(callback)
+        _ = Color(rgb=[83, 237, 229]).hsl
+
+        assert calls == ['validate.values', 'rgb_to.hsl', 'property.hsl']
+
+    def test_cache(self):
+        function, validator = direct[('hsl', 'hsv')], validators['string']
+
+        Cache.enable()
+        Instrument.enable()
+        _ = Color(hex='#80ffd4').hsl
+        _ = Color(hex='#80ffd4').hsl
+        assert Instrument.info()['rgb_to.hsl'].calls == 2
+        assert Cache.info()['rgb_to.hsl'].hits == 1
+        Instrument.disable()
+        Cache.disable()
+
+        assert direct[('hsl', 'hsv')] is function
+        assert validators['string'] is validator
+
+    def test_cache_any_order(self):
+        tables = [rgb_to, rgb_from, direct, validators]
+        originals = [dict(x) for x in tables]
+
+        for first, second in [(Cache, Instrument), (Instrument, Cache)]:
+            for disabled in [(first, second), (second, first)]:
+                first.enable()
+                second.enable()
+                assert Color(hex='#80ffd4').hsl == (159.69, 100.0, 75.1)
+
+                disabled[0].disable()
+                # the other one still works on its own
+                _ = Color(hex='#80ffd5').hsl
+                if disabled[1] is Cache:
+                    assert Cache.info()['rgb_to.hsl'].misses == 2
+                else:
+                    assert Instrument.info()['rgb_to.hsl'].calls == 2
+
+                disabled[1].disable()
+                for table, original in zip(tables, originals):
+                    assert all(table[x] is original[x] for x in original)
@@ -0,0 +1,57 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from acrylic.Arrays import convert  # noqa: E402
+from acrylic.Lut import Lut, build, read_header, main, SIZE  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def directory(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('lut')
+    build(str(directory), ['hsl', 'name'])
+    return str(directory)
+
+
+class Test_Lut():
+
+    rgbs = np.random.default_rng(0).integers(0, 256, (5000, 3))
+
+    def test_files(self, directory):
+        lut = Lut(directory)
+        assert set(lut.tables) == {'hsl', 'name'}
+
+        values, header = lut.tables['hsl']
+        assert values.shape == (SIZE, 3)
+        assert header['offset'] % 64 == 0
+        assert read_header(f'{directory}/name.lut')['table'] == 'name'
+
+    def test_convert(self, directory):
+        lut = Lut(directory)
+        for table in ['hsl', 'name']:
+            result = lut.convert(self.rgbs, table)
+            assert result.tolist() == convert(self.rgbs, 'rgb', table).tolist()
+
+        with pytest.raises(ValueError):
+            lut.convert(self.rgbs, 'hsv')
+
+        # rgb values are validated before they are used as indices
+        for rgb in [[[-1, 0, 0]], [[0, 256, 0]], [[0, 0, 0, 0]], [0, 0, 0]]:
+            with pytest.raises(ValueError):
+                lut.convert(rgb, 'hsl')
+        assert lut.convert([[12.7, 0, 255]], 'hsl').tolist() == (
+            convert([[12, 0, 255]], 'rgb', 'hsl').tolist()
+        )
+
+    def test_verify(self, directory):
+        assert Lut(directory).verify(sample=2000) == {'hsl': 0, 'name': 0}
+        assert main(['verify', directory, '--sample', '100']) == 0
+
+    def test_invalid(self, tmp_path):
+        path = tmp_path / 'hsl.lut'
+        path.write_bytes(b'not a table')
+        with pytest.raises(ValueError):
+            Lut(str(tmp_path))
+
+        with pytest.raises(ValueError):
+            build(str(tmp_path), ['abc'])
@@ -0,0 +1,80 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from acrylic import Color, ColorArray  # noqa: E402
+from acrylic.Manipulations import (  # noqa: E402
+    lighten_many, darken_many, saturate_many, desaturate_many,
+    rotate_hue_many, mix_many, blend_many, blend_modes
+)
+
+
+class Test_many():
+
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(0, 256, (2000, 3))
+    others = rng.integers(0, 256, (2000, 3))
+
+    def check(self, result, expected):
+        assert result.dtype == np.uint8
+        assert result.tolist() == [list(x.rgb) for x in expected]
+
+    def test_same_as_color(self):
+        colors = [Color(rgb=x) for x in self.rgb.tolist()]
+        for function, method, amount in [
+            (lighten_many, 'lighten', 7.3),
+            (darken_many, 'darken', 33.33),
+            (saturate_many, 'saturate', 12.5),
+            (desaturate_many, 'desaturate', 50),
+            (rotate_hue_many, 'rotate_hue', -123.45),
+            (rotate_hue_many, 'rotate_hue', 400),
+        ]:
+            self.check(
+                function(self.rgb, amount),
+                [getattr(x, method)(amount) for x in colors]
+            )
+
+    def test_mix_and_blend(self):
+        colors = [Color(rgb=x) for x in self.rgb.tolist()]
+        others = [Color(rgb=x) for x in self.others.tolist()]
+        for weight in [0.5, 0.123]:
+            self.check(
+                mix_many(self.rgb, self.others, weight),
+                [x.mix(y, weight) for x, y in zip(colors, others)]
+            )
+        for mode in blend_modes:
+            self.check(
+                blend_many(self.rgb, self.others, mode),
+                [x.blend(y, mode) for x, y in zip(colors, others)]
+            )
+
+    def test_shapes(self):
+        pixels = self.rgb[:1200].reshape(30, 40, 3).astype(np.uint8)
+        assert lighten_many(pixels, 10).shape == (30, 40, 3)
+        assert lighten_many(pixels, 10)[1, 2].tolist() == list(
+            Color(rgb=pixels[1, 2].tolist()).lighten(10).rgb
+        )
+        assert blend_many([255, 0, 0], pixels).shape == (30, 40, 3)
+        assert mix_many(pixels, [0, 0, 0]).shape == (30, 40, 3)
+
+        colors = ColorArray(rgb=self.rgb[:3])
+        assert darken_many(colors, [0, 10, 100]).tolist() == [
+            list(Color(rgb=x).darken(y).rgb)
+            for x, y in zip(self.rgb[:3].tolist(), [0, 10, 100])
+        ]
+        mixed = mix_many([255, 0, 0], [[0, 0, 255]] * 3, [0, 0.5, 1])
+        assert mixed.tolist() == [[0, 0, 255], [128, 0, 128], [255, 0, 0]]
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            lighten_many(self.rgb, 101)
+        with pytest.raises(ValueError):
+            saturate_many(self.rgb, [10, -1])
+        with pytest.raises(ValueError):
+            mix_many(self.rgb, self.others, 2)
+        with pytest.raises(ValueError):
+            blend_many(self.rgb, self.others, 'burn')
+        with pytest.raises(ValueError):
+            lighten_many([[1, 2, 3, 4]], 10)
+        with pytest.raises(ValueError):
+            lighten_many([[1, 2, 300]], 10)
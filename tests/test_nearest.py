@@ -0,0 +1,37 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from acrylic import Color  # noqa: E402
+from acrylic.Distance import metrics  # noqa: E402
+from acrylic.color_names import color_names_reverse  # noqa: E402
+from acrylic.Nearest import nearest_name, nearest_names, get_index  # noqa
+
+
+class Test_nearest():
+
+    def test_exact(self):
+        rgbs = list(color_names_reverse.keys())
+        for metric in metrics:
+            names = nearest_names(rgbs, metric)
+            assert names.tolist() == list(color_names_reverse.values())
+
+    def test_nearest(self):
+        assert nearest_name((120, 250, 210)) == 'aquamarine'
+        assert nearest_name((250, 5, 10), 'cie76') == 'red'
+        assert nearest_name((1, 2, 1), 'ciede2000') == 'black'
+
+        assert Color(rgb=[120, 250, 210]).name == '-'
+        assert Color(rgb=[120, 250, 210]).nearest_name() == 'aquamarine'
+
+    def test_matches_linear_scan(self):
+        rgbs = np.random.default_rng(0).integers(0, 256, (3000, 3))
+        for metric, (space, distance) in metrics.items():
+            index = get_index(metric)
+            points = space(rgbs)[:, None, :]
+            expected = distance(points, index.points).argmin(axis=1)
+            assert (index.query(rgbs) == expected).all()
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            nearest_names([[0, 0, 0]], 'abc')
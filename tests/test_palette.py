@@ -0,0 +1,102 @@
+import pytest
+from pytest import approx
+
+np = pytest.importorskip('numpy')
+
+from acrylic import Color  # noqa: E402
+from acrylic.Palette import (  # noqa: E402
+    Swatch, extract, histogram, pixels, quantizers
+)
+
+
+def image(seed=0, shape=(200, 300)):
+    # 4 colors covering 40%, 30%, 20% and 10% of the image, with noise
+    colors = np.array([
+        [20, 30, 60], [240, 230, 215], [200, 150, 90], [90, 160, 70]
+    ])
+    rng = np.random.default_rng(seed)
+    labels = rng.choice(4, shape, p=[0.4, 0.3, 0.2, 0.1])
+    noise = rng.normal(0, 6, shape + (3,))
+    return np.clip(colors[labels] + noise, 0, 255).astype(np.uint8), colors
+
+
+class Test_pixels():
+
+    def test_inputs(self):
+        rgb = np.arange(24, dtype=np.uint8).reshape(2, 4, 3)
+        expected = rgb.reshape(-1, 3).tolist()
+        assert pixels(rgb).tolist() == expected
+        assert pixels(rgb.tobytes()).tolist() == expected
+        assert pixels(bytearray(rgb.tobytes())).tolist() == expected
+        assert pixels(rgb.astype(np.int64)).tolist() == expected
+
+        rgba = np.concatenate([rgb, np.zeros((2, 4, 1), np.uint8)], axis=2)
+        assert pixels(rgba).tolist() == expected
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            pixels(b'\0' * 4)
+        with pytest.raises(ValueError):
+            pixels(np.zeros((4, 2)))
+        with pytest.raises(ValueError):
+            pixels(np.full((4, 3), 256))
+
+    def test_histogram(self):
+        rgb = np.array([[0, 0, 0], [6, 2, 0], [255, 255, 255]], np.uint8)
+        points, weights = histogram(rgb)
+        assert points.tolist() == [[3, 1, 0], [255, 255, 255]]
+        assert weights.tolist() == [2, 1]
+
+
+class Test_extract():
+
+    def test_methods(self):
+        pixels, colors = image()
+        for method in quantizers:
+            palette = extract(pixels, count=4, method=method, seed=0)
+            assert len(palette) == 4
+            assert all(isinstance(x, Swatch) for x in palette)
+            assert all(isinstance(x.color, Color) for x in palette)
+            assert sum(x.weight for x in palette) == approx(1)
+
+        # median cut splits boxes at the median, so only octree and kmeans
+        # are expected to find the clusters
+        for method in ('octree', 'kmeans'):
+            palette = extract(pixels, count=4, method=method, seed=0)
+            assert [x.weight for x in palette] == approx(
+                [0.4, 0.3, 0.2, 0.1], abs=0.02
+            )
+            for swatch, expected in zip(palette, colors):
+                assert swatch.color.rgb == approx(expected, abs=3)
+
+    def test_count(self):
+        pixels, _ = image()
+        for method in quantizers:
+            for count in (1, 2, 7, 16):
+                palette = extract(pixels, count=count, method=method)
+                # kmeans drops centers that end up without any pixels
+                assert len(palette) <= count
+                if method != 'kmeans':
+                    assert len(palette) == count
+
+        few = np.array([[255, 0, 0]] * 3 + [[0, 0, 255]], np.uint8)
+        palette = extract(few, count=8)
+        assert [x.color.rgb for x in palette] == [(255, 0, 0), (0, 0, 255)]
+        assert [x.weight for x in palette] == [0.75, 0.25]
+
+    def test_sample(self):
+        pixels, colors = image()
+        palette = extract(pixels, count=4, method='kmeans', sample=5000)
+        for swatch, expected in zip(palette, colors):
+            assert swatch.color.rgb == approx(expected, abs=3)
+
+        first = extract(pixels, 4, 'kmeans', sample=1000, seed=1)
+        assert extract(pixels, 4, 'kmeans', sample=1000, seed=1) == first
+
+    def test_errors(self):
+        pixels, _ = image()
+        assert extract(np.zeros((0, 3), np.uint8)) == []
+        with pytest.raises(ValueError):
+            extract(pixels, method='kmedians')
+        with pytest.raises(ValueError):
+            extract(pixels, count=0)
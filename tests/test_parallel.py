@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+# shared memory is only available from Python 3.8
+pytest.importorskip('multiprocessing.shared_memory')
+
+from acrylic import Color, RANDOM  # noqa: E402
+from acrylic import Parallel  # noqa: E402
+from acrylic.Arrays import convert  # noqa: E402
+from acrylic.Parallel import convert_many, resolve  # noqa: E402
+
+
+@pytest.fixture
+def small(monkeypatch):
+    # use the process pool even for small inputs
+    monkeypatch.setattr(Parallel, 'MIN_SIZE', 0)
+
+
+class Test_convert_many():
+
+    rgbs = np.random.default_rng(0).integers(0, 256, (1000, 3))
+
+    def test_identical(self, small):
+        for dst in ('hsl', 'hex', 'name', 'lab'):
+            expected = convert(self.rgbs, 'rgb', dst)
+            result = convert_many(self.rgbs, 'rgb', dst, workers=2)
+            assert result.dtype == expected.dtype
+            assert np.array_equal(result, expected)
+
+        hexes = convert(self.rgbs, 'rgb', 'hex')
+        result = convert_many(hexes, 'hex', 'rgb', workers=2)
+        assert np.array_equal(result, self.rgbs)
+
+    def test_random(self, small):
+        values = [
+            [RANDOM, 50, (10, 20)] if i % 3 else [i % 360, 20, 30]
+            for i in range(300)
+        ]
+        random.seed(0)
+        expected = [Color(hsl=x).rgb for x in values]
+        random.seed(0)
+        result = convert_many(values, 'hsl', 'rgb', workers=2)
+        assert [tuple(x) for x in result.tolist()] == expected
+
+        random.seed(0)
+        expected = [Color(hex=x).rgb for x in ['#FF0000', RANDOM] * 10]
+        random.seed(0)
+        result = convert_many(['#FF0000', RANDOM] * 10, 'hex', 'rgb', 2)
+        assert [tuple(x) for x in result.tolist()] == expected
+
+    def test_resolve(self):
+        values = np.array([[50, -1, -1]])
+        assert resolve(values, 'lab') is values
+        assert resolve([[50, -1, -1]], 'lab').tolist() == [[50, -1, -1]]
+
+        result = resolve(np.array([[RANDOM, 0, 0]]), 'rgb')
+        assert 0 <= result[0, 0] <= 255
+
+    def test_serial(self):
+        # small inputs and a single worker skip the process pool
+        result = convert_many(self.rgbs, 'rgb', 'hsl', workers=1)
+        assert np.array_equal(result, convert(self.rgbs, 'rgb', 'hsl'))
+        result = convert_many(self.rgbs, 'rgb', 'hsl')
+        assert np.array_equal(result, convert(self.rgbs, 'rgb', 'hsl'))
+
+    def test_errors(self, small):
+        with pytest.raises(ValueError):
+            convert_many(self.rgbs, 'rgb', 'hsx', workers=2)
+        with pytest.raises(ValueError):
+            convert_many(self.rgbs * 2, 'rgb', 'hsl', workers=2)
@@ -0,0 +1,73 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from acrylic import Color, ColorArray, RANDOM, Schemes  # noqa: E402
+from acrylic.Schemes import DELTAS, schemes_for  # noqa: E402
+
+
+class Test_schemes_for():
+
+    rgbs = np.random.default_rng(0).integers(0, 256, (300, 3))
+
+    def test_same_as_scheme(self):
+        for name in DELTAS:
+            for in_rgb in (False, True):
+                result = schemes_for(self.rgbs, name, in_rgb)
+                expected = [
+                    [x.rgb for x in Color(rgb=rgb).scheme(name, in_rgb)]
+                    for rgb in self.rgbs.tolist()
+                ]
+                assert result.tolist() == np.array(expected).tolist()
+
+    def test_inputs(self):
+        colors = ColorArray(rgb=self.rgbs)
+        expected = schemes_for(self.rgbs, Schemes.TRIADIC)
+        assert np.array_equal(schemes_for(colors, Schemes.TRIADIC), expected)
+        assert schemes_for(self.rgbs[:0], Schemes.TRIADIC).shape == (0, 2, 3)
+
+    def test_variants(self):
+        for name in (Schemes.MONOCHROMATIC, Schemes.SHADES):
+            result = schemes_for(self.rgbs, name, rng=1)
+            assert result.shape == (300, 4, 3)
+            assert np.array_equal(result, schemes_for(self.rgbs, name, rng=1))
+
+            # value is picked between 20 and 100
+            value = result.max(axis=2) / 255 * 100
+            assert value.min() >= 19.5
+
+    def test_variants_same_as_scheme(self):
+        # scalar schemes get the same random values as the vectorized ones
+        class Replay():
+            def __init__(self, values):
+                self.values = iter(values)
+
+            def uniform(self, a, b):
+                return next(self.values)
+
+        for name in (Schemes.MONOCHROMATIC, Schemes.SHADES):
+            result = schemes_for(self.rgbs, name, rng=3)
+            values = np.random.default_rng(3).uniform(20, 100, (300, 4))
+            expected = [
+                [x.rgb for x in Color(rgb=rgb).scheme(name, rng=Replay(v))]
+                for rgb, v in zip(self.rgbs.tolist(), values.tolist())
+            ]
+            assert result.tolist() == np.array(expected).tolist()
+
+    def test_fuzzy(self):
+        exact = schemes_for(self.rgbs, Schemes.COMPLEMENTARY, True)
+        fuzzy = schemes_for(self.rgbs, Schemes.COMPLEMENTARY, True, 20, 2)
+        assert not np.array_equal(exact, fuzzy)
+        assert np.array_equal(
+            fuzzy, schemes_for(self.rgbs, Schemes.COMPLEMENTARY, True, 20, 2)
+        )
+        result = schemes_for(self.rgbs, Schemes.TRIADIC, fuzzy=RANDOM)
+        assert result.shape == (300, 2, 3)
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            schemes_for(self.rgbs, 42)
+        with pytest.raises(ValueError):
+            schemes_for(self.rgbs, Schemes.TRIADIC, fuzzy=400)
+        with pytest.raises(ValueError):
+            schemes_for([[0, 0, 256]], Schemes.TRIADIC)
@@ -0,0 +1,125 @@
+import io
+import json
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from acrylic import Color  # noqa: E402
+from acrylic.__main__ import main  # noqa: E402
+from acrylic.Stream import (  # noqa: E402
+    chunked, convert_chunk, convert_iter, convert_file
+)
+
+
+class Test_convert():
+
+    hexes = ['#3EF4FF', '#FF0000', '#191819', '#7FFFD4', '#80ffd4']
+
+    def test_chunked(self):
+        chunks = list(chunked(range(7), 3))
+        assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+        assert list(chunked([], 3)) == []
+
+    def test_convert_iter(self):
+        for dst in ('hsl', 'name', 'rgb', 'lab'):
+            expected = [getattr(Color(hex=x), dst) for x in self.hexes]
+            expected = [list(x) if dst != 'name' else x for x in expected]
+            for chunk_size in (1, 2, 100):
+                result = convert_iter(self.hexes, 'hex', dst, chunk_size)
+                assert list(result) == expected
+
+        values = (Color(hex=x).hsv for x in self.hexes)
+        result = list(convert_iter(values, 'hsv', 'hex', 2))
+        assert result == [Color(hex=x).hex for x in self.hexes]
+
+    def test_errors(self):
+        values = ['#FF0000', 'nope', '#00FF00']
+        with pytest.raises(ValueError):
+            convert_chunk(values, 'hex', ['rgb'])
+
+        result = convert_chunk(values, 'hex', ['rgb', 'name'], 'skip')
+        assert result == [
+            [[255, 0, 0], None, [0, 255, 0]], ['red', None, 'lime']
+        ]
+
+        # chunks without any valid value
+        invalid = [[300, 0, 0], [-1, 0, 0]]
+        assert convert_chunk(invalid, 'rgb', ['hex'], 'skip') == [
+            [None, None]
+        ]
+        result = list(convert_iter(['nope', '#FF0000'], 'hex', 'rgb', 1,
+                                   'skip'))
+        assert result == [None, [255, 0, 0]]
+
+        with pytest.raises(ValueError):
+            list(convert_iter(values, 'hex', 'hsx'))
+        with pytest.raises(ValueError):
+            list(convert_iter(values, 'hex', 'rgb', errors='ignore'))
+        with pytest.raises(ValueError):
+            list(convert_iter(values, 'hex', 'rgb', chunk_size=0))
+
+
+class Test_convert_file():
+
+    def test_csv(self):
+        infile = io.StringIO('id,hex\n1,#80ffd4\n2,#ff0000\n')
+        outfile = io.StringIO()
+        count = convert_file(infile, outfile, 'hex', ['hsl', 'name'])
+        assert count == 2
+        assert outfile.getvalue().splitlines() == [
+            'id,hex,hsl,name',
+            '1,#80ffd4,"159.69,100.0,75.1",-',
+            '2,#ff0000,"0.0,100.0,50.0",red',
+        ]
+
+        # components are read back the same way they are written
+        infile = io.StringIO(outfile.getvalue())
+        outfile = io.StringIO()
+        convert_file(infile, outfile, 'hsl', ['rgb'], chunk_size=1)
+        assert outfile.getvalue().splitlines()[1:] == [
+            '1,#80ffd4,"159.69,100.0,75.1",-,"128,255,212"',
+            '2,#ff0000,"0.0,100.0,50.0",red,"255,0,0"',
+        ]
+
+    def test_jsonl(self):
+        rows = [{'color': [83, 237, 229]}, {'color': '255 0 0'}]
+        infile = io.StringIO(''.join(json.dumps(x) + '\n' for x in rows))
+        outfile = io.StringIO()
+        convert_file(
+            infile, outfile, 'rgb', ['hex'], field='color',
+            file_format='jsonl',
+        )
+        result = [json.loads(x) for x in outfile.getvalue().splitlines()]
+        assert [x['hex'] for x in result] == ['#53EDE5', '#FF0000']
+
+    def test_errors(self):
+        with pytest.raises(KeyError):
+            convert_file(io.StringIO('rgb\n'), io.StringIO(), 'hex')
+        with pytest.raises(ValueError):
+            convert_file(
+                io.StringIO(''), io.StringIO(), 'hex', file_format='xml'
+            )
+
+    def test_cli(self, tmp_path, capsys):
+        infile, outfile = tmp_path / 'in.csv', tmp_path / 'out.csv'
+        infile.write_text('hex\n#7fffd4\nnope\n')
+
+        args = ['convert', '--to', 'rgb,name', str(infile), str(outfile)]
+        assert main(args) == 1
+        assert 'nope' in capsys.readouterr().err
+
+        assert main(args + ['--errors', 'skip']) == 0
+        assert outfile.read_text().splitlines() == [
+            'hex,rgb,name', '#7fffd4,"127,255,212",aquamarine', 'nope,,'
+        ]
+
+        # errors are reported before the output is opened and truncated
+        for args in [
+            ['convert', str(tmp_path / 'missing.csv'), str(outfile)],
+            ['convert', '--to', 'hsx', str(infile), str(outfile)],
+            ['convert', '--chunk-size', '0', str(infile), str(outfile)],
+        ]:
+            assert main(args) == 1
+            assert capsys.readouterr().err.startswith('error: ')
+            assert outfile.read_text().startswith('hex,rgb,name')
@@ -1,11 +1,14 @@
+import random
+
 import pytest
 from decimal import Decimal
 from collections.abc import Iterable
 
 from acrylic.Validators import (
-    in_range, check_datatype, check_iter, validate_values, validate_string
+    in_range, check_datatype, check_iter, validate_values, validate_string,
+    validate_alpha, hex_alpha
 )
-from acrylic.Defaults import SCHEMAS, Rgb
+from acrylic.Defaults import SCHEMAS, Rgb, Hsl
 from acrylic import RANDOM
 
 
@@ -152,6 +155,38 @@ class Test_validate_values():
             r, _, _ = validate_values([(RANDOM, RANDOM), 0, 0], 'rgb')
             assert r >= schema[0] and r <= schema[1]
 
+    def test_rng(self):
+        values = [(RANDOM, 100), RANDOM, 3]
+        expected = validate_values(values, 'rgb', random.Random(1))
+        assert validate_values(values, 'rgb', random.Random(1)) == expected
+
+        result = validate_values(RANDOM, 'hsl', random.Random(1))
+        assert isinstance(result, SCHEMAS['hsl'].output_type)
+
+    def test_negative_components(self):
+        # -1 is a valid value for a and b of lab, not RANDOM
+        assert validate_values((50, -1, -1), 'lab') == (50, -1, -1)
+        assert validate_values((50, -1.004, 0), 'lab') == (50, -1.0, 0)
+
+        for _ in range(100):
+            _, a, b = validate_values((50, (-10, 10), (RANDOM, 0)), 'lab')
+            assert a >= -10 and a <= 10
+            assert b >= -1 and b <= 0
+
+    def test_precise(self):
+        result = validate_values((12.6, 0, 255), 'rgb', precise=True)
+        assert result == (12.6, 0, 255)
+        assert all(isinstance(x, float) for x in result)
+        result = validate_values((12.345678, 0, 1), 'hsl', precise=True)
+        assert result == (12.345678, 0, 1)
+
+        result = validate_values((RANDOM, (1, 3), 0), 'rgb', precise=True)
+        assert all(isinstance(x, float) for x in result)
+        assert result[1] in (1, 2, 3)
+
+        with pytest.raises(ValueError):
+            validate_values((255.01, 0, 0), 'rgb', precise=True)
+
 
 class Test_validate_string():
 
@@ -168,6 +203,7 @@ class Test_validate_string():
     def test_hex_alpha(self):
         assert validate_string('#63b2a4ff', 'hex') == '#63B2A4'
         assert validate_string('63b2a4ff', 'hex') == '#63B2A4'
+        assert validate_string('#0x63b2a4ff', 'hex') == '#63B2A4'
 
     def test_hex_extra(self):
         assert validate_string(123456, 'hex') == '#123456'
@@ -183,6 +219,12 @@ class Test_validate_string():
         with pytest.raises(ValueError):
             validate_string('63B2C', 'hex')
 
+        with pytest.raises(ValueError):
+            validate_string('0x63b2a4ffAB', 'hex')
+
+        with pytest.raises(ValueError):
+            validate_string('#63b2a4\n', 'hex')
+
         with pytest.raises(ValueError):
             validate_string(FakeInt('#63B2A4'), 'hex')
 
@@ -194,6 +236,15 @@ class Test_validate_string():
         r = validate_string(RANDOM, 'hex')
         assert validate_string(r, 'hex') == r
 
+        # a new value is picked on every call
+        assert len({validate_string(RANDOM, 'hex') for _ in range(10)}) > 1
+
+        rng = random.Random(1)
+        expected = [validate_string(RANDOM, 'hex', rng) for _ in range(5)]
+        rng = random.Random(1)
+        assert [validate_string(RANDOM, 'hex', rng) for _ in range(5)] == \
+            expected
+
     # - - - - - - - - - - -
 
     def test_name_basic(self):
@@ -206,6 +257,7 @@ class Test_validate_string():
     def test_name_random(self):
         r = validate_string(RANDOM, 'name')
         assert validate_string(r, 'name') == r
+        assert len({validate_string(RANDOM, 'name') for _ in range(10)}) > 1
 
     def test_name_error(self):
         with pytest.raises(ValueError):
@@ -218,6 +270,53 @@ class Test_validate_string():
 #  - - -  Helper Classes  - - -
 
 
+class Test_validate_alpha():
+
+    def test_basic(self):
+        assert validate_alpha([12, 23, 34, 0.5], 'rgba') == (
+            Rgb(12, 23, 34), 0.5
+        )
+        assert validate_alpha(FakeIter([12, 23, 34, '1']), 'rgba') == (
+            Rgb(12, 23, 34), 1.0
+        )
+        assert validate_alpha([160, 100, 75, 0.12345], 'hsla') == (
+            Hsl(160.0, 100.0, 75.0), 0.123
+        )
+        assert validate_alpha(
+            [160, 100, 75, 0.12345], 'hsla', precise=True
+        )[1] == 0.12345
+
+    def test_random(self):
+        rng = random.Random(0)
+        value, alpha = validate_alpha(RANDOM, 'rgba', rng)
+        assert 0 <= alpha <= 1
+        assert validate_alpha(RANDOM, 'rgba', random.Random(0)) == (
+            value, alpha
+        )
+        _, alpha = validate_alpha([12, 23, 34, (0.2, 0.4)], 'rgba', rng)
+        assert 0.2 <= alpha <= 0.4
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            validate_alpha([12, 23, 34], 'rgba')
+        with pytest.raises(ValueError):
+            validate_alpha([12, 23, 34, 0.5, 1], 'rgba')
+        with pytest.raises(ValueError):
+            validate_alpha([12, 23, 34, 1.1], 'rgba')
+        with pytest.raises(ValueError):
+            validate_alpha([12, 23, 256, 0.5], 'rgba')
+        with pytest.raises(TypeError):
+            validate_alpha([12, 23, 34, None], 'rgba')
+
+    def test_hex_alpha(self):
+        assert hex_alpha('#63b2a480') == 0.502
+        assert hex_alpha('0x63b2a480', precise=True) == 128 / 255
+        assert hex_alpha('#63b2a4') == 1.0
+        assert hex_alpha('#6ba') == 1.0
+        assert hex_alpha('#63b2a48') == 1.0
+        assert hex_alpha(RANDOM) == 1.0
+
+
 class FakeStr():
 
     def __init__(self, x):